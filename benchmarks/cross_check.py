@@ -0,0 +1,166 @@
+"""
+Cross-check of the vectorized decoder against cantools on a fixed corpus
+
+The corpus in benchmarks/corpus is checked in: a synthetic DBC (see
+synthetic_dbc) with Intel and Motorola byte order (aligned or not),
+signed, 64-bit, IEEE float and multiplexed signals, and a candump log of frames for it (all
+zero bits, all one bits, then random payloads, with multiplexer values
+selecting each branch and an unknown one). The log is decoded both from
+the text log and from a frame store, and every value is compared with
+cantools' own decode of the frame. Any difference, or a feature missing
+from the corpus, makes the exit status 1.
+
+Usage:
+    python -m benchmarks.cross_check
+    python -m benchmarks.cross_check --regenerate   # write the corpus again first
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+from benchmarks.synthetic_dbc import SyntheticDBCSpec, write_synthetic_dbc
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+CORPUS_DBC = os.path.join(CORPUS_DIR, "cross_check.dbc")
+CORPUS_LOG = os.path.join(CORPUS_DIR, "cross_check.log")
+
+# The corpus DBC; this seed yields several signals of every feature below
+CORPUS_SPEC = SyntheticDBCSpec(64, 8, multiplexed=0.25, choices=0.2, comments=0.0,
+                               wide=0.3, floats=0.5, motorola=0.3, seed=6)
+
+# Frames per message in the corpus log
+FRAMES_PER_MESSAGE = 20
+
+# Signal features the corpus must cover, with a test for each
+FEATURES = {
+    "Intel byte order": lambda signal: signal.byte_order == "little_endian",
+    "Motorola byte order": lambda signal: signal.byte_order == "big_endian",
+    "Motorola, not byte aligned": lambda signal: (signal.byte_order == "big_endian"
+                                                  and (signal.length % 8 or signal.start % 8 != 7)),
+    "signed": lambda signal: signal.is_signed and not signal.is_float,
+    "64-bit": lambda signal: signal.length == 64,
+    "signed 64-bit": lambda signal: signal.length == 64 and signal.is_signed and not signal.is_float,
+    "Motorola 64-bit": lambda signal: signal.length == 64 and signal.byte_order == "big_endian",
+    "32-bit float": lambda signal: signal.is_float and signal.length == 32,
+    "64-bit float": lambda signal: signal.is_float and signal.length == 64,
+    "multiplexed": lambda signal: bool(signal.multiplexer_ids),
+    "Motorola multiplexed": lambda signal: (signal.byte_order == "big_endian"
+                                            and bool(signal.multiplexer_ids)),
+}
+
+def _set_intel_bits(data, start, length, value):
+    """Write value into a little-endian (Intel) field of a bytearray"""
+    number = int.from_bytes(data, "little")
+    mask = ((1 << length) - 1) << start
+    number = (number & ~mask) | ((value << start) & mask)
+    data[:] = number.to_bytes(len(data), "little")
+
+def corpus_payloads(rng, message, count):
+    """
+    Get count payloads for a message: all zero bits, all one bits, then
+    random bytes; multiplexer fields cycle through the multiplexer IDs in
+    use and one that selects nothing
+    """
+    payloads = [bytearray(message.length), bytearray(b"\xff" * message.length)]
+    while len(payloads) < count:
+        payloads.append(bytearray(rng.getrandbits(8) for _ in range(message.length)))
+    for signal in message.signals:
+        if not signal.is_multiplexer or signal.byte_order != "little_endian":
+            continue
+        ids = sorted({mux_id for other in message.signals
+                      for mux_id in (other.multiplexer_ids or [])
+                      if other.multiplexer_signal == signal.name})
+        unknown = next(value for value in range(1 << signal.length) if value not in ids)
+        values = ids + [unknown]
+        for row, data in enumerate(payloads):
+            _set_intel_bits(data, signal.start, signal.length, values[row % len(values)])
+    return [bytes(data) for data in payloads]
+
+def write_corpus(dbc_path=CORPUS_DBC, log_path=CORPUS_LOG):
+    """Write the corpus DBC and its candump log"""
+    import cantools
+    os.makedirs(os.path.dirname(dbc_path), exist_ok=True)
+    write_synthetic_dbc(CORPUS_SPEC, dbc_path)
+    db = cantools.database.load_file(dbc_path)
+    rng = random.Random(CORPUS_SPEC.seed)
+    payloads = {msg: corpus_payloads(rng, msg, FRAMES_PER_MESSAGE) for msg in db.messages}
+    with open(log_path, "w", encoding="ascii", newline="\n") as f:
+        # Messages take turns, as on a bus
+        for row in range(FRAMES_PER_MESSAGE):
+            for position, msg in enumerate(db.messages):
+                timestamp = (row * len(db.messages) + position) * 0.0001
+                frame_id = f"{msg.frame_id:08X}" if msg.is_extended_frame else f"{msg.frame_id:03X}"
+                f.write(f"({timestamp:.6f}) can0 {frame_id}#{payloads[msg][row].hex().upper()}\n")
+
+def feature_counts(db):
+    """Count the signals of a database having each feature"""
+    signals = [signal for msg in db.messages for signal in msg.signals]
+    return {feature: sum(1 for signal in signals if test(signal))
+            for feature, test in FEATURES.items()}
+
+def check_log(db, log_path):
+    """Decode a log vectorized, comparing every value with cantools; returns the mismatches"""
+    from model.log_decoder import LogDecoder
+    decoder = LogDecoder([db], check=True)
+    for _ in decoder.decode_file(log_path):
+        pass
+    stats = decoder.stats
+    if stats.unknown_frames or stats.frames_decoded != stats.frames_read:
+        raise ValueError(f"{log_path}: {stats.frames_read} frames read but "
+                         f"{stats.frames_decoded} decoded")
+    return list(stats.cross_check_mismatches)
+
+def check_frame_store(db, log_path):
+    """
+    Convert a log to a frame store and decode it from the mapped records,
+    comparing every value with cantools; returns the mismatches
+    """
+    from model.batch_decoder import cross_check
+    from model.frame_store import FRAME_STORE_EXTENSION, FrameStore, write_frame_store
+    from model.log_decoder import LogDecoder
+    decoder = LogDecoder([db])
+    mismatches = []
+    with tempfile.TemporaryDirectory() as directory:
+        store_path = os.path.join(directory, "corpus" + FRAME_STORE_EXTENSION)
+        write_frame_store(log_path, store_path)
+        with FrameStore(store_path) as store:
+            for msg in db.messages:
+                positions = store.select(msg.frame_id, extended=msg.is_extended_frame)
+                batch = decoder.decode_store_rows(store, msg, positions)
+                payloads = [bytes(row[:dlc]) for row, dlc
+                            in zip(store.payloads[positions], store.dlcs[positions])]
+                for row, name, value, expected in cross_check(msg, payloads, batch.columns):
+                    mismatches.append((msg.name, row, name, value, expected))
+    return mismatches
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare the vectorized decoder with cantools on the checked-in corpus")
+    parser.add_argument("--regenerate", action="store_true",
+                        help="write the corpus DBC and log again before checking")
+    args = parser.parse_args(argv)
+    if args.regenerate:
+        write_corpus()
+    
+    import cantools
+    db = cantools.database.load_file(CORPUS_DBC)
+    failed = False
+    for feature, count in feature_counts(db).items():
+        print(f"  {feature}: {count} signals")
+        if not count:
+            print(f"The corpus has no {feature} signals", file=sys.stderr)
+            failed = True
+    
+    for label, check in (("text log", check_log), ("frame store", check_frame_store)):
+        mismatches = check(db, CORPUS_LOG)
+        print(f"Cross-check against cantools ({label}): {len(mismatches)} mismatches")
+        for message_name, row, signal_name, value, expected in mismatches[:20]:
+            print(f"  {message_name}.{signal_name} (frame {row} of batch): "
+                  f"{value} != {expected}")
+        failed = failed or bool(mismatches)
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
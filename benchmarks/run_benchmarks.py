@@ -0,0 +1,264 @@
+"""
+Benchmarks of DBC loading and of the display view's tables
+
+Generates synthetic DBC files at each requested scale, then times
+DBCModel.load_dbc and the DBCDisplayView methods behind the message and
+signal tables under Qt's offscreen platform. The first call of a table
+method also builds the file's derived data (index, signal store, filter
+text), so it is reported apart from the repeated calls.
+
+Results are written as JSON; --compare prints the change against an
+earlier results file, so a commit can be checked against its parent:
+
+    python -m benchmarks.run_benchmarks --scale 1000x8 --scale 10000x16 -o new.json
+    python -m benchmarks.run_benchmarks -o new.json --compare old.json
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Qt must be told before it is imported; a display is never needed
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks.synthetic_dbc import SyntheticDBCSpec, write_synthetic_dbc
+
+DEFAULT_SCALES = ["1000x8", "5000x16"]
+DEFAULT_REPEAT = 5
+
+# Median slowdown reported as a regression by --compare
+REGRESSION_THRESHOLD = 1.2
+
+# Filter texts typed into the Name / Signal Name column filters
+MESSAGE_FILTER_TEXT = "msg_1"
+SIGNAL_FILTER_TEXT = "sig_1"
+
+def parse_scale(text):
+    """Parse a "<messages>x<signals>" scale"""
+    try:
+        messages, signals = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid scale {text!r}, expected e.g. 1000x8")
+    return messages, signals
+
+def time_calls(function, repeat, between=None):
+    """Call function repeat times, returning the durations in seconds"""
+    durations = []
+    for _ in range(repeat):
+        if between is not None:
+            between()
+        gc.collect()
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+def summarize(durations, first_is_cold=True):
+    """Get the statistics of a list of durations, in milliseconds"""
+    runs = [duration * 1000 for duration in durations]
+    warm = runs[1:] if first_is_cold and len(runs) > 1 else runs
+    return {
+        "first_ms": round(runs[0], 3),
+        "min_ms": round(min(warm), 3),
+        "median_ms": round(statistics.median(warm), 3),
+        "mean_ms": round(statistics.fmean(warm), 3),
+        "runs_ms": [round(run, 3) for run in runs],
+    }
+
+def set_filter_text(view, column, text):
+    """Type a filter text without starting the debounce timer"""
+    widget = view.filters[column]
+    widget.blockSignals(True)
+    widget.setText(text)
+    widget.blockSignals(False)
+
+def benchmark_scale(app, spec, repeat, directory):
+    """Time every benchmark on one synthetic DBC; returns {name: statistics}"""
+    from PyQt5.QtCore import Qt
+    from model.dbc_model import DBCModel
+    from view.main_window import MainWindow
+    from view.dbc_display_view import DBCDisplayView
+    
+    path = os.path.join(directory, f"synthetic_{spec.label()}.dbc")
+    write_synthetic_dbc(spec, path)
+    results = {}
+    
+    # Every load parses the file again: the cache is off
+    models = []
+    def load():
+        model = DBCModel(use_cache=False)
+        ok, error = model.load_dbc(path)
+        if not ok:
+            raise RuntimeError(f"Failed to load {path}: {error}")
+        models.append(model)
+    results["load_dbc"] = summarize(time_calls(load, repeat), first_is_cold=False)
+    db = models[-1].get_dbc(path)
+    models.clear()
+    
+    # The display view reads the DBC through its parent's controller
+    main_window = MainWindow()
+    main_window.dbc_controller.model.add_dbc(path, db)
+    view = DBCDisplayView(main_window)
+    view.dbc_file_path = path
+    view.show()
+    app.processEvents()
+    
+    def run(name, function, between=None):
+        results[name] = summarize(time_calls(function, repeat, between))
+        app.processEvents()
+    
+    run("display_dbc_content", lambda: view.display_dbc_content(path))
+    
+    run("populate_messages_table", view.populate_messages_table)
+    set_filter_text(view, 1, MESSAGE_FILTER_TEXT)
+    def reset_message_filter():
+        # Otherwise repeating the same query returns the previous matches
+        view.message_filter.reset()
+        view.message_model.set_accepted_messages(None)
+    run("apply_filters", view.apply_filters, between=reset_message_filter)
+    set_filter_text(view, 1, "")
+    view.apply_filters()
+    orders = iter([Qt.AscendingOrder, Qt.DescendingOrder] * repeat)
+    run("sort_table", lambda: view.sort_table(1, next(orders)))
+    
+    run("populate_signals_table", view.populate_signals_table)
+    set_filter_text(view, 0, SIGNAL_FILTER_TEXT)
+    def reset_signal_filter():
+        view.signal_filter.reset()
+        view.signal_model.set_accepted_rows(None)
+    run("apply_signal_filters", view.apply_signal_filters, between=reset_signal_filter)
+    set_filter_text(view, 0, "")
+    view.apply_signal_filters()
+    orders = iter([Qt.AscendingOrder, Qt.DescendingOrder] * repeat)
+    run("sort_signals_table", lambda: view.sort_signals_table(7, next(orders)))
+    
+    view.close()
+    main_window.close()
+    view.deleteLater()
+    main_window.deleteLater()
+    app.processEvents()
+    return results
+
+def get_commit():
+    """Get the current git commit, or None outside a git checkout"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def get_versions():
+    versions = {"python": platform.python_version()}
+    try:
+        import cantools
+        versions["cantools"] = cantools.__version__
+    except ImportError:
+        pass
+    from PyQt5.QtCore import QT_VERSION_STR, PYQT_VERSION_STR
+    versions["qt"] = QT_VERSION_STR
+    versions["pyqt"] = PYQT_VERSION_STR
+    return versions
+
+def run_benchmarks(scales, repeat=DEFAULT_REPEAT, spec_options=None, log=sys.stderr):
+    """Run the benchmarks at each (messages, signals) scale; returns the results document"""
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    document = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": get_commit(),
+        "platform": platform.platform(),
+        "versions": get_versions(),
+        "repeat": repeat,
+        "scales": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="dbc_master_bench_") as directory:
+        for messages, signals in scales:
+            spec = SyntheticDBCSpec(messages, signals, **(spec_options or {}))
+            print(f"Benchmarking {spec.label()}...", file=log)
+            results = benchmark_scale(app, spec, repeat, directory)
+            document["scales"][spec.label()] = {"spec": spec.to_dict(), "results": results}
+            for name, stats in results.items():
+                print(f"  {name:<24} first {stats['first_ms']:10.1f} ms   "
+                      f"median {stats['median_ms']:10.1f} ms", file=log)
+    return document
+
+def compare_results(old, new, output=sys.stdout):
+    """
+    Print the median of every benchmark of two results documents side by side
+    Returns the number of benchmarks slower by more than REGRESSION_THRESHOLD
+    """
+    regressions = 0
+    print(f"{'Benchmark':<40} {'Old (ms)':>10} {'New (ms)':>10} {'Ratio':>7}", file=output)
+    for label, scale in new["scales"].items():
+        old_scale = old.get("scales", {}).get(label)
+        if old_scale is None:
+            continue
+        for name, stats in scale["results"].items():
+            old_stats = old_scale["results"].get(name)
+            if old_stats is None:
+                continue
+            old_median = old_stats["median_ms"]
+            new_median = stats["median_ms"]
+            ratio = new_median / old_median if old_median > 0 else float("inf")
+            flag = ""
+            if ratio > REGRESSION_THRESHOLD:
+                flag = "  slower"
+                regressions += 1
+            print(f"{label + ' ' + name:<40} {old_median:10.1f} {new_median:10.1f} "
+                  f"{ratio:7.2f}{flag}", file=output)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time DBC loading and table operations on synthetic DBC files")
+    parser.add_argument("--scale", action="append", type=parse_scale, metavar="MESSAGESxSIGNALS",
+                        help="messages and signals per message of a synthetic DBC; may be "
+                             f"repeated (default: {' '.join(DEFAULT_SCALES)})")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"calls per benchmark (default: {DEFAULT_REPEAT})")
+    parser.add_argument("--multiplexed", type=float, default=0.1,
+                        help="fraction of multiplexed messages (default: 0.1)")
+    parser.add_argument("--choices", type=float, default=0.2,
+                        help="fraction of signals with value tables (default: 0.2)")
+    parser.add_argument("--comments", type=float, default=0.5,
+                        help="fraction of messages and signals with comments (default: 0.5)")
+    parser.add_argument("-o", "--output", metavar="PATH",
+                        help="write the results to PATH as JSON ('-' for stdout)")
+    parser.add_argument("--compare", metavar="PATH",
+                        help="compare the results with an earlier results file; the exit "
+                             "status is 1 if any median is more than "
+                             f"{REGRESSION_THRESHOLD:g} times slower")
+    args = parser.parse_args(argv)
+    
+    scales = args.scale or [parse_scale(scale) for scale in DEFAULT_SCALES]
+    spec_options = {"multiplexed": args.multiplexed, "choices": args.choices,
+                    "comments": args.comments}
+    document = run_benchmarks(scales, max(1, args.repeat), spec_options)
+    
+    if args.output == "-":
+        json.dump(document, sys.stdout, indent=2)
+        print()
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        print(f"Results written to {args.output}", file=sys.stderr)
+    
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        # The table goes to stderr when the results themselves go to stdout
+        output = sys.stderr if args.output == "-" else sys.stdout
+        if compare_results(old, document, output):
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+Generator of synthetic DBC files for benchmarking
+
+Writes the DBC text directly (building a cantools database and calling
+as_dbc_string() is slower than parsing the result), so files with tens of
+thousands of messages are generated in seconds. The output is fully
+determined by the parameters and the seed, so every commit is measured on
+the same files.
+
+Usage:
+    python -m benchmarks.synthetic_dbc 5000 16 large.dbc --multiplexed 0.2
+"""
+
+import argparse
+import random
+
+# Units and choice labels drawn from for the generated signals
+UNITS = ["", "km/h", "rpm", "degC", "V", "A", "%", "bar", "Nm", "m/s2"]
+CHOICE_LABELS = ["Off", "On", "Error", "Not_Available", "Init", "Active", "Passive",
+                 "Fault", "Standby", "Reserved"]
+
+class SyntheticDBCSpec:
+    """Parameters of a synthetic DBC"""
+    
+    def __init__(self, messages=1000, signals=8, multiplexed=0.1, choices=0.2,
+                 comments=0.5, extended=0.3, nodes=8, seed=0, wide=0.0, floats=0.0,
+                 motorola=0.0):
+        self.messages = messages        # Number of messages
+        self.signals = signals          # Signals per message, side by side in the payload
+        self.multiplexed = multiplexed  # Fraction of multiplexed messages
+        self.choices = choices          # Fraction of signals with value tables
+        self.comments = comments        # Fraction of messages and signals with comments
+        self.extended = extended        # Fraction of messages with extended frame IDs
+        self.nodes = nodes              # Number of ECUs sending and receiving
+        self.seed = seed
+        self.wide = wide                # Fraction of messages with one 64-bit or two 32-bit signals
+        self.floats = floats            # Fraction of 32 and 64-bit signals that are IEEE floats
+        self.motorola = motorola        # Fraction of messages with only big endian signals, at any bit
+    
+    def to_dict(self):
+        return dict(vars(self))
+    
+    def label(self):
+        return f"{self.messages}x{self.signals}"
+
+def _message_length(signals):
+    """Get the payload length fitting signals of at least 4 bits, as a CAN FD length"""
+    for length in (8, 12, 16, 20, 24, 32, 48, 64):
+        if length * 8 >= signals * 4:
+            return length
+    return 64
+
+def _signal_lines(rng, spec, index, signal_count, length, multiplexed, node_names,
+                  max_width=32, motorola=False):
+    """
+    Get the SG_ lines, [(signal name, choice labels), ...] and
+    [(signal name, width), ...] of the IEEE float signals of one message
+    """
+    lines = []
+    choices = []
+    floats = []
+    receiver = rng.choice(node_names)
+    
+    # Signals are laid side by side; in a multiplexed message an 8-bit
+    # multiplexer comes first and two groups of signals, sent for
+    # multiplexer values 0 and 1, share the rest of the payload
+    first = 0
+    groups = 1
+    if multiplexed:
+        lines.append(f' SG_ Mux_{index} M : 0|8@1+ (1,0) [0|255] "" {receiver}')
+        signal_count -= 1
+        first = 8
+        groups = 2
+    per_group = -(-signal_count // groups)
+    width = min(max_width, (length * 8 - first) // per_group)
+    
+    for number in range(signal_count):
+        group, slot = divmod(number, per_group)
+        start = first + slot * width
+        name = f"Sig_{index}_{number}"
+        mux = f" m{group}" if multiplexed else ""
+        signed = "-" if rng.random() < 0.3 else "+"
+        scale = rng.choice([1, 0.1, 0.01, 0.5, 2])
+        offset = rng.choice([0, 0, 0, -40, 100])
+        maximum = ((1 << width) - 1) * scale + offset
+        if spec.floats and width in (32, 64) and rng.random() < spec.floats:
+            # Declared by SIG_VALTYPE_; the raw bits are the value
+            floats.append((name, width))
+            scale, offset, maximum = 1, 0, 0
+        unit = rng.choice(UNITS)
+        if motorola:
+            # Laid out MSB first; the start bit is the most significant bit
+            # in the DBC's sawtooth numbering, so any width fits anywhere
+            byte_order = "0"
+            start = 8 * (start // 8) + 7 - start % 8
+        elif width % 8 == 0 and rng.random() < 0.3:
+            # Big endian: the start bit is the most significant bit
+            byte_order = "0"
+            start += 7
+        else:
+            byte_order = "1"
+        lines.append(f' SG_ {name}{mux} : {start}|{width}@{byte_order}{signed} '
+                     f'({scale:g},{offset:g}) [{offset:g}|{maximum:g}] "{unit}" {receiver}')
+        if rng.random() < spec.choices:
+            count = min(len(CHOICE_LABELS), 1 << min(width, 3))
+            choices.append((name, CHOICE_LABELS[:count]))
+    return lines, choices, floats
+
+def generate_dbc_text(spec):
+    """Get the text of a synthetic DBC file"""
+    rng = random.Random(spec.seed)
+    node_names = [f"ECU_{number}" for number in range(max(1, spec.nodes))]
+    lines = ['VERSION ""', "", "", "NS_ :", "\tCM_", "\tBA_DEF_", "\tBA_", "\tVAL_",
+             "\tBA_DEF_DEF_", "", "BS_:", "", "BU_: " + " ".join(node_names), "", ""]
+    comments = []
+    value_tables = []
+    cycle_times = []
+    value_types = []
+    
+    next_standard_id = 0
+    for index in range(spec.messages):
+        # Standard IDs run out after 2048 messages
+        extended = rng.random() < spec.extended or next_standard_id > 0x7FF
+        if extended:
+            # Bit 31 marks extended frame IDs in DBC files
+            frame_id = (0x10000 + index) | 0x80000000
+        else:
+            frame_id = next_standard_id
+            next_standard_id += 1
+        wide = spec.wide and rng.random() < spec.wide
+        motorola = spec.motorola and rng.random() < spec.motorola
+        if wide:
+            # One 64-bit or two 32-bit signals filling 8 bytes
+            multiplexed = False
+            signal_count = rng.choice([1, 2])
+        else:
+            multiplexed = spec.signals > 2 and rng.random() < spec.multiplexed
+            signal_count = spec.signals + (1 if multiplexed else 0)
+        length = _message_length(signal_count)
+        name = f"Msg_{index}"
+        lines.append(f"BO_ {frame_id} {name}: {length} {rng.choice(node_names)}")
+        signal_lines, choices, floats = _signal_lines(rng, spec, index, signal_count, length,
+                                                      multiplexed, node_names,
+                                                      64 if wide else 32, motorola)
+        lines.extend(signal_lines)
+        lines.append("")
+        
+        if rng.random() < spec.comments:
+            comments.append(f'CM_ BO_ {frame_id} "Synthetic message {index} for benchmarking";')
+        for signal_line in signal_lines:
+            signal_name = signal_line.split()[1]
+            if rng.random() < spec.comments:
+                comments.append(f'CM_ SG_ {frame_id} {signal_name} "Signal {signal_name} of {name}";')
+        for signal_name, labels in choices:
+            values = " ".join(f'{value} "{label}"' for value, label in enumerate(labels))
+            value_tables.append(f"VAL_ {frame_id} {signal_name} {values} ;")
+        for signal_name, width in floats:
+            # 1: IEEE single, 2: IEEE double
+            value_types.append(f"SIG_VALTYPE_ {frame_id} {signal_name} : {1 if width == 32 else 2};")
+        cycle_times.append(f'BA_ "GenMsgCycleTime" BO_ {frame_id} {rng.choice([10, 20, 50, 100, 500, 1000])};')
+    
+    lines.extend(comments)
+    lines.append('BA_DEF_ BO_ "GenMsgCycleTime" INT 0 65535;')
+    lines.append('BA_DEF_DEF_ "GenMsgCycleTime" 0;')
+    lines.extend(cycle_times)
+    lines.extend(value_tables)
+    lines.extend(value_types)
+    return "\n".join(lines) + "\n"
+
+def write_synthetic_dbc(spec, path):
+    """Write a synthetic DBC file; returns path"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(generate_dbc_text(spec))
+    return path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic DBC file")
+    parser.add_argument("messages", type=int, help="number of messages")
+    parser.add_argument("signals", type=int, help="signals per message")
+    parser.add_argument("output", help="path of the DBC file to write")
+    parser.add_argument("--multiplexed", type=float, default=0.1,
+                        help="fraction of multiplexed messages (default: 0.1)")
+    parser.add_argument("--choices", type=float, default=0.2,
+                        help="fraction of signals with value tables (default: 0.2)")
+    parser.add_argument("--comments", type=float, default=0.5,
+                        help="fraction of messages and signals with comments (default: 0.5)")
+    parser.add_argument("--wide", type=float, default=0.0,
+                        help="fraction of messages with one 64-bit or two 32-bit signals (default: 0)")
+    parser.add_argument("--floats", type=float, default=0.0,
+                        help="fraction of 32 and 64-bit signals that are IEEE floats (default: 0)")
+    parser.add_argument("--motorola", type=float, default=0.0,
+                        help="fraction of messages with only big endian signals (default: 0)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    spec = SyntheticDBCSpec(args.messages, args.signals, args.multiplexed, args.choices,
+                            args.comments, seed=args.seed, wide=args.wide, floats=args.floats,
+                            motorola=args.motorola)
+    write_synthetic_dbc(spec, args.output)
+
+if __name__ == '__main__':
+    main()
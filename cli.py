@@ -0,0 +1,221 @@
+"""
+Headless command line interface for batch DBC inspection and export
+
+Loads DBC files without a GUI, prints summaries of their messages and
+signals, and exports the message or signal table to CSV or JSON. PyQt5
+is never imported, so this runs on machines without a display.
+
+Examples:
+    python cli.py vehicle.dbc body.dbc
+    python cli.py dbc_dir/ --messages
+    python cli.py dbc_dir/ --export signals.csv --table signals
+    python cli.py vehicle.dbc --decode drive.blf
+    python cli.py vehicle.dbc --bus-load --bitrate 250000
+"""
+
+import argparse
+import os
+import sys
+from model.dbc_model import DBCModel
+from model.dbc_export import EXPORT_TABLES, EXPORT_FORMATS, export_table
+
+# File extensions picked up when a directory is given
+DBC_EXTENSIONS = (".dbc",)
+
+def find_dbc_files(paths):
+    """Expand directories into the DBC files they contain, recursively"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.lower().endswith(DBC_EXTENSIONS):
+                        files.append(os.path.join(root, name))
+        else:
+            files.append(path)
+    return files
+
+def print_summary(model, file_path, show_messages=False, output=sys.stdout):
+    """Print a one-line summary of a loaded DBC, optionally followed by its messages"""
+    db = model.get_dbc(file_path)
+    signal_count = sum(len(msg.signals) for msg in db.messages)
+    node_count = len(getattr(db, 'nodes', None) or [])
+    print(f"{file_path}: {len(db.messages)} messages, {signal_count} signals, "
+          f"{node_count} nodes", file=output)
+    if show_messages:
+        for msg in db.messages:
+            print(f"  0x{msg.frame_id:X} {msg.name}: {msg.length} bytes, "
+                  f"{len(msg.signals)} signals", file=output)
+
+def print_bus_load(model, file_path, bitrate, data_bitrate=None, top=10, output=sys.stdout):
+    """Print the worst-case bus load, top contributors and bit layout issues of a loaded DBC"""
+    analytics = model.get_bus_analytics(file_path, bitrate, data_bitrate)
+    print(f"{file_path}: bus load at {bitrate / 1000:g} kbit/s", file=output)
+    for bus in analytics.buses.values():
+        print(f"  {bus.display_name()}: {bus.load * 100:.1f}% "
+              f"({bus.messages} periodic messages, {bus.unscheduled} without cycle time)",
+              file=output)
+    for message_load in analytics.top_contributors(top):
+        msg = message_load.message
+        print(f"    0x{msg.frame_id:X} {msg.name}: {message_load.load * 100:.2f}% "
+              f"({message_load.frame_bits} bits every {msg.cycle_time} ms)", file=output)
+    for layout in analytics.layout_issues():
+        for first, second, bits in layout.overlaps:
+            print(f"  {layout.message.name}: {first} and {second} share {bits} bits",
+                  file=output)
+        for name in layout.out_of_range:
+            print(f"  {layout.message.name}: {name} extends past {layout.message.length} bytes",
+                  file=output)
+
+def decode_log(model, file_paths, log_path, check=False, jobs=None,
+               export_path=None, layout="long", output=sys.stdout):
+    """
+    Decode a CAN log against the loaded DBCs and print per-message frame counts
+    With check, every value is compared against cantools' own decoder.
+    Logs are decoded on jobs worker processes (default: CPU count). With
+    export_path, the decoded signals are written to a Parquet or Feather
+    file in the long or wide layout.
+    Returns the number of values that differ.
+    """
+    # Imported here: only decoding needs python-can
+    if (jobs or os.cpu_count() or 1) > 1:
+        from model.parallel_decoder import ParallelLogDecoder
+        decoder = ParallelLogDecoder.from_model(model, file_paths, workers=jobs, check=check)
+    else:
+        from model.log_decoder import LogDecoder
+        decoder = LogDecoder.from_model(model, file_paths, check=check)
+    frame_counts = {}
+    def counted(batches):
+        for batch in batches:
+            frame_counts[batch.message] = frame_counts.get(batch.message, 0) + len(batch)
+            yield batch
+    batches = counted(decoder.decode_file(log_path))
+    if export_path:
+        from model.trace_export import write_decoded
+        rows = write_decoded(batches, export_path, decoder.messages_by_frame_id.values(), layout)
+        print(f"Exported {rows} decoded rows ({layout} layout) to {export_path}", file=sys.stderr)
+    else:
+        for _ in batches:
+            pass
+    
+    stats = decoder.stats
+    print(f"{log_path}: {stats.frames_read} frames, {stats.frames_decoded} decoded, "
+          f"{stats.unknown_frames} with unknown IDs, {stats.decode_errors} decode errors "
+          f"({stats.frames_per_second():.0f} frames/s)", file=output)
+    for msg, count in sorted(frame_counts.items(), key=lambda item: item[0].frame_id):
+        print(f"  0x{msg.frame_id:X} {msg.name}: {count} frames", file=output)
+    
+    mismatches = stats.cross_check_mismatches
+    if check:
+        print(f"Cross-check against cantools: {len(mismatches)} mismatches", file=output)
+        for message_name, row, signal_name, value, expected in mismatches[:20]:
+            print(f"  {message_name}.{signal_name} (frame {row} of batch): "
+                  f"{value} != {expected}", file=output)
+    return len(mismatches)
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Inspect and export DBC files without starting the GUI")
+    parser.add_argument("paths", nargs="+",
+                        help="DBC files, or directories to search for .dbc files")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of worker processes used to load files and decode logs "
+                             "(default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="do not read or write the parsed-DBC cache")
+    parser.add_argument("--messages", action="store_true",
+                        help="list the messages of each file in the summary")
+    parser.add_argument("--search", metavar="TEXT",
+                        help="list the messages and signals of all loaded files whose name, "
+                             "comment, unit or choice labels contain TEXT")
+    parser.add_argument("--bus-load", action="store_true",
+                        help="estimate the worst-case bus load of each file and report "
+                             "overlapping signals")
+    parser.add_argument("--bitrate", type=int, default=500000,
+                        help="with --bus-load, the (nominal) bitrate in bit/s (default: 500000)")
+    parser.add_argument("--data-bitrate", type=int, default=None,
+                        help="with --bus-load, the CAN FD data phase bitrate in bit/s "
+                             "(default: the nominal bitrate)")
+    parser.add_argument("--decode", metavar="LOG",
+                        help="decode a CAN log (.asc, .blf, .log, .trc) or frame store (.frames) "
+                             "against the loaded files")
+    parser.add_argument("--save-frames", metavar="PATH",
+                        help="with --decode, first convert the log to a memory-mapped frame "
+                             "store at PATH (*.frames) and decode from it; later runs can "
+                             "--decode PATH directly")
+    parser.add_argument("--export-decoded", metavar="PATH",
+                        help="with --decode, write the decoded signals to a Parquet "
+                             "(.parquet) or Feather (.feather, .arrow) file, rows in "
+                             "timestamp order")
+    parser.add_argument("--layout", choices=("long", "wide"), default="long",
+                        help="decoded export layout: one row per value (long) or per frame "
+                             "(wide, one column per signal of the messages in the log) "
+                             "(default: long)")
+    parser.add_argument("--cross-check", action="store_true",
+                        help="with --decode, compare every decoded value against cantools")
+    parser.add_argument("--export", metavar="PATH",
+                        help="write a table of all loaded files to PATH ('-' for stdout)")
+    parser.add_argument("--table", choices=EXPORT_TABLES, default="messages",
+                        help="table to export (default: messages)")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default=None,
+                        help="export format (default: from the file extension, else csv)")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    
+    file_paths = find_dbc_files(args.paths)
+    if not file_paths:
+        print("No DBC files found", file=sys.stderr)
+        return 1
+    
+    model = DBCModel(use_cache=not args.no_cache)
+    errors = model.load_dbcs_parallel(file_paths, max_workers=args.jobs)
+    for file_path, error in errors.items():
+        print(f"Failed to load DBC file {file_path}: {error}", file=sys.stderr)
+    loaded = [file_path for file_path in file_paths if model.get_dbc(file_path) is not None]
+    
+    # Summaries go to stderr when the export itself is written to stdout
+    summary_output = sys.stderr if args.export == "-" else sys.stdout
+    for file_path in loaded:
+        print_summary(model, file_path, args.messages, summary_output)
+    
+    if args.bus_load:
+        for file_path in loaded:
+            print_bus_load(model, file_path, args.bitrate, args.data_bitrate,
+                           output=summary_output)
+    
+    if args.search:
+        hits = model.search(args.search, limit=None)
+        for hit in hits:
+            target = hit.message if hit.signal is None else f"{hit.message}.{hit.signal}"
+            print(f"{os.path.basename(hit.file_path)}: {target} [{hit.field}] {hit.text}",
+                  file=summary_output)
+        print(f"{len(hits)} matches for {args.search!r}", file=summary_output)
+    
+    mismatches = 0
+    if args.decode and args.save_frames:
+        from model.frame_store import write_frame_store
+        count = write_frame_store(args.decode, args.save_frames)
+        print(f"Saved {count} frames to {args.save_frames}", file=sys.stderr)
+        args.decode = args.save_frames
+    if args.decode:
+        mismatches = decode_log(model, loaded, args.decode, args.cross_check, args.jobs,
+                                args.export_decoded, args.layout, summary_output)
+    
+    if args.export:
+        export_format = args.format
+        if export_format is None:
+            extension = os.path.splitext(args.export)[1].lower().lstrip(".")
+            export_format = extension if extension in EXPORT_FORMATS else "csv"
+        if args.export == "-":
+            count = export_table(model, loaded, args.table, sys.stdout, export_format)
+        else:
+            with open(args.export, "w", newline="", encoding="utf-8") as output:
+                count = export_table(model, loaded, args.table, output, export_format)
+        print(f"Exported {count} {args.table} rows to {args.export}", file=sys.stderr)
+    
+    return 1 if errors or mismatches else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,7 @@
 from PyQt5.QtWidgets import QFileDialog
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QThreadPool, QTimer, pyqtSignal
 from model.dbc_model import DBCModel
+from controller.dbc_load_worker import DBCLoadWorker, DBCReloadWorker
 
 class DBC_IO_Controller(QObject):
     # Signals for DBC operations
@@ -8,41 +9,185 @@ class DBC_IO_Controller(QObject):
     dbc_error = pyqtSignal(str)           # Emits error message when loading fails
     dbc_removed = pyqtSignal(str)         # Emits file_path when DBC is removed
     
+    # Signals for background loading
+    dbc_load_started = pyqtSignal(str)              # Emits file_path when a load is queued
+    dbc_load_progress = pyqtSignal(str, int, str)   # Emits (file_path, percent, stage)
+    dbc_load_cancelled = pyqtSignal(str)            # Emits file_path when a load is cancelled
+    dbc_load_finished = pyqtSignal(str)             # Emits file_path when a load ends, whatever the outcome
+    
+    # Signals for automatic reloading of files changed on disk
+    dbc_reloaded = pyqtSignal(str, object)       # Emits (file_path, DBCReload) when a changed file was reloaded
+    dbc_reload_failed = pyqtSignal(str, str)     # Emits (file_path, error message)
+    
+    # Time between checks of the loaded files for changes; a change is
+    # reloaded once the file has stayed the same for one interval
+    WATCH_INTERVAL_MS = 1000
+    
     def __init__(self):
         super().__init__()
         self.model = DBCModel()
         
+        # Loads run on a thread pool so the GUI thread never parses a DBC
+        self.thread_pool = QThreadPool(self)
+        
+        # Loads in progress (file_path -> DBCLoadWorker)
+        self.active_loads = {}
+        
+        # Reloads of changed files in progress (file_path -> DBCReloadWorker)
+        self.active_reloads = {}
+        
+        # Polls the model's file watcher; one stat() per loaded file
+        self.watch_timer = QTimer(self)
+        self.watch_timer.setInterval(self.WATCH_INTERVAL_MS)
+        self.watch_timer.timeout.connect(self.check_changed_files)
+        self.watch_timer.start()
+    
     def import_dbc(self, parent_window=None):
         """
-        Opens a file dialog to select and load a DBC file
-        Emits appropriate signals based on the result
+        Opens a file dialog to select one or more DBC files and starts
+        loading them in the background
+        Returns True if at least one load was started
         """
-        file_name, _ = QFileDialog.getOpenFileName(
+        file_names, _ = QFileDialog.getOpenFileNames(
             parent_window,
             "Select DBC File",
             "",
             "DBC Files (*.dbc);;All Files (*.*)"
         )
         
-        if file_name:
-            success, error_msg = self.model.load_dbc(file_name)
-            if success:
-                db = self.model.get_dbc(file_name)
-                self.dbc_loaded.emit(file_name, db)
-                return True
-            else:
-                # Use the detailed error message from the model
-                error_message = f"Failed to load DBC file: {error_msg}"
-                self.dbc_error.emit(error_message)
-                return False
+        started = False
+        for file_name in file_names:
+            if self.load_dbc_async(file_name):
+                started = True
         
-        return False
+        return started
+    
+    def load_dbc_async(self, file_path):
+        """
+        Starts loading a DBC file on the thread pool
+        dbc_loaded or dbc_error is emitted when the load completes
+        Returns False if the file is already being loaded
+        """
+        if file_path in self.active_loads:
+            return False
+        
+        worker = DBCLoadWorker(self.model, file_path)
+        worker.signals.progress.connect(self.dbc_load_progress)
+        worker.signals.finished.connect(self.on_load_finished)
+        worker.signals.error.connect(self.on_load_error)
+        worker.signals.cancelled.connect(self.on_load_cancelled)
+        
+        self.active_loads[file_path] = worker
+        self.dbc_load_started.emit(file_path)
+        self.thread_pool.start(worker)
+        return True
+    
+    def cancel_load(self, file_path):
+        """
+        Requests cancellation of a load in progress
+        Returns True if the file was being loaded
+        """
+        worker = self.active_loads.get(file_path)
+        if worker is None:
+            return False
+        worker.cancel()
+        return True
+    
+    def cancel_all_loads(self):
+        """
+        Requests cancellation of every load in progress
+        """
+        for worker in list(self.active_loads.values()):
+            worker.cancel()
+    
+    def get_active_loads(self):
+        """
+        Returns a list of file paths currently being loaded
+        """
+        return list(self.active_loads.keys())
+    
+    def on_load_finished(self, file_path, db):
+        """Store a database parsed by a worker and announce it"""
+        worker = self.active_loads.pop(file_path, None)
+        self.dbc_load_finished.emit(file_path)
+        self.model.add_dbc(file_path, db, worker.stamp if worker is not None else None)
+        self.dbc_loaded.emit(file_path, db)
+    
+    def on_load_error(self, file_path, error_msg):
+        """Report a worker's parse failure"""
+        self.active_loads.pop(file_path, None)
+        self.dbc_load_finished.emit(file_path)
+        # Use the detailed error message from the model
+        error_message = f"Failed to load DBC file: {error_msg}"
+        self.dbc_error.emit(error_message)
+    
+    def on_load_cancelled(self, file_path):
+        """Forget a cancelled load"""
+        self.active_loads.pop(file_path, None)
+        self.dbc_load_finished.emit(file_path)
+        self.dbc_load_cancelled.emit(file_path)
+    
+    def set_auto_reload(self, enabled):
+        """
+        Turns the automatic reloading of changed files on or off
+        """
+        if enabled:
+            self.watch_timer.start()
+        else:
+            self.watch_timer.stop()
+    
+    def is_auto_reload_enabled(self):
+        return self.watch_timer.isActive()
+    
+    def check_changed_files(self):
+        """
+        Starts reloading the loaded files that changed on disk
+        """
+        for file_path in self.model.get_changed_files():
+            self.reload_dbc_async(file_path)
+    
+    def reload_dbc_async(self, file_path):
+        """
+        Starts parsing a loaded file again on the thread pool and comparing
+        it with the loaded version; dbc_reloaded is emitted if anything changed
+        Returns False if the file is not loaded or already being (re)loaded
+        """
+        if (file_path in self.active_loads or file_path in self.active_reloads
+                or self.model.get_dbc(file_path) is None):
+            return False
+        
+        worker = DBCReloadWorker(self.model, file_path)
+        worker.signals.finished.connect(self.on_reload_finished)
+        worker.signals.error.connect(self.on_reload_error)
+        worker.signals.cancelled.connect(lambda path: self.active_reloads.pop(path, None))
+        self.active_reloads[file_path] = worker
+        self.thread_pool.start(worker)
+        return True
+    
+    def on_reload_finished(self, file_path, reload):
+        """Store a reloaded database and announce what changed"""
+        worker = self.active_reloads.pop(file_path, None)
+        if reload is None or worker is None:
+            return
+        # Skipped if the file was removed or loaded again meanwhile
+        if self.model.apply_reload(reload, worker.stamp) and not reload.is_empty():
+            self.dbc_reloaded.emit(file_path, reload)
+    
+    def on_reload_error(self, file_path, error_msg):
+        """Report a changed file that could not be parsed; the loaded version is kept"""
+        # Not reported if the file was removed meanwhile
+        if self.active_reloads.pop(file_path, None) is not None:
+            self.dbc_reload_failed.emit(file_path, error_msg)
     
     def remove_dbc(self, file_path):
         """
-        Removes a DBC file from the model
+        Removes a DBC file from the model, which stops watching it
         Emits dbc_removed signal if successful
         """
+        # A reload still running is cancelled and its result ignored
+        worker = self.active_reloads.pop(file_path, None)
+        if worker is not None:
+            worker.cancel()
         if self.model.remove_dbc(file_path):
             self.dbc_removed.emit(file_path)
             return True
@@ -54,8 +199,56 @@ class DBC_IO_Controller(QObject):
         """
         return self.model.get_dbc(file_path)
     
+    def get_signal_store(self, file_path):
+        """
+        Returns the columnar signal store for the given file path
+        """
+        return self.model.get_signal_store(file_path)
+    
+    def get_dbc_index(self, file_path):
+        """
+        Returns the lookup indexes for the given file path
+        """
+        return self.model.get_dbc_index(file_path)
+    
+    def get_filter_columns(self, file_path, table):
+        """
+        Returns the precomputed lowercase text used to filter a table
+        """
+        return self.model.get_filter_columns(file_path, table)
+    
+    def get_message_sort_keys(self, file_path):
+        """
+        Returns the typed sort keys of the messages table for the given file path
+        """
+        return self.model.get_message_sort_keys(file_path)
+    
+    def diff_dbcs(self, old_file_path, new_file_path):
+        """
+        Returns the DBCDiff of two loaded DBC files
+        """
+        return self.model.diff_dbcs(old_file_path, new_file_path)
+    
+    def get_bus_analytics(self, file_path, bitrate, data_bitrate=None, stuffing=True):
+        """
+        Returns the BusAnalytics of a loaded DBC file at the given bitrate
+        """
+        return self.model.get_bus_analytics(file_path, bitrate, data_bitrate, stuffing)
+    
+    def search(self, query, limit=1000):
+        """
+        Returns up to limit SearchHit objects matching query in any loaded DBC file
+        """
+        return self.model.search(query, limit)
+    
+    def get_cache_stats(self):
+        """
+        Returns the parsed-DBC cache statistics, or None if caching is disabled
+        """
+        return self.model.get_cache_stats()
+    
     def get_all_dbc_files(self):
         """
         Returns a list of all loaded DBC file paths
         """
-        return self.model.get_all_dbc_files() 
\ No newline at end of file
+        return self.model.get_all_dbc_files() 
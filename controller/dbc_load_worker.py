@@ -0,0 +1,67 @@
+import threading
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from model.dbc_model import LoadCancelled
+
+class DBCLoadSignals(QObject):
+    # QRunnable is not a QObject, so the worker reports through this object
+    progress = pyqtSignal(str, int, str)   # Emits (file_path, percent, stage)
+    finished = pyqtSignal(str, object)     # Emits (file_path, db) when parsing succeeded (a DBCReload for reloads)
+    error = pyqtSignal(str, str)           # Emits (file_path, error message)
+    cancelled = pyqtSignal(str)            # Emits file_path when the load was cancelled
+
+class DBCLoadWorker(QRunnable):
+    """Parses a single DBC file on a QThreadPool thread"""
+    
+    def __init__(self, model, file_path):
+        super().__init__()
+        self.model = model
+        self.file_path = file_path
+        self.signals = DBCLoadSignals()
+        self._cancel_event = threading.Event()
+        # Taken before the file is read, so a change made while it is being
+        # read is noticed by the model's file watcher
+        self.stamp = model.get_file_stamp(file_path)
+    
+    def cancel(self):
+        """Request cancellation; honoured at the next progress step"""
+        self._cancel_event.set()
+    
+    def is_cancelled(self):
+        """Returns True once cancel() has been called"""
+        return self._cancel_event.is_set()
+    
+    def load(self):
+        """Parse the file; returns the object emitted by finished"""
+        return self.model.parse_dbc(
+            self.file_path,
+            progress_callback=lambda percent, stage:
+                self.signals.progress.emit(self.file_path, percent, stage),
+            cancel_check=self.is_cancelled
+        )
+    
+    def run(self):
+        """Parse the file and emit the outcome (runs in the worker thread)"""
+        try:
+            result = self.load()
+        except LoadCancelled:
+            self.signals.cancelled.emit(self.file_path)
+            return
+        except Exception as e:
+            self.signals.error.emit(self.file_path, str(e))
+            return
+        
+        # The parse can't be interrupted, so check once more before handing it over
+        if self.is_cancelled():
+            self.signals.cancelled.emit(self.file_path)
+        else:
+            self.signals.finished.emit(self.file_path, result)
+
+class DBCReloadWorker(DBCLoadWorker):
+    """
+    Parses a changed DBC file again and compares it with the loaded
+    version on a QThreadPool thread; finished emits a DBCReload
+    """
+    
+    def load(self):
+        db = super().load()
+        return self.model.prepare_reload(self.file_path, db)
@@ -0,0 +1,78 @@
+import os
+import shutil
+import tempfile
+import threading
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+class TraceLoadSignals(QObject):
+    # QRunnable is not a QObject, so the worker reports through this object
+    progress = pyqtSignal(str)             # Emits a description of the current stage
+    finished = pyqtSignal(object, object)  # Emits (FrameStore, {Message: SignalTrace})
+    error = pyqtSignal(str)                # Emits an error message
+    cancelled = pyqtSignal()
+
+class TraceLoadWorker(QRunnable):
+    """
+    Opens a CAN trace for plotting on a QThreadPool thread
+    
+    Logs other than frame stores are converted to a frame store in a
+    temporary directory first (removed with remove_temp_directory()); then
+    the overview levels of the plotted signals are built.
+    """
+    
+    def __init__(self, trace_path, signals_by_message):
+        super().__init__()
+        self.trace_path = trace_path
+        self.signals_by_message = signals_by_message  # Message -> [signal name, ...]
+        self.temp_directory = None
+        self.signals = TraceLoadSignals()
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """Request cancellation; honoured between decoding chunks"""
+        self._cancel_event.set()
+    
+    def is_cancelled(self):
+        """Returns True once cancel() has been called"""
+        return self._cancel_event.is_set()
+    
+    def remove_temp_directory(self):
+        """Delete the converted frame store, if one was made"""
+        if self.temp_directory is not None:
+            shutil.rmtree(self.temp_directory, ignore_errors=True)
+            self.temp_directory = None
+    
+    def run(self):
+        """Convert, open and index the trace (runs in the worker thread)"""
+        from model.frame_store import FRAME_STORE_EXTENSION, FrameStore, write_frame_store
+        from model.signal_trace import SignalTrace
+        store = None
+        try:
+            store_path = self.trace_path
+            if not store_path.lower().endswith(FRAME_STORE_EXTENSION):
+                self.signals.progress.emit(f"Converting {os.path.basename(self.trace_path)}...")
+                self.temp_directory = tempfile.mkdtemp(prefix="dbc_master_plot_")
+                store_path = os.path.join(self.temp_directory, "trace" + FRAME_STORE_EXTENSION)
+                write_frame_store(self.trace_path, store_path)
+            
+            store = FrameStore(store_path)
+            traces = {}
+            for message, signal_names in self.signals_by_message.items():
+                self.signals.progress.emit(f"Decoding {message.name}...")
+                trace = SignalTrace(store, message, signal_names)
+                if not trace.build(cancel_check=self.is_cancelled):
+                    break
+                traces[message] = trace
+        except Exception as e:
+            if store is not None:
+                store.close()
+            self.remove_temp_directory()
+            self.signals.error.emit(str(e))
+            return
+        
+        if self.is_cancelled():
+            store.close()
+            self.remove_temp_directory()
+            self.signals.cancelled.emit()
+        else:
+            self.signals.finished.emit(store, traces)
@@ -1,15 +1,108 @@
+import os
 import sys
-from PyQt5.QtWidgets import QApplication
-from view.main_window import MainWindow
+import time
+
+# Taken before the heavy imports so the startup-timing report covers them
+STARTUP_TIME = time.perf_counter()
+
+# Set to "1" to print the startup timing report to stderr, or to a file path
+# to append it there (windowed builds have no console)
+STARTUP_TIMING_ENV = "DBC_MASTER_STARTUP_TIMING"
+
+class StartupTimer:
+    """Records how long each startup phase takes and reports the totals"""
+    
+    def __init__(self, destination=None):
+        self.destination = destination  # None disables the report
+        self.marks = []
+        self.last = STARTUP_TIME
+    
+    def mark(self, phase):
+        """Record the end of a startup phase"""
+        if self.destination is None:
+            return
+        now = time.perf_counter()
+        self.marks.append((phase, now - self.last, now - STARTUP_TIME))
+        self.last = now
+    
+    def report(self):
+        """Write the recorded phases to the destination"""
+        if self.destination is None:
+            return
+        lines = ["Startup timing:"]
+        for phase, duration, total in self.marks:
+            lines.append(f"  {phase:<20} {duration * 1000:8.1f} ms  (total {total * 1000:8.1f} ms)")
+        text = "\n".join(lines) + "\n"
+        if self.destination == "-":
+            if sys.stderr is not None:
+                sys.stderr.write(text)
+        else:
+            with open(self.destination, "a", encoding="utf-8") as f:
+                f.write(text)
+
+def get_startup_timing_destination(argv):
+    """
+    Get where to write the startup timing report, or None if it is off
+    The --startup-timing flag is removed from argv so Qt never sees it
+    """
+    if "--startup-timing" in argv:
+        argv.remove("--startup-timing")
+        return "-"
+    value = os.environ.get(STARTUP_TIMING_ENV)
+    if not value:
+        return None
+    return "-" if value == "1" else value
+
+def get_profile_path(argv):
+    """
+    Get where to write the timing spans, or None if profiling is off
+    --profile PATH is removed from argv so Qt never sees it; the
+    DBC_MASTER_PROFILE environment variable is used otherwise.
+    --profile without a path is a usage error (exit status 2).
+    """
+    if "--profile" in argv:
+        position = argv.index("--profile")
+        path = argv[position + 1] if position + 1 < len(argv) else None
+        if not path or path.startswith("-"):
+            if sys.stderr is not None:
+                sys.stderr.write(f"usage: {os.path.basename(argv[0])} [--startup-timing] "
+                                 "[--profile PATH]\n--profile requires an output path\n")
+            sys.exit(2)
+        del argv[position:position + 2]
+        return path
+    from model.profiling import PROFILE_ENV
+    return os.environ.get(PROFILE_ENV) or None
 
 def main():
+    timer = StartupTimer(get_startup_timing_destination(sys.argv))
+    profile_path = get_profile_path(sys.argv)
+    
+    # Only the widgets needed for the first window are imported up front;
+    # cantools and the DBC views are imported when first used
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QTimer
+    timer.mark("Qt imports")
+    from view.main_window import MainWindow
+    timer.mark("App imports")
+    if profile_path:
+        from model import profiling
+        profiling.enable(profile_path)
+    
     # Create the application
     app = QApplication(sys.argv)
+    timer.mark("QApplication")
     
     # Create and show the main window
     window = MainWindow()
+    timer.mark("MainWindow")
     window.show()
     
+    # The first event loop pass paints the window
+    def on_first_event_loop_pass():
+        timer.mark("Window shown")
+        timer.report()
+    QTimer.singleShot(0, on_first_event_loop_pass)
+    
     # Start the event loop
     sys.exit(app.exec_())
 
@@ -0,0 +1,257 @@
+"""
+Bus load and bit layout analytics of a DBC database
+
+Bus load is estimated from the message metadata alone: every message with
+a cycle time is assumed to be sent once per cycle at its worst-case frame
+length, the number of bits on the wire including the largest possible
+number of stuff bits. Messages are grouped by bus name; messages without a
+cycle time cannot be scheduled and are only counted.
+
+The bit layout of a message is checked with integer bit masks, one bit per
+payload bit in the DBC's byte-wise numbering (bit 8 * byte + bit in byte),
+so a message costs a few integer operations per signal whatever its
+length. Multiplexed signals only conflict with signals present in the same
+frame: the unmultiplexed signals and those of the same multiplexer value.
+"""
+
+import time
+
+# Bitrates offered by default, in bit/s
+COMMON_BITRATES = [125000, 250000, 500000, 1000000]
+DEFAULT_BITRATE = 500000
+
+# Bus name used for messages without one
+DEFAULT_BUS = ""
+
+# Payload lengths a CAN FD frame can have
+FD_LENGTHS = [0, 1, 2, 3, 4, 5, 6, 7, 8, 12, 16, 20, 24, 32, 48, 64]
+
+def classic_frame_bits(length, extended=False, stuffing=True):
+    """
+    Worst-case number of bits of a classic CAN frame, interframe space included
+    
+    Of the 34 (standard) or 54 (extended) overhead bits plus the data,
+    everything from the start of frame to the end of the CRC is subject to
+    bit stuffing, which adds at most one bit per four after the first.
+    """
+    length = min(length, 8)
+    stuffed = (54 if extended else 34) + 8 * length
+    bits = stuffed + 13  # CRC delimiter, ACK slot and delimiter, EOF and interframe space
+    if stuffing:
+        bits += (stuffed - 1) // 4
+    return bits
+
+def fd_frame_length(length):
+    """Get the payload length of the smallest CAN FD frame holding length bytes"""
+    for fd_length in FD_LENGTHS:
+        if fd_length >= length:
+            return fd_length
+    return FD_LENGTHS[-1]
+
+def fd_frame_bits(length, extended=False, stuffing=True):
+    """
+    Worst-case (arbitration phase bits, data phase bits) of a CAN FD frame
+    
+    The arbitration phase runs at the nominal bitrate and the data phase
+    (ESI to CRC) at the data bitrate, when bitrate switching is used. The
+    CRC field has fixed stuff bits, one per four bits, whether or not
+    stuffing is counted.
+    """
+    length = fd_frame_length(length)
+    arbitration = 36 if extended else 17  # SOF to BRS
+    data = 5 + 8 * length                 # ESI, DLC and data
+    crc = 4 + (17 if length <= 16 else 21)  # Stuff count and CRC
+    if stuffing:
+        arbitration += (arbitration - 1) // 4
+        data += data // 4
+    data += crc + (crc + 3) // 4
+    # CRC delimiter, ACK slot and delimiter, EOF and interframe space
+    return arbitration + 13, data
+
+class MessageLoad:
+    """Worst-case bus load of one periodic message"""
+    
+    __slots__ = ('message', 'bus', 'frame_bits', 'frame_time', 'load')
+    
+    def __init__(self, message, bus, frame_bits, frame_time, load):
+        self.message = message
+        self.bus = bus
+        self.frame_bits = frame_bits  # Bits on the wire per frame
+        self.frame_time = frame_time  # Seconds on the wire per frame
+        self.load = load              # Fraction of the bus time used
+
+class BusLoad:
+    """Worst-case load of one bus"""
+    
+    def __init__(self, name, bitrate):
+        self.name = name
+        self.bitrate = bitrate
+        self.load = 0.0              # Fraction of the bus time used by periodic messages
+        self.bits_per_second = 0.0
+        self.messages = 0            # Periodic messages
+        self.unscheduled = 0         # Messages without a cycle time
+    
+    def display_name(self):
+        return self.name or "(no bus name)"
+
+class MessageLayout:
+    """Bit layout of a message's payload"""
+    
+    __slots__ = ('message', 'used_bits', 'unused_bits', 'unused_ranges', 'overlaps',
+                 'out_of_range')
+    
+    def __init__(self, message):
+        self.message = message
+        self.used_bits = 0
+        self.unused_bits = 0
+        self.unused_ranges = []  # [(first bit, last bit), ...] in DBC bit numbering
+        self.overlaps = []       # [(signal name, signal name, shared bits), ...]
+        self.out_of_range = []   # Names of signals with bits past the message length
+    
+    def has_issues(self):
+        return bool(self.overlaps or self.out_of_range)
+
+def signal_bit_mask(signal):
+    """
+    Get the payload bits of a signal as an integer with bit 8 * byte + bit
+    set for every bit it occupies
+    """
+    start = signal.start
+    length = signal.length
+    if signal.byte_order == 'little_endian':
+        return ((1 << length) - 1) << start
+    # Big endian signals start at their most significant bit and continue
+    # from bit 7 of the next byte
+    mask = 0
+    byte, high = divmod(start, 8)
+    remaining = length
+    while remaining > 0:
+        count = min(remaining, high + 1)
+        mask |= ((1 << count) - 1) << (byte * 8 + high - count + 1)
+        remaining -= count
+        byte += 1
+        high = 7
+    return mask
+
+def bit_ranges(mask):
+    """Get the runs of set bits of a mask as [(first bit, last bit), ...]"""
+    ranges = []
+    bit = 0
+    while mask:
+        # Skip the clear bits, then the run of set bits
+        skip = (mask & -mask).bit_length() - 1
+        mask >>= skip
+        bit += skip
+        run = (~mask & (mask + 1)).bit_length() - 1
+        ranges.append((bit, bit + run - 1))
+        mask >>= run
+        bit += run
+    return ranges
+
+def analyze_layout(message):
+    """Check the bit layout of a message for overlapping, unused and out of range bits"""
+    layout = MessageLayout(message)
+    payload = (1 << (8 * message.length)) - 1
+    
+    # Signals sent in every frame, and per (multiplexer, value) the others
+    always = []
+    multiplexed = {}
+    for signal in message.signals:
+        mask = signal_bit_mask(signal)
+        if mask & ~payload:
+            layout.out_of_range.append(signal.name)
+        multiplexer = getattr(signal, 'multiplexer_signal', None)
+        multiplexer_ids = getattr(signal, 'multiplexer_ids', None)
+        if multiplexer and multiplexer_ids:
+            for multiplexer_id in multiplexer_ids:
+                multiplexed.setdefault((multiplexer, multiplexer_id), []).append((signal, mask))
+        else:
+            always.append((signal, mask))
+    
+    used = 0
+    reported = set()
+    for group in [always] + [always + signals for signals in multiplexed.values()]:
+        group_used = 0
+        for index, (signal, mask) in enumerate(group):
+            if group_used & mask:
+                # Rare: find which of the earlier signals it shares bits with
+                for other, other_mask in group[:index]:
+                    shared = other_mask & mask
+                    pair = (other.name, signal.name)
+                    if shared and pair not in reported:
+                        reported.add(pair)
+                        layout.overlaps.append((other.name, signal.name, bin(shared).count("1")))
+            group_used |= mask
+        used |= group_used
+    
+    used &= payload
+    layout.used_bits = bin(used).count("1")
+    unused = payload & ~used
+    layout.unused_bits = 8 * message.length - layout.used_bits
+    layout.unused_ranges = bit_ranges(unused)
+    return layout
+
+class BusAnalytics:
+    """Bus loads, per-message loads and bit layouts of a database"""
+    
+    def __init__(self, bitrate, data_bitrate, stuffing):
+        self.bitrate = bitrate
+        self.data_bitrate = data_bitrate
+        self.stuffing = stuffing
+        self.buses = {}          # Bus name -> BusLoad
+        self.message_loads = []  # MessageLoad of periodic messages, largest first
+        self.layouts = []        # MessageLayout per message, in database order
+        self.elapsed = 0.0
+    
+    def top_contributors(self, count=20):
+        """Get the MessageLoad of the count messages loading their bus the most"""
+        return self.message_loads[:count]
+    
+    def layout_issues(self):
+        """Get the layouts with overlapping or out of range signals"""
+        return [layout for layout in self.layouts if layout.has_issues()]
+
+def analyze_database(db, bitrate=DEFAULT_BITRATE, data_bitrate=None, stuffing=True,
+                     layouts=None):
+    """
+    Estimate the worst-case bus load of a database and check its bit layouts
+    
+    bitrate is the nominal (arbitration) bitrate in bit/s and data_bitrate
+    the CAN FD data phase bitrate (default: no bitrate switching). Bit
+    layouts do not depend on the bitrate; pass the layouts of an earlier
+    analysis to reuse them.
+    """
+    started = time.perf_counter()
+    data_bitrate = data_bitrate or bitrate
+    analytics = BusAnalytics(bitrate, data_bitrate, stuffing)
+    
+    for msg in db.messages:
+        bus_name = getattr(msg, 'bus_name', None) or DEFAULT_BUS
+        bus = analytics.buses.get(bus_name)
+        if bus is None:
+            bus = analytics.buses[bus_name] = BusLoad(bus_name, bitrate)
+        cycle_time = getattr(msg, 'cycle_time', None)
+        if not cycle_time or cycle_time <= 0:
+            bus.unscheduled += 1
+            continue
+        
+        extended = bool(getattr(msg, 'is_extended_frame', False))
+        if getattr(msg, 'is_fd', False):
+            nominal_bits, data_bits = fd_frame_bits(msg.length, extended, stuffing)
+            frame_bits = nominal_bits + data_bits
+            frame_time = nominal_bits / bitrate + data_bits / data_bitrate
+        else:
+            frame_bits = classic_frame_bits(msg.length, extended, stuffing)
+            frame_time = frame_bits / bitrate
+        frequency = 1000.0 / cycle_time
+        load = frame_time * frequency
+        analytics.message_loads.append(MessageLoad(msg, bus_name, frame_bits, frame_time, load))
+        bus.load += load
+        bus.bits_per_second += frame_bits * frequency
+        bus.messages += 1
+    
+    analytics.message_loads.sort(key=lambda message_load: message_load.load, reverse=True)
+    analytics.layouts = layouts if layouts is not None else [
+        analyze_layout(msg) for msg in db.messages]
+    analytics.elapsed = time.perf_counter() - started
+    return analytics
@@ -0,0 +1,106 @@
+import os
+import threading
+
+class DBCCache:
+    """
+    On-disk cache of parsed DBC databases
+    
+    Entries are keyed by the file's path, modification time, size and
+    content hash, so any change to the file produces a miss. The cache is
+    capped in size and evicts the least recently used databases first.
+    """
+    
+    DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "dbc_master", "parsed_dbc")
+    DEFAULT_SIZE_LIMIT = 1024 * 1024 * 1024  # 1 GiB
+    
+    # Bump when the pickled layout of cached entries changes
+    CACHE_VERSION = 1
+    
+    def __init__(self, directory=None, size_limit=DEFAULT_SIZE_LIMIT):
+        self.directory = directory or os.environ.get("DBC_MASTER_CACHE_DIR", self.DEFAULT_DIRECTORY)
+        self.size_limit = size_limit
+        self._cache = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def cache(self):
+        """The underlying diskcache.Cache, opened on first use"""
+        with self._lock:
+            if self._cache is None:
+                # Imported here so that creating a DBCCache stays cheap at startup
+                import diskcache
+                self._cache = diskcache.Cache(
+                    self.directory,
+                    size_limit=self.size_limit,
+                    eviction_policy='least-recently-used'
+                )
+            return self._cache
+    
+    def make_key(self, file_path, content_hash):
+        """
+        Builds the cache key for a file whose contents hash to content_hash
+        """
+        stat = os.stat(file_path)
+        return (self.CACHE_VERSION, os.path.abspath(file_path),
+                stat.st_mtime_ns, stat.st_size, content_hash)
+    
+    def get(self, key):
+        """
+        Returns the cached database for key, or None on a miss
+        """
+        try:
+            db = self.cache.get(key)
+        except Exception:
+            # A corrupt or unreadable entry is just a miss
+            db = None
+        
+        with self._lock:
+            if db is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return db
+    
+    def put(self, key, db):
+        """
+        Stores a parsed database under key
+        Returns True if the database was cached
+        """
+        try:
+            return self.cache.set(key, db)
+        except Exception:
+            # Caching is best effort; a failed write never fails the load
+            return False
+    
+    def clear(self):
+        """
+        Removes every cached database and resets the statistics
+        """
+        self.cache.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+    
+    def get_stats(self):
+        """
+        Returns a dictionary with hit/miss counts and the cache size in bytes
+        """
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'size': self.cache.volume(),
+            'size_limit': self.size_limit,
+        }
+    
+    def close(self):
+        """
+        Closes the underlying cache
+        """
+        with self._lock:
+            if self._cache is not None:
+                self._cache.close()
+                self._cache = None
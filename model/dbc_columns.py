@@ -0,0 +1,137 @@
+"""
+Column definitions shared by the message and signal tables
+
+Kept free of any Qt imports so the same values can be produced without a GUI.
+"""
+
+MESSAGE_COLUMNS = [
+    "ID (HEX)", "Name", "Length (Bytes)", "Signals",
+    "Extended Frame", "Cycle Time (ms)", "Senders",
+    "Bus Name", "Comment"
+]
+
+def get_message_column_value(msg, col):
+    """Get the value for a specific column from a message object"""
+    if col == 0:  # ID (HEX)
+        return f"0x{msg.frame_id:X}"
+    elif col == 1:  # Name
+        return msg.name
+    elif col == 2:  # Length
+        return str(msg.length)
+    elif col == 3:  # Signal count
+        return str(len(msg.signals))
+    elif col == 4:  # Extended Frame
+        return "Yes" if getattr(msg, 'is_extended_frame', False) else "No"
+    elif col == 5:  # Cycle Time
+        cycle_time = getattr(msg, 'cycle_time', None)
+        return str(cycle_time) if cycle_time is not None else "N/A"
+    elif col == 6:  # Senders
+        senders = getattr(msg, 'senders', [])
+        return ", ".join(senders) if senders else "N/A"
+    elif col == 7:  # Bus Name
+        bus_name = getattr(msg, 'bus_name', None)
+        return bus_name if bus_name else "N/A"
+    elif col == 8:  # Comment
+        comment = getattr(msg, 'comment', None)
+        return comment if comment else ""
+    
+    return ""
+
+def get_message_display_value(msg, col):
+    """Get the text shown in the messages table for a column"""
+    if col == 3:  # Signal count
+        signal_count = len(msg.signals)
+        return f"{signal_count} signal{'s' if signal_count != 1 else ''}"
+    return get_message_column_value(msg, col)
+
+# Message columns holding numbers: ID, length, signal count, cycle time
+MESSAGE_NUMERIC_COLUMNS = [0, 2, 3, 5]
+
+def get_message_numeric_value(msg, col):
+    """Get the number behind a numeric message column, None if missing"""
+    if col == 0:  # ID, rather than its hex text
+        return msg.frame_id
+    elif col == 2:  # Length
+        return msg.length
+    elif col == 3:  # Signal count
+        return len(msg.signals)
+    elif col == 5:  # Cycle Time
+        return getattr(msg, 'cycle_time', None)
+    return None
+
+SIGNAL_COLUMNS = [
+    "Signal Name", "Message", "Start Bit", "Length",
+    "Byte Order", "Signed", "Initial", "Scale", "Offset",
+    "Min Value", "Max Value", "Unit", "Multiplexer",
+    "Choices", "Comment", "Receivers"
+]
+
+# Signal columns holding numbers: Start bit, length, scale, offset, min, max
+SIGNAL_NUMERIC_COLUMNS = [2, 3, 7, 8, 9, 10]
+
+def format_number(value):
+    """Format a numeric signal attribute as str() does, blank if it is missing"""
+    if value is None:
+        return ""
+    return str(value)
+
+def get_message_label(msg):
+    """Get the "name (0xID)" label used for a message in the signals table"""
+    return f"{msg.name} (0x{msg.frame_id:X})"
+
+def get_multiplexer_text(signal):
+    """Describe a signal's multiplexing"""
+    multiplexer_signal = getattr(signal, 'multiplexer_signal', None)
+    multiplexer_ids = getattr(signal, 'multiplexer_ids', [])
+    if multiplexer_signal:
+        return f"Dependent on: {multiplexer_signal}"
+    elif multiplexer_ids:
+        return f"Is multiplexer, IDs: {multiplexer_ids}"
+    return ""
+
+def get_choices_text(signal):
+    """Describe a signal's choices (enum values) as "value=name" pairs"""
+    choices = getattr(signal, 'choices', None)
+    if not choices:
+        return ""
+    return ", ".join(f"{value}={name}" for value, name in choices.items())
+
+def get_signal_column_value(signal, msg, col):
+    """Get the value for a specific column from a signal and its message"""
+    if col == 0:  # Signal Name
+        return signal.name
+    elif col == 1:  # Message
+        return get_message_label(msg)
+    elif col == 2:  # Start Bit
+        return str(signal.start)
+    elif col == 3:  # Length
+        return str(signal.length)
+    elif col == 4:  # Byte Order
+        return getattr(signal, 'byte_order', "Unknown")
+    elif col == 5:  # Signed
+        return "Yes" if getattr(signal, 'is_signed', False) else "No"
+    elif col == 6:  # Initial Value
+        return format_number(getattr(signal, 'initial', None))
+    elif col == 7:  # Scale
+        return format_number(getattr(signal, 'scale', 1.0))
+    elif col == 8:  # Offset
+        return format_number(getattr(signal, 'offset', 0.0))
+    elif col == 9:  # Min Value
+        return format_number(getattr(signal, 'minimum', None))
+    elif col == 10:  # Max Value
+        return format_number(getattr(signal, 'maximum', None))
+    elif col == 11:  # Unit
+        unit = getattr(signal, 'unit', "")
+        return unit if unit else ""
+    elif col == 12:  # Multiplexer
+        return get_multiplexer_text(signal)
+    elif col == 13:  # Choices
+        return get_choices_text(signal)
+    elif col == 14:  # Comment
+        comment = getattr(signal, 'comment', "")
+        return comment if comment else ""
+    elif col == 15:  # Receivers
+        receivers = getattr(signal, 'receivers', [])
+        return ", ".join(receivers) if receivers else ""
+    
+    return ""
@@ -0,0 +1,246 @@
+"""
+Structural diff of two loaded DBC databases
+
+Messages are paired by name through the databases' DBCIndex (a message
+that was only renamed is paired by frame ID), and signals by name within
+their message. Every message and signal is reduced to a canonical
+signature, a tuple of its attributes with lists and choices in a fixed
+order, so unchanged items, the vast majority between two revisions, cost
+one tuple comparison. Only differing signatures are compared field by
+field.
+"""
+
+import time
+from model.dbc_index import DBCIndex
+
+# Kinds of change
+CHANGE_ADDED = "Added"
+CHANGE_REMOVED = "Removed"
+CHANGE_CHANGED = "Changed"
+
+# Categories of changed fields
+CATEGORY_LAYOUT = "Layout"      # Where the bits are: start, length, byte order, signedness
+CATEGORY_SCALING = "Scaling"    # How raw values map to physical ones
+CATEGORY_ATTRIBUTE = "Attribute"
+
+def _sorted_tuple(values):
+    return tuple(sorted(values)) if values else ()
+
+def _choices(signal):
+    choices = getattr(signal, 'choices', None)
+    if not choices:
+        return ()
+    return tuple(sorted((int(value), str(label)) for value, label in choices.items()))
+
+# (field name, category) of the compared attributes, in signature order
+MESSAGE_FIELDS = [
+    ("Name", CATEGORY_ATTRIBUTE),
+    ("Frame ID", CATEGORY_LAYOUT),
+    ("Extended Frame", CATEGORY_LAYOUT),
+    ("Length", CATEGORY_LAYOUT),
+    ("Cycle Time", CATEGORY_ATTRIBUTE),
+    ("Senders", CATEGORY_ATTRIBUTE),
+    ("Bus Name", CATEGORY_ATTRIBUTE),
+    ("Comment", CATEGORY_ATTRIBUTE),
+]
+
+SIGNAL_FIELDS = [
+    ("Start Bit", CATEGORY_LAYOUT),
+    ("Length", CATEGORY_LAYOUT),
+    ("Byte Order", CATEGORY_LAYOUT),
+    ("Signed", CATEGORY_LAYOUT),
+    ("Float", CATEGORY_LAYOUT),
+    ("Multiplexer", CATEGORY_LAYOUT),
+    ("Multiplexer IDs", CATEGORY_LAYOUT),
+    ("Scale", CATEGORY_SCALING),
+    ("Offset", CATEGORY_SCALING),
+    ("Min Value", CATEGORY_SCALING),
+    ("Max Value", CATEGORY_SCALING),
+    ("Unit", CATEGORY_SCALING),
+    ("Initial", CATEGORY_ATTRIBUTE),
+    ("Choices", CATEGORY_ATTRIBUTE),
+    ("Comment", CATEGORY_ATTRIBUTE),
+    ("Receivers", CATEGORY_ATTRIBUTE),
+]
+
+def message_signature(msg):
+    """Canonical tuple of a message's own attributes (not its signals), in MESSAGE_FIELDS order"""
+    return (
+        msg.name,
+        msg.frame_id,
+        bool(getattr(msg, 'is_extended_frame', False)),
+        msg.length,
+        getattr(msg, 'cycle_time', None),
+        _sorted_tuple(getattr(msg, 'senders', None)),
+        getattr(msg, 'bus_name', None) or "",
+        getattr(msg, 'comment', None) or "",
+    )
+
+def signal_signature(signal):
+    """Canonical tuple of a signal's attributes, in SIGNAL_FIELDS order"""
+    return (
+        signal.start,
+        signal.length,
+        getattr(signal, 'byte_order', None),
+        bool(getattr(signal, 'is_signed', False)),
+        bool(getattr(signal, 'is_float', False)),
+        getattr(signal, 'multiplexer_signal', None) or "",
+        _sorted_tuple(getattr(signal, 'multiplexer_ids', None)),
+        getattr(signal, 'scale', 1),
+        getattr(signal, 'offset', 0),
+        getattr(signal, 'minimum', None),
+        getattr(signal, 'maximum', None),
+        getattr(signal, 'unit', None) or "",
+        getattr(signal, 'initial', None),
+        _choices(signal),
+        getattr(signal, 'comment', None) or "",
+        _sorted_tuple(getattr(signal, 'receivers', None)),
+    )
+
+def database_signatures(db):
+    """
+    Get Message -> (message signature, ((signal name, signal signature), ...))
+    for every message of a database; equal values mean identical messages
+    """
+    return {msg: (message_signature(msg),
+                  tuple((signal.name, signal_signature(signal)) for signal in msg.signals))
+            for msg in db.messages}
+
+def _field_changes(fields, old_signature, new_signature):
+    """Get (field, category, old, new) for every field that differs"""
+    return [(name, category, old, new)
+            for (name, category), old, new in zip(fields, old_signature, new_signature)
+            if old != new]
+
+class DiffEntry:
+    """
+    One reported difference
+    
+    signal is None for message-level entries; field, category, old_value
+    and new_value are only set on CHANGE_CHANGED entries.
+    """
+    
+    __slots__ = ('kind', 'message', 'signal', 'field', 'category', 'old_value', 'new_value')
+    
+    def __init__(self, kind, message, signal=None, field=None, category=None,
+                 old_value=None, new_value=None):
+        self.kind = kind
+        self.message = message      # Message name (the new name of a renamed message)
+        self.signal = signal        # Signal name
+        self.field = field
+        self.category = category
+        self.old_value = old_value
+        self.new_value = new_value
+    
+    def __repr__(self):
+        target = self.message if self.signal is None else f"{self.message}.{self.signal}"
+        if self.kind != CHANGE_CHANGED:
+            return f"<{self.kind} {target}>"
+        return f"<{self.kind} {target} {self.field}: {self.old_value!r} -> {self.new_value!r}>"
+
+class DBCDiff:
+    """Differences between an old and a new database, in message order"""
+    
+    def __init__(self):
+        self.entries = []
+        self.messages_added = 0
+        self.messages_removed = 0
+        self.messages_changed = 0
+        self.signals_added = 0
+        self.signals_removed = 0
+        self.signals_changed = 0
+        self.message_pairs = {}  # New Message -> old Message, for messages in both databases
+        self.elapsed = 0.0
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def is_empty(self):
+        return not self.entries
+    
+    def summary(self):
+        """One-line description of the counts"""
+        return (f"Messages: {self.messages_added} added, {self.messages_removed} removed, "
+                f"{self.messages_changed} changed; Signals: {self.signals_added} added, "
+                f"{self.signals_removed} removed, {self.signals_changed} changed")
+
+def diff_databases(old_db, new_db, old_index=None, new_index=None):
+    """
+    Compare two cantools databases
+    Returns a DBCDiff listing added, removed and changed messages and
+    signals, with one entry per changed field. The indexes keep the
+    signatures, so comparing a database again skips computing them.
+    """
+    started = time.perf_counter()
+    old_index = old_index or DBCIndex(old_db)
+    new_index = new_index or DBCIndex(new_db)
+    old_signatures = old_index.get_signatures()
+    new_signatures = new_index.get_signatures()
+    diff = DBCDiff()
+    
+    # Pair messages by name, then pair leftovers that kept their frame ID
+    # (standard and extended frames with the same number never pair)
+    pairs = {}
+    for msg in new_db.messages:
+        old_msg = old_index.get_message_by_name(msg.name)
+        if old_msg is not None:
+            pairs[msg] = old_msg
+    paired_old = set(pairs.values())
+    unpaired_by_frame_id = {(msg.frame_id, bool(msg.is_extended_frame)): msg
+                            for msg in old_db.messages if msg not in paired_old}
+    for msg in new_db.messages:
+        if msg not in pairs:
+            old_msg = unpaired_by_frame_id.pop((msg.frame_id, bool(msg.is_extended_frame)), None)
+            if old_msg is not None:
+                pairs[msg] = old_msg
+    paired_old = set(pairs.values())
+    diff.message_pairs = pairs
+    
+    for msg in old_db.messages:
+        if msg not in paired_old:
+            diff.entries.append(DiffEntry(CHANGE_REMOVED, msg.name))
+            diff.messages_removed += 1
+    
+    for msg in new_db.messages:
+        old_msg = pairs.get(msg)
+        if old_msg is None:
+            diff.entries.append(DiffEntry(CHANGE_ADDED, msg.name))
+            diff.messages_added += 1
+            continue
+        old_signature = old_signatures[old_msg]
+        new_signature = new_signatures[msg]
+        if old_signature == new_signature:
+            continue
+        if _diff_message(diff, msg.name, old_signature, new_signature):
+            diff.messages_changed += 1
+    
+    diff.elapsed = time.perf_counter() - started
+    return diff
+
+def _diff_message(diff, name, old_signatures, new_signatures):
+    """Append the differences of a message pair; returns True if there were any"""
+    count = len(diff.entries)
+    old_message, old_signals = old_signatures
+    new_message, new_signals = new_signatures
+    if old_message != new_message:
+        for field, category, old, new in _field_changes(MESSAGE_FIELDS, old_message, new_message):
+            diff.entries.append(DiffEntry(CHANGE_CHANGED, name, None, field, category, old, new))
+    
+    old_by_name = dict(old_signals)
+    new_names = set()
+    for signal_name, new_signature in new_signals:
+        new_names.add(signal_name)
+        old_signature = old_by_name.get(signal_name)
+        if old_signature is None:
+            diff.entries.append(DiffEntry(CHANGE_ADDED, name, signal_name))
+            diff.signals_added += 1
+        elif old_signature != new_signature:
+            for field, category, old, new in _field_changes(SIGNAL_FIELDS, old_signature, new_signature):
+                diff.entries.append(DiffEntry(CHANGE_CHANGED, name, signal_name,
+                                              field, category, old, new))
+            diff.signals_changed += 1
+    for signal_name, _ in old_signals:
+        if signal_name not in new_names:
+            diff.entries.append(DiffEntry(CHANGE_REMOVED, name, signal_name))
+            diff.signals_removed += 1
+    return len(diff.entries) > count
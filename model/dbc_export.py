@@ -0,0 +1,69 @@
+"""
+Export of the message and signal tables to CSV and JSON
+
+Rows hold the same text the GUI tables show. Like dbc_columns, this module
+must not import Qt, so it can run on machines without a display.
+"""
+
+import csv
+import json
+from model.dbc_columns import MESSAGE_COLUMNS, SIGNAL_COLUMNS, get_message_column_value
+
+EXPORT_TABLES = ("messages", "signals")
+EXPORT_FORMATS = ("csv", "json")
+
+# Column added in front of every row, naming the DBC file it came from
+FILE_COLUMN = "DBC File"
+
+def get_table_columns(table):
+    """Get the column names of the 'messages' or 'signals' table"""
+    if table == "messages":
+        return list(MESSAGE_COLUMNS)
+    if table == "signals":
+        return list(SIGNAL_COLUMNS)
+    raise ValueError(f"Unknown table: {table}")
+
+def iter_message_rows(db):
+    """Yield the messages table rows of a database, one list of texts per message"""
+    for msg in db.messages:
+        yield [get_message_column_value(msg, col) for col in range(len(MESSAGE_COLUMNS))]
+
+def iter_signal_rows(store):
+    """Yield the signals table rows of a SignalStore, in store (name) order"""
+    for row in range(len(store)):
+        yield [store.text(row, col) for col in range(len(SIGNAL_COLUMNS))]
+
+def iter_table_rows(model, file_path, table):
+    """Yield the rows of a table for a DBC loaded in a DBCModel"""
+    if table == "messages":
+        return iter_message_rows(model.get_dbc(file_path))
+    if table == "signals":
+        return iter_signal_rows(model.get_signal_store(file_path))
+    raise ValueError(f"Unknown table: {table}")
+
+def export_table(model, file_paths, table, output, export_format="csv"):
+    """
+    Write a table of several loaded DBC files to the open text file output
+    Each row starts with the DBC file it came from. Returns the row count.
+    """
+    columns = [FILE_COLUMN] + get_table_columns(table)
+    count = 0
+    if export_format == "csv":
+        writer = csv.writer(output)
+        writer.writerow(columns)
+        for file_path in file_paths:
+            for row in iter_table_rows(model, file_path, table):
+                writer.writerow([file_path] + row)
+                count += 1
+    elif export_format == "json":
+        # Written record by record, so the whole table never sits in memory
+        output.write("[")
+        for file_path in file_paths:
+            for row in iter_table_rows(model, file_path, table):
+                output.write(",\n" if count else "\n")
+                output.write(json.dumps(dict(zip(columns, [file_path] + row)), ensure_ascii=False))
+                count += 1
+        output.write("\n]\n")
+    else:
+        raise ValueError(f"Unknown export format: {export_format}")
+    return count
@@ -0,0 +1,62 @@
+class DBCIndex:
+    """
+    Lookup indexes over a loaded database, built once
+    
+    Replaces linear scans of db.messages and msg.signals with dictionary
+    lookups keyed by message name, frame ID and (message, signal) names.
+    A standard and an extended frame with the same number are different
+    messages, so frame IDs are keyed together with their kind.
+    """
+    
+    def __init__(self, db):
+        self.db = db
+        self.messages_by_name = {}
+        self.messages_by_frame_id = {}   # (frame ID, is extended) -> Message
+        self.message_positions = {}      # Message -> position in db.messages
+        self.signals_by_name = {}        # (message name, signal name) -> Signal
+        self.messages_by_signal_name = {}  # signal name -> [Message, ...]
+        self.signatures = None           # Message -> canonical signature, see dbc_diff
+        
+        for position, msg in enumerate(db.messages):
+            self.messages_by_name[msg.name] = msg
+            self.messages_by_frame_id[(msg.frame_id, bool(msg.is_extended_frame))] = msg
+            self.message_positions[msg] = position
+            for signal in msg.signals:
+                self.signals_by_name[(msg.name, signal.name)] = signal
+                self.messages_by_signal_name.setdefault(signal.name, []).append(msg)
+    
+    def get_message_by_name(self, name):
+        """Returns the message with the given name, or None"""
+        return self.messages_by_name.get(name)
+    
+    def get_message_by_frame_id(self, frame_id, extended=None):
+        """
+        Returns the message with the given frame ID, or None
+        extended selects extended or standard frames; None takes either,
+        the standard frame first if the database has both
+        """
+        if extended is not None:
+            return self.messages_by_frame_id.get((frame_id, bool(extended)))
+        msg = self.messages_by_frame_id.get((frame_id, False))
+        if msg is None:
+            msg = self.messages_by_frame_id.get((frame_id, True))
+        return msg
+    
+    def get_signal(self, message_name, signal_name):
+        """Returns the named signal of the named message, or None"""
+        return self.signals_by_name.get((message_name, signal_name))
+    
+    def get_messages_with_signal(self, signal_name):
+        """Returns every message containing a signal with the given name"""
+        return list(self.messages_by_signal_name.get(signal_name, []))
+    
+    def get_signatures(self):
+        """Returns the canonical signatures of every message, computed on first use"""
+        if self.signatures is None:
+            from model.dbc_diff import database_signatures
+            self.signatures = database_signatures(self.db)
+        return self.signatures
+    
+    def get_message_position(self, msg):
+        """Returns the position of a message in db.messages, or -1"""
+        return self.message_positions.get(msg, -1)
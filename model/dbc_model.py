@@ -1,8 +1,45 @@
-import cantools
+import os
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from model.dbc_cache import DBCCache
+from model.dbc_index import DBCIndex
+from model.dbc_reload import DBCFileWatcher, get_file_stamp
+from model.filter_engine import LowercaseColumns
+from model.dbc_columns import get_message_column_value
+from model.profiling import timed, span, set_rows
+
+# cantools and the NumPy-backed SignalStore are imported on first use:
+# together they take longer to import than the rest of the application
+
+class LoadCancelled(Exception):
+    """Raised when a DBC load is cancelled before it finishes"""
+
+def _parse_dbc_in_process(file_path, cache_directory, cache_size_limit):
+    """Parses a DBC file in a worker process, sharing the on-disk cache"""
+    cache = None
+    if cache_directory is not None:
+        cache = DBCCache(cache_directory, cache_size_limit)
+    return DBCModel(use_cache=cache is not None, cache=cache).parse_dbc(file_path)
 
 class DBCModel:
-    def __init__(self):
+    # Size of the chunks used when reading a DBC file, so that progress can
+    # be reported and cancellation checked while the file is being read
+    READ_CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, use_cache=True, cache=None):
         self.dbc_files = {}  # Dictionary to store multiple DBC files
+        self.signal_stores = {}  # Columnar signal stores, built on first use
+        self.dbc_indexes = {}  # Lookup indexes, built on first use
+        self.filter_columns = {}  # Lowercase table text for filtering, built on first use
+        self.message_sort_keys = {}  # Typed sort keys of the messages table, built on first use
+        self.search_index = None  # SearchIndex over every loaded file, built on first search
+        self.bit_layouts = {}  # Per-message bit layout checks, built on first analysis
+        self.file_watcher = DBCFileWatcher()  # Notices loaded files changing on disk
+        
+        # Persistent cache of parsed databases (None disables caching)
+        if cache is None and use_cache:
+            cache = DBCCache()
+        self.cache = cache
         
     def load_dbc(self, file_path):
         """
@@ -10,11 +47,114 @@ class DBCModel:
         Returns (True, None) if successful, (False, error_message) otherwise
         """
         try:
-            db = cantools.database.load_file(file_path)
-            self.dbc_files[file_path] = db
+            db = self.parse_dbc(file_path)
+            self.add_dbc(file_path, db)
             return True, None
         except Exception as e:
             return False, str(e)
+    
+    def load_dbcs_parallel(self, file_paths, max_workers=None):
+        """
+        Loads several DBC files, parsing them in parallel worker processes
+        Returns a dictionary of file path -> error message for the files
+        that failed to load; the others are added to the model
+        """
+        file_paths = list(dict.fromkeys(file_paths))
+        errors = {}
+        if len(file_paths) <= 1 or max_workers == 1:
+            for file_path in file_paths:
+                success, error = self.load_dbc(file_path)
+                if not success:
+                    errors[file_path] = error
+            return errors
+        
+        cache_directory = self.cache.directory if self.cache is not None else None
+        cache_size_limit = self.cache.size_limit if self.cache is not None else None
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                file_path: executor.submit(_parse_dbc_in_process, file_path,
+                                           cache_directory, cache_size_limit)
+                for file_path in file_paths
+            }
+            # Add results in the order the files were given
+            for file_path, future in futures.items():
+                try:
+                    self.add_dbc(file_path, future.result())
+                except Exception as e:
+                    errors[file_path] = str(e)
+        return errors
+    
+    @timed("DBCModel.parse_dbc")
+    def parse_dbc(self, file_path, progress_callback=None, cancel_check=None):
+        """
+        Parses a DBC file without storing it in the model
+        progress_callback(percent, stage) is called as the load advances and
+        cancel_check() is polled between steps; LoadCancelled is raised if it
+        returns True. Safe to call from a worker thread.
+        """
+        def report(percent, stage):
+            if cancel_check and cancel_check():
+                raise LoadCancelled(f"Loading cancelled: {file_path}")
+            if progress_callback:
+                progress_callback(percent, stage)
+        
+        report(0, "Reading")
+        
+        # Read the file in chunks, hashing as we go - the first half of the progress range
+        total_size = max(os.path.getsize(file_path), 1)
+        chunks = []
+        read_size = 0
+        content_hash = hashlib.blake2b(digest_size=32)
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(self.READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                content_hash.update(chunk)
+                read_size += len(chunk)
+                report(int(50 * read_size / total_size), "Reading")
+        
+        # An unchanged file can be taken straight from the cache
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(file_path, content_hash.hexdigest())
+            db = self.cache.get(cache_key)
+            if db is not None:
+                report(100, "Loaded from cache")
+                set_rows(len(db.messages))
+                return db
+        
+        report(50, "Parsing")
+        import cantools
+        if os.path.splitext(file_path)[1].lower() == '.dbc':
+            # cantools reads DBC files as cp1252 by default
+            text = b"".join(chunks).decode('cp1252')
+            db = cantools.database.load_string(text, database_format='dbc')
+        else:
+            # Other formats cantools supports (KCD, SYM, ARXML, ...)
+            # go through load_file so it can pick the parser
+            db = cantools.database.load_file(file_path)
+        
+        if cache_key is not None:
+            report(90, "Caching")
+            self.cache.put(cache_key, db)
+        
+        report(100, "Done")
+        set_rows(len(db.messages))
+        return db
+    
+    def add_dbc(self, file_path, db, stamp=None):
+        """
+        Stores an already parsed DBC database under the given path
+        stamp is the file's get_file_stamp() from before it was read; the
+        file is watched for changes from that version (default: the current one)
+        """
+        self.dbc_files[file_path] = db
+        self.clear_derived_data(file_path)
+        if self.search_index is not None:
+            self.search_index.add_file(file_path, db)
+        self.file_watcher.watch(file_path, stamp)
             
     def get_dbc(self, file_path):
         """
@@ -29,11 +169,192 @@ class DBCModel:
         """
         if file_path in self.dbc_files:
             del self.dbc_files[file_path]
+            self.clear_derived_data(file_path)
+            if self.search_index is not None:
+                self.search_index.remove_file(file_path)
+            self.file_watcher.unwatch(file_path)
             return True
         return False
+    
+    def get_file_stamp(self, file_path):
+        """
+        Returns (modification time, size) of a file, or None if it can't be read
+        """
+        return get_file_stamp(file_path)
+    
+    def get_changed_files(self):
+        """
+        Returns the loaded files that changed on disk since they were loaded
+        and have stopped changing; each change is reported once
+        """
+        return self.file_watcher.poll()
+    
+    def prepare_reload(self, file_path, db):
+        """
+        Compares a newly parsed version of a loaded file with the loaded one
+        Returns a DBCReload to pass to apply_reload, or None if the file is
+        not loaded. The new version's signal store is built too if the old
+        one was. Only reads the model, so it is safe to call from a worker thread
+        """
+        old_db = self.dbc_files.get(file_path)
+        if old_db is None:
+            return None
+        from model.dbc_reload import compute_reload
+        return compute_reload(file_path, old_db, db, self.dbc_indexes.get(file_path),
+                              build_signal_store=file_path in self.signal_stores)
+    
+    def apply_reload(self, reload, stamp=None):
+        """
+        Stores the new version of a file prepared by prepare_reload
+        If nothing shown changed, the loaded database is kept with its derived
+        data. Returns False if the loaded version is no longer the one the
+        reload was prepared from (the file was removed or replaced meanwhile)
+        """
+        file_path = reload.file_path
+        if self.dbc_files.get(file_path) is not reload.old_db:
+            return False
+        if reload.is_empty():
+            self.file_watcher.watch(file_path, stamp)
+            return True
+        self.add_dbc(file_path, reload.new_db, stamp)
+        # Built by prepare_reload, signatures included
+        self.dbc_indexes[file_path] = reload.new_index
+        if reload.signal_store is not None:
+            self.signal_stores[file_path] = reload.signal_store
+        return True
+    
+    def clear_derived_data(self, file_path):
+        """
+        Drops the stores and indexes built from a DBC file
+        """
+        self.signal_stores.pop(file_path, None)
+        self.dbc_indexes.pop(file_path, None)
+        self.filter_columns.pop((file_path, 'messages'), None)
+        self.filter_columns.pop((file_path, 'signals'), None)
+        self.message_sort_keys.pop(file_path, None)
+        self.bit_layouts.pop(file_path, None)
+    
+    def get_signal_store(self, file_path):
+        """
+        Returns the columnar SignalStore of a loaded DBC, building it on first use
+        Returns None if the file is not loaded
+        """
+        db = self.dbc_files.get(file_path)
+        if db is None:
+            return None
+        store = self.signal_stores.get(file_path)
+        if store is None:
+            from model.signal_store import SignalStore
+            index = self.get_dbc_index(file_path)
+            with span("SignalStore.__init__") as store_span:
+                store = SignalStore(db, index)
+                store_span.set(rows=len(store))
+            self.signal_stores[file_path] = store
+        return store
+    
+    def get_dbc_index(self, file_path):
+        """
+        Returns the DBCIndex of a loaded DBC, building it on first use
+        Returns None if the file is not loaded
+        """
+        db = self.dbc_files.get(file_path)
+        if db is None:
+            return None
+        index = self.dbc_indexes.get(file_path)
+        if index is None:
+            with span("DBCIndex.__init__", rows=len(db.messages)):
+                index = DBCIndex(db)
+            self.dbc_indexes[file_path] = index
+        return index
         
+    def get_filter_columns(self, file_path, table):
+        """
+        Returns the LowercaseColumns used to filter a table of a loaded DBC
+        table is 'messages' (rows in db.messages order) or 'signals'
+        (rows in signal store order). Returns None if the file is not loaded
+        """
+        db = self.dbc_files.get(file_path)
+        if db is None:
+            return None
+        columns = self.filter_columns.get((file_path, table))
+        if columns is None:
+            if table == 'messages':
+                messages = db.messages
+                columns = LowercaseColumns(
+                    len(messages), lambda row, col: get_message_column_value(messages[row], col))
+            else:
+                store = self.get_signal_store(file_path)
+                columns = LowercaseColumns(len(store), store.text)
+            self.filter_columns[(file_path, table)] = columns
+        return columns
+    
+    def get_message_sort_keys(self, file_path):
+        """
+        Returns the MessageSortKeys of a loaded DBC, creating it on first use
+        Each column's keys are computed on its first sort. Returns None if
+        the file is not loaded
+        """
+        db = self.dbc_files.get(file_path)
+        if db is None:
+            return None
+        keys = self.message_sort_keys.get(file_path)
+        if keys is None:
+            from model.table_sort import MessageSortKeys
+            keys = self.message_sort_keys[file_path] = MessageSortKeys(db.messages)
+        return keys
+    
+    def diff_dbcs(self, old_file_path, new_file_path):
+        """
+        Compares two loaded DBC files through their indexes
+        Returns a DBCDiff, or None if either file is not loaded
+        """
+        old_db = self.dbc_files.get(old_file_path)
+        new_db = self.dbc_files.get(new_file_path)
+        if old_db is None or new_db is None:
+            return None
+        from model.dbc_diff import diff_databases
+        return diff_databases(old_db, new_db,
+                              self.get_dbc_index(old_file_path),
+                              self.get_dbc_index(new_file_path))
+    
+    def get_bus_analytics(self, file_path, bitrate, data_bitrate=None, stuffing=True):
+        """
+        Estimates the bus load of a loaded DBC at a bitrate and checks its bit layouts
+        Returns a BusAnalytics, or None if the file is not loaded. The bit
+        layouts do not depend on the bitrate and are kept for later calls
+        """
+        db = self.dbc_files.get(file_path)
+        if db is None:
+            return None
+        from model.bus_analytics import analyze_database
+        analytics = analyze_database(db, bitrate, data_bitrate, stuffing,
+                                     self.bit_layouts.get(file_path))
+        self.bit_layouts[file_path] = analytics.layouts
+        return analytics
+    
+    def search(self, query, limit=1000):
+        """
+        Finds a case-insensitive substring in the names, comments, units and
+        choice labels of every loaded DBC file
+        Returns up to limit SearchHit objects
+        """
+        if self.search_index is None:
+            from model.search_index import SearchIndex
+            self.search_index = SearchIndex()
+            for file_path, db in self.dbc_files.items():
+                self.search_index.add_file(file_path, db)
+        return self.search_index.search(query, limit)
+    
+    def get_cache_stats(self):
+        """
+        Returns the parsed-DBC cache statistics, or None if caching is disabled
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get_stats()
+    
     def get_all_dbc_files(self):
         """
         Returns a list of all loaded DBC file paths
         """
-        return list(self.dbc_files.keys()) 
\ No newline at end of file
+        return list(self.dbc_files.keys())
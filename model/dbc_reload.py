@@ -0,0 +1,128 @@
+"""
+Change detection and reloading of loaded DBC files
+
+A DBCFileWatcher polls the modification time and size of the loaded files,
+one os.stat() per file, and reports the files that changed once they have
+stopped changing. compute_reload() then compares the newly parsed database
+with the loaded one through their DBCIndex signatures (see dbc_diff), so
+the views can patch the rows of the messages that changed instead of
+rebuilding everything. Both run without Qt; compute_reload() is meant to
+run on a worker thread next to the parse.
+"""
+
+import os
+from model.dbc_index import DBCIndex
+from model.dbc_diff import diff_databases
+from model.profiling import span
+
+def get_file_stamp(file_path):
+    """Get (modification time in ns, size) of a file, or None if it can't be read"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+class DBCFileWatcher:
+    """
+    Polls files for changes
+    
+    A change is only reported once the same stamp is seen on two
+    consecutive polls, so a file still being written is not parsed half
+    written, and only once per stamp, so a file that fails to parse is not
+    parsed again until it changes again. A file that disappears, e.g. while
+    a toolchain replaces it, is reported when it comes back.
+    """
+    
+    def __init__(self):
+        self.stamps = {}    # Path -> stamp of the version loaded
+        self.pending = {}   # Path -> changed stamp seen at the last poll
+        self.reported = {}  # Path -> last changed stamp reported
+    
+    def watch(self, file_path, stamp=None):
+        """Watch a file from the version with the given stamp (default: the current one)"""
+        self.stamps[file_path] = stamp if stamp is not None else get_file_stamp(file_path)
+        self.pending.pop(file_path, None)
+        self.reported.pop(file_path, None)
+    
+    def unwatch(self, file_path):
+        self.stamps.pop(file_path, None)
+        self.pending.pop(file_path, None)
+        self.reported.pop(file_path, None)
+    
+    def get_watched_files(self):
+        return list(self.stamps.keys())
+    
+    def poll(self):
+        """Get the files that changed and have stopped changing since the last poll"""
+        changed = []
+        for file_path, loaded_stamp in self.stamps.items():
+            stamp = get_file_stamp(file_path)
+            if stamp is None or stamp == loaded_stamp:
+                self.pending.pop(file_path, None)
+                continue
+            if self.pending.get(file_path) != stamp:
+                self.pending[file_path] = stamp
+                continue
+            if self.reported.get(file_path) != stamp:
+                self.reported[file_path] = stamp
+                changed.append(file_path)
+        return changed
+
+def get_node_items(db):
+    """Get the (name, comment) of every node of a database, as the views show them"""
+    return [(node.name, getattr(node, 'comment', None)) for node in getattr(db, 'nodes', None) or []]
+
+class DBCReload:
+    """
+    What changed between the loaded version of a DBC file and a new one
+    
+    Every message of the new version is either in message_map's values
+    (the same message, possibly changed) or in added.
+    """
+    
+    def __init__(self, file_path, old_db, new_db, new_index, diff):
+        self.file_path = file_path
+        self.old_db = old_db
+        self.new_db = new_db
+        self.new_index = new_index  # DBCIndex of new_db, signatures included
+        self.diff = diff            # DBCDiff from old_db to new_db
+        self.message_map = {}       # Old Message -> new Message, for messages in both versions
+        self.changed = set()        # New Messages whose attributes or signals changed
+        self.added = []             # New Messages not in the old version, in database order
+        self.removed = []           # Old Messages not in the new version, in database order
+        self.nodes_changed = False  # True if the nodes (names or comments) changed
+        self.signal_store = None    # SignalStore of new_db, if it was built ahead
+    
+    def is_empty(self):
+        """True if nothing the application shows changed"""
+        return self.diff.is_empty() and not self.nodes_changed
+
+def compute_reload(file_path, old_db, new_db, old_index=None, build_signal_store=False):
+    """
+    Compare a newly parsed version of a file with the loaded one
+    Returns a DBCReload. With build_signal_store, the new version's
+    SignalStore is built too, so a view showing the old one can switch
+    without building it on the GUI thread. Only reads old_db and old_index.
+    """
+    with span("compute_reload", rows=len(new_db.messages)):
+        old_index = old_index or DBCIndex(old_db)
+        new_index = DBCIndex(new_db)
+        diff = diff_databases(old_db, new_db, old_index, new_index)
+        reload = DBCReload(file_path, old_db, new_db, new_index, diff)
+        
+        old_signatures = old_index.get_signatures()
+        new_signatures = new_index.get_signatures()
+        for new_msg, old_msg in diff.message_pairs.items():
+            reload.message_map[old_msg] = new_msg
+            if old_signatures[old_msg] != new_signatures[new_msg]:
+                reload.changed.add(new_msg)
+        reload.added = [msg for msg in new_db.messages if msg not in diff.message_pairs]
+        reload.removed = [msg for msg in old_db.messages if msg not in reload.message_map]
+        # Nodes are not part of the diff, which compares messages and signals
+        reload.nodes_changed = get_node_items(old_db) != get_node_items(new_db)
+        
+        if build_signal_store and not reload.is_empty():
+            from model.signal_store import SignalStore
+            reload.signal_store = SignalStore(new_db, new_index)
+    return reload
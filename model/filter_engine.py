@@ -0,0 +1,78 @@
+from model.profiling import span
+
+class LowercaseColumns:
+    """
+    Lowercased text of every row of a table, per column
+    
+    Each column is built on first use and then kept, so filtering never
+    re-formats or re-lowercases a value.
+    """
+    
+    def __init__(self, row_count, text_getter):
+        self.row_count = row_count
+        self.text_getter = text_getter
+        self._columns = {}
+    
+    def column(self, col):
+        """Get the lowercase text of every row for a column"""
+        values = self._columns.get(col)
+        if values is None:
+            with span("LowercaseColumns.column", column=col, rows=self.row_count):
+                text_getter = self.text_getter
+                values = [text_getter(row, col).lower() for row in range(self.row_count)]
+            self._columns[col] = values
+        return values
+
+class IncrementalFilter:
+    """
+    Case-insensitive substring filter over LowercaseColumns
+    
+    When a query only extends the previous one (every column's filter
+    still contains its old text), only the previous matches are searched.
+    """
+    
+    def __init__(self, columns):
+        self.columns = columns
+        self.last_filters = {}
+        self.last_rows = None  # Matching rows of last_filters, None means all rows
+    
+    def reset(self):
+        """Forget the previous query"""
+        self.last_filters = {}
+        self.last_rows = None
+    
+    def is_narrowing(self, filters):
+        """Returns True if filters can only match a subset of the previous matches"""
+        for col, old_text in self.last_filters.items():
+            if old_text not in filters.get(col, ""):
+                return False
+        return True
+    
+    def apply(self, filters):
+        """
+        Filter the rows with col -> lowercase text filters
+        Returns a list of matching row numbers, or None if no filter is set
+        """
+        filters = {col: text for col, text in filters.items() if text}
+        if not filters:
+            self.reset()
+            return None
+        if filters == self.last_filters:
+            return self.last_rows
+        
+        # Only search the previous matches when the query has been extended
+        if self.last_rows is not None and self.is_narrowing(filters):
+            rows = self.last_rows
+            changed = {col: text for col, text in filters.items()
+                       if self.last_filters.get(col) != text}
+        else:
+            rows = range(self.columns.row_count)
+            changed = filters
+        
+        for col, text in changed.items():
+            values = self.columns.column(col)
+            rows = [row for row in rows if text in values[row]]
+        
+        self.last_filters = filters
+        self.last_rows = list(rows)
+        return self.last_rows
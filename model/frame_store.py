@@ -0,0 +1,459 @@
+"""
+Memory-mapped on-disk store of raw CAN frames
+
+A frame store keeps a parsed log as fixed-width binary records
+(timestamp, frame ID, DLC, flags, channel, payload) followed by a per-ID
+index of record numbers and a time index of per-block timestamp ranges.
+The per-ID index keeps standard and extended frames with the same number
+apart.
+Opening one only maps the file, so a multi-GB trace is ready immediately,
+and every column is exposed as a NumPy view of the mapping, without
+copies. Queries such as "all frames of 0x1A0 between t=10s and t=20s"
+touch only the index and the matching records.
+
+File layout (little endian):
+    header | records | ID table | record numbers by ID | time blocks
+"""
+
+import itertools
+import mmap
+import os
+import numpy as np
+
+FRAME_STORE_EXTENSION = ".frames"
+
+MAGIC = b"DBCFRAME"
+VERSION = 2  # 2: the ID table tells standard and extended IDs apart
+
+# Records per time-index block
+TIME_BLOCK_SIZE = 4096
+
+# Record payload widths: classic CAN and CAN FD
+CLASSIC_PAYLOAD_WIDTH = 8
+FD_PAYLOAD_WIDTH = 64
+
+# Records copied at a time when a store's records are widened
+WIDEN_CHUNK_SIZE = 1 << 20
+
+# Bits of the record flags field
+FLAG_EXTENDED_ID = 0x01
+FLAG_FD = 0x02
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('payload_width', '<u4'),
+    ('record_count', '<u8'),
+    ('records_offset', '<u8'),
+    ('id_count', '<u8'),
+    ('id_table_offset', '<u8'),
+    ('positions_offset', '<u8'),
+    ('block_count', '<u8'),
+    ('blocks_offset', '<u8'),
+    ('time_block_size', '<u4'),
+    ('time_sorted', '<u4'),
+])
+
+# One entry per frame ID and ID kind (flags holds FLAG_EXTENDED_ID or 0): its
+# record numbers are positions[start:start + count]
+ID_TABLE_DTYPE = np.dtype([('frame_id', '<u4'), ('flags', '<u4'), ('start', '<u8'), ('count', '<u8')])
+
+# Smallest and largest timestamp of each block of TIME_BLOCK_SIZE records
+TIME_BLOCK_DTYPE = np.dtype([('min', '<f8'), ('max', '<f8')])
+
+def record_dtype(payload_width):
+    """Get the fixed-width record layout for payloads of up to payload_width bytes"""
+    return np.dtype([
+        ('timestamp', '<f8'),
+        ('frame_id', '<u4'),
+        ('dlc', 'u1'),
+        ('flags', 'u1'),
+        ('channel', '<u2'),
+        ('data', 'u1', (payload_width,)),
+    ])
+
+class FrameStoreWriter:
+    """
+    Writes frames to a new frame store
+    
+    Frames are appended in chunks and streamed to disk; the indexes are
+    built from the mapped records when the writer is closed. The store is
+    written under a temporary name and only replaces path once complete.
+    With widen, a payload too long for the records makes the writer
+    rewrite the records written so far as CAN FD records instead of failing.
+    """
+    
+    def __init__(self, path, payload_width=CLASSIC_PAYLOAD_WIDTH, widen=False):
+        self.path = path
+        self.payload_width = payload_width
+        self.widen = widen
+        self.dtype = record_dtype(payload_width)
+        self.record_count = 0
+        self._temp_path = path + ".tmp"
+        self._file = open(self._temp_path, 'wb')
+        self._file.write(bytes(HEADER_DTYPE.itemsize))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+    
+    def append(self, timestamps, frame_ids, payloads, flags=None, channels=None):
+        """
+        Append a chunk of frames
+        payloads is a list of bytes-like objects; flags and channels are
+        optional per-frame arrays
+        """
+        count = len(timestamps)
+        if count == 0:
+            return
+        records = np.zeros(count, dtype=self.dtype)
+        records['timestamp'] = timestamps
+        records['frame_id'] = frame_ids
+        if flags is not None:
+            records['flags'] = flags
+        if channels is not None:
+            records['channel'] = channels
+        dlcs = np.fromiter((len(data) for data in payloads), dtype=np.int64, count=count)
+        if (self.widen and self.payload_width < FD_PAYLOAD_WIDTH
+                and self.payload_width < dlcs.max() <= FD_PAYLOAD_WIDTH):
+            self._widen(FD_PAYLOAD_WIDTH)
+            records = self._widen_records(records, self.dtype)
+        if count and dlcs.max() > self.payload_width:
+            raise ValueError(f"Frame payload of {dlcs.max()} bytes does not fit the store's "
+                             f"{self.payload_width}-byte records")
+        records['dlc'] = dlcs
+        width = self.payload_width
+        buffer = b"".join(bytes(data).ljust(width, b"\0") for data in payloads)
+        records['data'] = np.frombuffer(buffer, dtype=np.uint8).reshape(count, width)
+        self._file.write(records.tobytes())
+        self.record_count += count
+    
+    def append_frames(self, frames, chunk_size=100000):
+        """Append can.Message frames, buffering chunk_size frames at a time"""
+        timestamps, frame_ids, payloads, flags, channels = [], [], [], [], []
+        for frame in frames:
+            timestamps.append(frame.timestamp)
+            frame_ids.append(frame.arbitration_id)
+            payloads.append(frame.data)
+            flags.append((FLAG_EXTENDED_ID if frame.is_extended_id else 0)
+                         | (FLAG_FD if frame.is_fd else 0))
+            channels.append(frame.channel if isinstance(frame.channel, int) else 0)
+            if len(timestamps) >= chunk_size:
+                self.append(timestamps, frame_ids, payloads, flags, channels)
+                timestamps, frame_ids, payloads, flags, channels = [], [], [], [], []
+        self.append(timestamps, frame_ids, payloads, flags, channels)
+    
+    @staticmethod
+    def _widen_records(records, dtype):
+        """Copy records into the wider record layout dtype, zero padding the payloads"""
+        wide = np.zeros(len(records), dtype=dtype)
+        for name in records.dtype.names:
+            if name != 'data':
+                wide[name] = records[name]
+        wide['data'][:, :records.dtype['data'].shape[0]] = records['data']
+        return wide
+    
+    def _widen(self, payload_width):
+        """Rewrite the records written so far with payload_width-byte payloads"""
+        self._file.close()
+        narrow_path = self._temp_path + ".narrow"
+        os.replace(self._temp_path, narrow_path)
+        dtype = record_dtype(payload_width)
+        try:
+            with open(self._temp_path, 'wb') as f:
+                f.write(bytes(HEADER_DTYPE.itemsize))
+                if self.record_count:
+                    records = np.memmap(narrow_path, dtype=self.dtype, mode='r',
+                                        offset=HEADER_DTYPE.itemsize, shape=(self.record_count,))
+                    for first in range(0, self.record_count, WIDEN_CHUNK_SIZE):
+                        chunk = records[first:first + WIDEN_CHUNK_SIZE]
+                        f.write(self._widen_records(chunk, dtype).tobytes())
+                    del records
+        finally:
+            os.remove(narrow_path)
+        self.payload_width = payload_width
+        self.dtype = dtype
+        # Not opened for appending: close() writes the header at the start
+        self._file = open(self._temp_path, 'r+b')
+        self._file.seek(0, os.SEEK_END)
+    
+    def abort(self):
+        """Discard the store being written"""
+        self._file.close()
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+    
+    def close(self):
+        """Build the indexes, write the header and move the store into place"""
+        self._file.flush()
+        records_offset = HEADER_DTYPE.itemsize
+        records = np.memmap(self._temp_path, dtype=self.dtype, mode='r',
+                            offset=records_offset, shape=(self.record_count,)) \
+            if self.record_count else np.zeros(0, dtype=self.dtype)
+        
+        # Record numbers grouped by frame ID and ID kind, each group in file
+        # order; the kind is the key's high word, so standard IDs come first
+        id_keys = (records['frame_id'].astype(np.uint64)
+                   | ((records['flags'] & FLAG_EXTENDED_ID).astype(np.uint64) << np.uint64(32)))
+        position_dtype = np.uint32 if self.record_count < 2 ** 32 else np.uint64
+        positions = np.argsort(id_keys, kind='stable').astype(position_dtype)
+        unique_keys, starts, counts = np.unique(id_keys[positions], return_index=True,
+                                                return_counts=True)
+        id_table = np.zeros(len(unique_keys), dtype=ID_TABLE_DTYPE)
+        id_table['frame_id'] = unique_keys & np.uint64(0xFFFFFFFF)
+        id_table['flags'] = unique_keys >> np.uint64(32)
+        id_table['start'] = starts
+        id_table['count'] = counts
+        
+        # Timestamp range of each block of records
+        timestamps = records['timestamp']
+        block_count = (self.record_count + TIME_BLOCK_SIZE - 1) // TIME_BLOCK_SIZE
+        blocks = np.zeros(block_count, dtype=TIME_BLOCK_DTYPE)
+        for block in range(block_count):
+            block_times = timestamps[block * TIME_BLOCK_SIZE:(block + 1) * TIME_BLOCK_SIZE]
+            blocks[block] = (block_times.min(), block_times.max())
+        time_sorted = bool(np.all(timestamps[1:] >= timestamps[:-1])) if self.record_count else True
+        del records, id_keys, timestamps
+        
+        header = np.zeros(1, dtype=HEADER_DTYPE)
+        header['magic'] = MAGIC
+        header['version'] = VERSION
+        header['payload_width'] = self.payload_width
+        header['record_count'] = self.record_count
+        header['records_offset'] = records_offset
+        header['id_count'] = len(id_table)
+        header['time_block_size'] = TIME_BLOCK_SIZE
+        header['block_count'] = block_count
+        header['time_sorted'] = time_sorted
+        
+        offset = records_offset + self.record_count * self.dtype.itemsize
+        for name, array in (('id_table_offset', id_table), ('positions_offset', positions),
+                            ('blocks_offset', blocks)):
+            # Keep every section 8-byte aligned
+            padding = -offset % 8
+            self._file.write(bytes(padding))
+            offset += padding
+            header[name] = offset
+            self._file.write(array.tobytes())
+            offset += array.nbytes
+        self._file.seek(0)
+        self._file.write(header.tobytes())
+        self._file.close()
+        os.replace(self._temp_path, self.path)
+
+class FrameStore:
+    """
+    Read-only, memory-mapped view of a frame store
+    
+    timestamps, frame_ids, dlcs, flags, channels and payloads are NumPy
+    views of the mapped file; nothing is read until it is used.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Not a frame store: {path}") from None
+        header = np.frombuffer(self._mmap, dtype=HEADER_DTYPE, count=1)[0]
+        if header['magic'] != MAGIC or header['version'] != VERSION:
+            self.close()
+            raise ValueError(f"Not a frame store (or an unsupported version): {path}")
+        
+        self.payload_width = int(header['payload_width'])
+        self.time_sorted = bool(header['time_sorted'])
+        self.time_block_size = int(header['time_block_size'])
+        count = int(header['record_count'])
+        self.records = np.frombuffer(self._mmap, dtype=record_dtype(self.payload_width),
+                                     count=count, offset=int(header['records_offset']))
+        self.id_table = np.frombuffer(self._mmap, dtype=ID_TABLE_DTYPE,
+                                      count=int(header['id_count']),
+                                      offset=int(header['id_table_offset']))
+        position_dtype = np.uint32 if count < 2 ** 32 else np.uint64
+        self.positions = np.frombuffer(self._mmap, dtype=position_dtype, count=count,
+                                       offset=int(header['positions_offset']))
+        self.time_blocks = np.frombuffer(self._mmap, dtype=TIME_BLOCK_DTYPE,
+                                         count=int(header['block_count']),
+                                         offset=int(header['blocks_offset']))
+        # (frame ID, is extended) -> ID table row
+        self._id_rows = {(int(entry['frame_id']), bool(entry['flags'] & FLAG_EXTENDED_ID)): row
+                         for row, entry in enumerate(self.id_table)}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def close(self):
+        """Unmap the file; views taken from the store must not be used afterwards"""
+        self.records = self.id_table = self.positions = self.time_blocks = None
+        try:
+            self._mmap.close()
+        except (AttributeError, BufferError):
+            # Views still exported keep the mapping alive until they are freed
+            pass
+        self._file.close()
+    
+    # Zero-copy column views
+    
+    @property
+    def timestamps(self):
+        return self.records['timestamp']
+    
+    @property
+    def frame_ids(self):
+        return self.records['frame_id']
+    
+    @property
+    def dlcs(self):
+        return self.records['dlc']
+    
+    @property
+    def flags(self):
+        return self.records['flags']
+    
+    @property
+    def channels(self):
+        return self.records['channel']
+    
+    @property
+    def payloads(self):
+        """(records x payload_width) uint8 view of the payload bytes"""
+        return self.records['data']
+    
+    # Indexes
+    
+    def get_frame_ids(self):
+        """Get every frame ID number in the store, ascending, standard and extended alike"""
+        return sorted({int(frame_id) for frame_id in self.id_table['frame_id']})
+    
+    def get_frame_keys(self):
+        """Get the (frame ID, is extended) pair of every ID in the store"""
+        return sorted(self._id_rows)
+    
+    def _id_table_rows(self, frame_id, extended):
+        """Get the ID table rows of a frame ID of one kind, or of both if extended is None"""
+        kinds = (False, True) if extended is None else (bool(extended),)
+        rows = (self._id_rows.get((frame_id, kind)) for kind in kinds)
+        return [row for row in rows if row is not None]
+    
+    def get_frame_count(self, frame_id, extended=None):
+        """Number of frames with the given ID (of one kind if extended is given)"""
+        return sum(int(self.id_table[row]['count']) for row in self._id_table_rows(frame_id, extended))
+    
+    def positions_of(self, frame_id, extended=None):
+        """
+        Get the record numbers of a frame ID in file order
+        With extended given, only standard (False) or extended (True)
+        frames count and the result is a view of the index; otherwise a
+        number used by both kinds gets the records of both, merged.
+        """
+        groups = []
+        for row in self._id_table_rows(frame_id, extended):
+            entry = self.id_table[row]
+            start = int(entry['start'])
+            groups.append(self.positions[start:start + int(entry['count'])])
+        if not groups:
+            return self.positions[:0]
+        if len(groups) == 1:
+            return groups[0]
+        return np.sort(np.concatenate(groups))
+    
+    def time_range(self, start=None, end=None):
+        """
+        Get the record numbers with start <= timestamp < end
+        Returns a slice for time-sorted stores, otherwise an array of record
+        numbers found through the time blocks
+        """
+        count = len(self.records)
+        if self.time_sorted:
+            timestamps = self.timestamps
+            first = 0 if start is None else int(np.searchsorted(timestamps, start, side='left'))
+            last = count if end is None else int(np.searchsorted(timestamps, end, side='left'))
+            return slice(first, max(first, last))
+        # Only look inside blocks whose range overlaps the query
+        blocks = np.ones(len(self.time_blocks), dtype=bool)
+        if start is not None:
+            blocks &= self.time_blocks['max'] >= start
+        if end is not None:
+            blocks &= self.time_blocks['min'] < end
+        matches = []
+        for block in np.flatnonzero(blocks):
+            first = block * self.time_block_size
+            block_times = self.timestamps[first:first + self.time_block_size]
+            selected = np.ones(len(block_times), dtype=bool)
+            if start is not None:
+                selected &= block_times >= start
+            if end is not None:
+                selected &= block_times < end
+            matches.append(np.flatnonzero(selected) + first)
+        return np.concatenate(matches) if matches else np.zeros(0, dtype=np.int64)
+    
+    def select(self, frame_id=None, start=None, end=None, extended=None):
+        """
+        Get the record numbers of frames matching an optional frame ID (of
+        one kind if extended is given) and time window [start, end); a
+        slice when no frame ID is given on a time-sorted store, otherwise
+        an array
+        """
+        if frame_id is None:
+            return self.time_range(start, end)
+        positions = self.positions_of(frame_id, extended)
+        if start is None and end is None:
+            return positions
+        times = self.timestamps[positions]
+        if self.time_sorted:
+            # A frame ID's records are in file order, so its times are sorted too
+            first = 0 if start is None else int(np.searchsorted(times, start, side='left'))
+            last = len(times) if end is None else int(np.searchsorted(times, end, side='left'))
+            return positions[first:max(first, last)]
+        selected = np.ones(len(times), dtype=bool)
+        if start is not None:
+            selected &= times >= start
+        if end is not None:
+            selected &= times < end
+        return positions[selected]
+    
+    def query(self, frame_id=None, start=None, end=None, extended=None):
+        """
+        Get the records matching an optional frame ID and time window
+        A time-only query on a time-sorted store returns a zero-copy view;
+        other queries gather the matching records into a new array.
+        """
+        return self.records[self.select(frame_id, start, end, extended)]
+
+def write_frame_store(log_path, store_path, payload_width=None):
+    """
+    Convert a CAN log (anything python-can reads) into a frame store
+    payload_width defaults to 64 bytes if the first frames include CAN FD
+    frames, otherwise 8; a longer frame later in the log then makes the
+    writer widen the records written so far. Returns the number of frames
+    written.
+    """
+    from model.log_decoder import read_log_frames
+    frames = read_log_frames(log_path)
+    widen = payload_width is None
+    if widen:
+        # Look ahead at the first frames to choose the record width
+        head = []
+        for frame in frames:
+            head.append(frame)
+            if len(head) >= 10000:
+                break
+        fd = any(frame.is_fd or len(frame.data) > CLASSIC_PAYLOAD_WIDTH for frame in head)
+        payload_width = FD_PAYLOAD_WIDTH if fd else CLASSIC_PAYLOAD_WIDTH
+        frames = itertools.chain(head, frames)
+    with FrameStoreWriter(store_path, payload_width, widen) as writer:
+        writer.append_frames(frames)
+    return writer.record_count
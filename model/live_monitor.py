@@ -0,0 +1,245 @@
+"""
+Live decoding of frames received from a CAN bus
+
+A BusMonitor reads frames from a python-can Bus on a background thread,
+looks each frame ID up in the database's DBCIndex and decodes the frames
+received since the last pass together with the vectorized BatchDecoder.
+The recent values of every signal are kept in a fixed-size RingBuffer, so
+memory stays bounded however long the monitor runs. The GUI polls the
+monitor on its own timer instead of being notified per frame.
+
+Use the 'virtual' interface to test without hardware, or 'socketcan' with
+a can0/vcan0 channel on Linux.
+"""
+
+import threading
+import time
+import numpy as np
+from model.batch_decoder import BatchDecoder
+from model.dbc_index import DBCIndex
+
+# Interfaces offered by the monitor window; python-can supports many more
+MONITOR_INTERFACES = ("virtual", "socketcan")
+
+class RingBuffer:
+    """Fixed-size buffer of the last (timestamp, value) samples of a signal"""
+    
+    __slots__ = ('timestamps', 'values', 'capacity', 'count', 'position')
+    
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self.count = 0      # Samples ever written
+        self.position = 0   # Index the next sample goes to
+    
+    def __len__(self):
+        return min(self.count, self.capacity)
+    
+    def extend(self, timestamps, values):
+        """Append samples, overwriting the oldest ones once the buffer is full"""
+        total = len(timestamps)
+        if total == 0:
+            return
+        if total > self.capacity:
+            # Only the newest samples would survive anyway
+            timestamps = timestamps[-self.capacity:]
+            values = values[-self.capacity:]
+        n = len(timestamps)
+        first = min(n, self.capacity - self.position)
+        self.timestamps[self.position:self.position + first] = timestamps[:first]
+        self.values[self.position:self.position + first] = values[:first]
+        if first < n:
+            self.timestamps[:n - first] = timestamps[first:]
+            self.values[:n - first] = values[first:]
+        self.position = (self.position + n) % self.capacity
+        self.count += total
+    
+    def latest(self):
+        """Get the newest (timestamp, value), or None if the buffer is empty"""
+        if self.count == 0:
+            return None
+        last = self.position - 1
+        return self.timestamps[last], self.values[last]
+    
+    def snapshot(self):
+        """Copy the samples out, oldest first, as (timestamps, values) arrays"""
+        if self.count < self.capacity:
+            return self.timestamps[:self.count].copy(), self.values[:self.count].copy()
+        order = np.r_[self.position:self.capacity, 0:self.position]
+        return self.timestamps[order], self.values[order]
+
+class BusMonitor:
+    """
+    Receives and decodes frames of a database from a CAN bus in the background
+    
+    capacity is the number of samples kept per signal. Frames are decoded in
+    passes of at most batch_interval seconds; all shared state is guarded by
+    a lock, held only while a pass is stored or the GUI reads.
+    """
+    
+    DEFAULT_CAPACITY = 4096
+    DEFAULT_BATCH_INTERVAL = 0.02
+    
+    def __init__(self, db, index=None, capacity=DEFAULT_CAPACITY,
+                 batch_interval=DEFAULT_BATCH_INTERVAL):
+        self.db = db
+        self.index = index or DBCIndex(db)
+        self.capacity = capacity
+        self.batch_interval = batch_interval
+        self.batch_decoder = BatchDecoder()
+        self.lock = threading.Lock()
+        self.bus = None
+        self.thread = None
+        self._stop_event = threading.Event()
+        self.started_at = None
+        self.reset()
+    
+    def reset(self):
+        """Forget every value and counter received so far"""
+        with self.lock:
+            self.buffers = {}               # (message name, signal name) -> RingBuffer
+            self.message_counts = {}        # Message -> frames received
+            self.changed = set()            # Keys updated since take_changes()
+            self.frames_received = 0
+            self.unknown_frames = 0
+            self.decode_errors = 0
+            self.error = None               # Exception that stopped the thread
+    
+    def start(self, interface="virtual", channel="vcan0", bitrate=None, bus=None):
+        """
+        Open a python-can Bus (or use the given one) and start receiving
+        Raises whatever python-can raises if the bus cannot be opened.
+        """
+        if self.is_running():
+            return
+        if bus is None:
+            import can
+            kwargs = {'interface': interface, 'channel': channel}
+            if bitrate:
+                kwargs['bitrate'] = bitrate
+            bus = can.Bus(**kwargs)
+        self.bus = bus
+        self._stop_event.clear()
+        with self.lock:
+            self.error = None
+            self.started_at = time.monotonic()
+        self.thread = threading.Thread(target=self._run, name="BusMonitor", daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        """Stop receiving and close the bus"""
+        self._stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.bus is not None:
+            self.bus.shutdown()
+            self.bus = None
+    
+    def is_running(self):
+        """Returns True while the receive thread is alive"""
+        return self.thread is not None and self.thread.is_alive()
+    
+    def _run(self):
+        try:
+            while not self._stop_event.is_set():
+                self._receive_pass()
+        except Exception as e:
+            with self.lock:
+                self.error = e
+    
+    def _receive_pass(self):
+        """Receive frames for up to batch_interval seconds, then decode them together"""
+        frames = {}   # Message -> ([timestamps], [payloads])
+        unknown = 0
+        received = 0
+        deadline = time.monotonic() + self.batch_interval
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            frame = self.bus.recv(timeout=remaining)
+            if frame is None:
+                break
+            if frame.is_error_frame or frame.is_remote_frame:
+                continue
+            received += 1
+            message = self.index.get_message_by_frame_id(frame.arbitration_id,
+                                                         frame.is_extended_id)
+            if message is None:
+                unknown += 1
+                continue
+            timestamps, payloads = frames.setdefault(message, ([], []))
+            timestamps.append(frame.timestamp)
+            payloads.append(bytes(frame.data))
+        
+        decoded = []
+        errors = 0
+        for message, (timestamps, payloads) in frames.items():
+            try:
+                columns = self.batch_decoder.decode(message, payloads)
+            except Exception:
+                errors += len(payloads)
+                continue
+            decoded.append((message, np.asarray(timestamps, dtype=np.float64), columns))
+        
+        with self.lock:
+            self.frames_received += received
+            self.unknown_frames += unknown
+            self.decode_errors += errors
+            for message, timestamps, columns in decoded:
+                self.message_counts[message] = self.message_counts.get(message, 0) + len(timestamps)
+                for name, values in columns.items():
+                    # Multiplexed signals are NaN in frames that lack them
+                    present = ~np.isnan(values)
+                    if not present.any():
+                        continue
+                    key = (message.name, name)
+                    buffer = self.buffers.get(key)
+                    if buffer is None:
+                        buffer = self.buffers[key] = RingBuffer(self.capacity)
+                    buffer.extend(timestamps[present], values[present])
+                    self.changed.add(key)
+    
+    def take_changes(self):
+        """
+        Get the latest sample of every signal updated since the last call
+        Returns a dictionary of (message name, signal name) ->
+        (timestamp, value, samples received).
+        """
+        with self.lock:
+            changed, self.changed = self.changed, set()
+            updates = {}
+            for key in changed:
+                buffer = self.buffers[key]
+                timestamp, value = buffer.latest()
+                updates[key] = (timestamp, value, buffer.count)
+            return updates
+    
+    def get_history(self, message_name, signal_name):
+        """Get the buffered (timestamps, values) of a signal, oldest first"""
+        with self.lock:
+            buffer = self.buffers.get((message_name, signal_name))
+            if buffer is None:
+                return np.zeros(0), np.zeros(0)
+            return buffer.snapshot()
+    
+    def get_sample_count(self, message_name, signal_name):
+        """Number of samples of a signal received so far"""
+        with self.lock:
+            buffer = self.buffers.get((message_name, signal_name))
+            return buffer.count if buffer is not None else 0
+    
+    def get_stats(self):
+        """Counters of the monitor as a dictionary"""
+        with self.lock:
+            elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+            return {
+                'frames': self.frames_received,
+                'unknown': self.unknown_frames,
+                'errors': self.decode_errors,
+                'messages': len(self.message_counts),
+                'elapsed': elapsed,
+                'error': self.error,
+            }
@@ -0,0 +1,248 @@
+"""
+Decoding of recorded CAN traffic against loaded DBC databases
+
+Logs are read through python-can (candump .log, Vector .asc and .blf,
+PEAK .trc, ...) and decoded into physical values. Output is a stream of
+DecodedBatch objects holding one NumPy column per signal rather than a
+dictionary per frame, and only a bounded number of frames is buffered at
+a time, so logs of any size can be decoded in constant memory.
+"""
+
+import time
+import numpy as np
+from model.batch_decoder import BatchDecoder, cross_check
+
+# Log formats read through can.LogReader, by file extension
+LOG_EXTENSIONS = (".asc", ".blf", ".log", ".trc")
+
+def build_dispatch_table(databases):
+    """
+    Map (frame ID, is extended) pairs to cantools Messages across several
+    databases, so a standard and an extended frame sharing a number each
+    get their own message. When two databases define the same frame ID of
+    the same kind, the first one wins.
+    """
+    messages_by_frame_id = {}
+    for db in databases:
+        for msg in db.messages:
+            messages_by_frame_id.setdefault((msg.frame_id, bool(msg.is_extended_frame)), msg)
+    return messages_by_frame_id
+
+def read_log_frames(file_path):
+    """Yield the CAN frames (can.Message) of a log file, skipping error and remote frames"""
+    # python-can is only needed once a log is actually read
+    import can
+    with can.LogReader(file_path) as reader:
+        yield from data_frames(reader)
+
+def data_frames(frames):
+    """Filter error and remote frames out of an iterable of can.Message"""
+    for frame in frames:
+        if frame.is_error_frame or frame.is_remote_frame:
+            continue
+        yield frame
+
+class DecodedBatch:
+    """
+    Decoded frames of a single message
+    
+    timestamps holds one float64 per frame and columns maps each signal
+    name to a float64 array of physical values, NaN where a frame does not
+    carry the signal (multiplexing) or could not be decoded.
+    """
+    
+    __slots__ = ('message', 'timestamps', 'columns')
+    
+    def __init__(self, message, timestamps, columns):
+        self.message = message
+        self.timestamps = timestamps
+        self.columns = columns
+    
+    def __len__(self):
+        return len(self.timestamps)
+
+class DecodeStats:
+    """Running counters of a decoding session"""
+    
+    def __init__(self):
+        self.frames_read = 0
+        self.frames_decoded = 0
+        self.unknown_frames = 0
+        self.decode_errors = 0
+        self.unknown_frame_ids = set()  # Frame ID numbers, standard and extended alike
+        self.cross_check_mismatches = []  # (message name, row, signal, value, cantools value)
+        self.elapsed = 0.0
+    
+    def add(self, other):
+        """Add the counters of another session (e.g. a worker process) to these"""
+        self.frames_read += other.frames_read
+        self.frames_decoded += other.frames_decoded
+        self.unknown_frames += other.unknown_frames
+        self.decode_errors += other.decode_errors
+        self.unknown_frame_ids |= other.unknown_frame_ids
+        self.cross_check_mismatches.extend(other.cross_check_mismatches)
+    
+    def frames_per_second(self):
+        """Decoding throughput over the elapsed time"""
+        return self.frames_read / self.elapsed if self.elapsed > 0 else 0.0
+
+class LogDecoder:
+    """
+    Streams CAN frames into per-message DecodedBatch objects
+    
+    Frames are grouped by ID in buffers of at most batch_size frames in
+    total; whenever the buffers fill up, every group is decoded and
+    yielded, so memory use does not grow with the length of the log.
+    
+    Groups are decoded with the vectorized BatchDecoder. vectorized=False
+    falls back to one cantools decode per frame, and check=True compares
+    every vectorized batch against cantools, recording differences in
+    stats.cross_check_mismatches.
+    """
+    
+    DEFAULT_BATCH_SIZE = 100000
+    
+    def __init__(self, databases, batch_size=DEFAULT_BATCH_SIZE, vectorized=True, check=False):
+        self.messages_by_frame_id = build_dispatch_table(databases)
+        self.batch_size = max(1, batch_size)
+        self.vectorized = vectorized
+        self.check = check
+        self.batch_decoder = BatchDecoder()
+        self.stats = DecodeStats()
+    
+    @classmethod
+    def from_model(cls, model, file_paths=None, **kwargs):
+        """
+        Create a decoder for the databases loaded in a DBCModel
+        file_paths limits and orders the databases used (default: all loaded)
+        """
+        if file_paths is None:
+            file_paths = model.get_all_dbc_files()
+        databases = [model.get_dbc(file_path) for file_path in file_paths]
+        return cls([db for db in databases if db is not None], **kwargs)
+    
+    def decode_file(self, file_path):
+        """Decode a log file or frame store, yielding DecodedBatch objects"""
+        from model.frame_store import FRAME_STORE_EXTENSION
+        if file_path.lower().endswith(FRAME_STORE_EXTENSION):
+            return self._decode_store_file(file_path)
+        return self.decode_frames(read_log_frames(file_path))
+    
+    def _decode_store_file(self, file_path):
+        from model.frame_store import FrameStore
+        with FrameStore(file_path) as store:
+            yield from self.decode_frame_store(store)
+    
+    def decode_frame_store(self, store, frame_keys=None, start=None, end=None):
+        """
+        Decode the frames of a FrameStore, optionally limited to some
+        (frame ID, is extended) pairs and a time window [start, end).
+        Batches come message by message, each in time order. Payloads are
+        taken straight from the store's mapped records, without building a
+        bytes object per frame.
+        """
+        stats = self.stats
+        started = time.perf_counter()
+        try:
+            for frame_id, extended in (store.get_frame_keys() if frame_keys is None else frame_keys):
+                positions = store.select(frame_id, start, end, extended=extended)
+                stats.frames_read += len(positions)
+                message = self.messages_by_frame_id.get((frame_id, bool(extended)))
+                if message is None:
+                    if len(positions):
+                        stats.unknown_frames += len(positions)
+                        stats.unknown_frame_ids.add(frame_id)
+                    continue
+                for first in range(0, len(positions), self.batch_size):
+                    yield self.decode_store_rows(store, message, positions[first:first + self.batch_size])
+        finally:
+            stats.elapsed += time.perf_counter() - started
+    
+    def decode_store_rows(self, store, message, positions):
+        """Decode the store records at the given positions, all of one message"""
+        timestamps = store.timestamps[positions]
+        dlcs = store.dlcs[positions]
+        payloads = store.payloads[positions]
+        if not self.vectorized or self.check:
+            # The cantools paths need one bytes object per frame
+            data = [bytes(row[:dlc]) for row, dlc in zip(payloads, dlcs)]
+            return self.decode_group(message, timestamps, data)
+        layout = self.batch_decoder.layout(message)
+        if payloads.shape[1] < layout.width:
+            payloads = np.pad(payloads, ((0, 0), (0, layout.width - payloads.shape[1])))
+        columns = layout.decode(payloads, dlcs)
+        self.stats.frames_decoded += len(positions)
+        return DecodedBatch(message, timestamps.astype(np.float64), columns)
+    
+    def decode_frames(self, frames):
+        """Decode an iterable of can.Message frames, yielding DecodedBatch objects"""
+        return self.decode_records((frame.timestamp, frame.arbitration_id, frame.is_extended_id,
+                                    frame.data) for frame in frames)
+    
+    def decode_records(self, records):
+        """
+        Decode an iterable of (timestamp, frame_id, is_extended, data)
+        tuples, yielding DecodedBatch objects
+        """
+        messages_by_frame_id = self.messages_by_frame_id
+        stats = self.stats
+        started = time.perf_counter()
+        # (frame_id, is_extended) -> (timestamps, payloads) of the frames not yet decoded
+        pending = {}
+        pending_count = 0
+        try:
+            for timestamp, frame_id, extended, data in records:
+                stats.frames_read += 1
+                key = (frame_id, bool(extended))
+                if key not in messages_by_frame_id:
+                    stats.unknown_frames += 1
+                    stats.unknown_frame_ids.add(frame_id)
+                    continue
+                group = pending.get(key)
+                if group is None:
+                    group = pending[key] = ([], [])
+                group[0].append(timestamp)
+                group[1].append(bytes(data))
+                pending_count += 1
+                if pending_count >= self.batch_size:
+                    yield from self._flush(pending)
+                    pending = {}
+                    pending_count = 0
+            yield from self._flush(pending)
+        finally:
+            stats.elapsed += time.perf_counter() - started
+    
+    def _flush(self, pending):
+        """Decode and yield every buffered group"""
+        for key, (timestamps, payloads) in pending.items():
+            yield self.decode_group(self.messages_by_frame_id[key], timestamps, payloads)
+    
+    def decode_group(self, message, timestamps, payloads):
+        """Decode the payloads of frames of one message into a DecodedBatch"""
+        if not self.vectorized:
+            return self.decode_group_per_frame(message, timestamps, payloads)
+        columns = self.batch_decoder.decode(message, payloads)
+        self.stats.frames_decoded += len(payloads)
+        if self.check:
+            for row, name, value, expected in cross_check(message, payloads, columns):
+                self.stats.cross_check_mismatches.append((message.name, row, name, value, expected))
+        return DecodedBatch(message, np.asarray(timestamps, dtype=np.float64), columns)
+    
+    def decode_group_per_frame(self, message, timestamps, payloads):
+        """Decode frames one at a time with cantools (the reference decoder)"""
+        count = len(payloads)
+        columns = {signal.name: np.full(count, np.nan) for signal in message.signals}
+        decode = message.decode
+        errors = 0
+        for row, data in enumerate(payloads):
+            try:
+                values = decode(data, decode_choices=False)
+            except Exception:
+                # Short or malformed payloads leave the row as NaN
+                errors += 1
+                continue
+            for name, value in values.items():
+                columns[name][row] = value
+        self.stats.frames_decoded += count - errors
+        self.stats.decode_errors += errors
+        return DecodedBatch(message, np.asarray(timestamps, dtype=np.float64), columns)
@@ -0,0 +1,226 @@
+"""
+Sharded decoding of large CAN logs on a process pool
+
+Text logs (candump .log, .asc, .trc) are split into line-aligned byte
+ranges that worker processes read, parse and decode independently. Frame
+stores are split by frame ID and record range, each worker mapping the
+store itself. Other logs (.blf, compressed files) are read here and
+shipped to the workers in chunks of raw frames. Each worker builds its LogDecoder, and so its
+dispatch table and signal layouts, once when it starts. Chunks are
+yielded back in file order, so batches come out in the same timestamp
+order as with LogDecoder; only a few chunks are in flight at a time.
+"""
+
+import io
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from model.frame_store import FRAME_STORE_EXTENSION, FrameStore
+from model.log_decoder import (LogDecoder, DecodedBatch, DecodeStats, build_dispatch_table,
+                               read_log_frames, data_frames)
+
+# Text formats whose frame lines can be parsed independently of each other
+SHARDABLE_EXTENSIONS = (".log", ".asc", ".trc")
+
+# Decoder of the current worker process, built once by _init_worker
+_worker_decoder = None
+
+# Frame stores opened by the current worker process, by path
+_worker_stores = {}
+
+def _init_worker(databases, batch_size, check):
+    global _worker_decoder
+    _worker_decoder = LogDecoder(databases, batch_size, check=check)
+
+def _message_key(message):
+    """Get the dispatch table key of a message"""
+    return message.frame_id, bool(message.is_extended_frame)
+
+def _decode_in_worker(records):
+    """
+    Decode records in a worker; returns ((frame_id, is_extended),
+    timestamps, columns) tuples, which pickle far smaller than DecodedBatch
+    with its Message, and the worker's counters for this chunk
+    """
+    decoder = _worker_decoder
+    decoder.stats = DecodeStats()
+    results = [(_message_key(batch.message), batch.timestamps, batch.columns)
+               for batch in decoder.decode_records(records)]
+    return results, decoder.stats
+
+def _decode_text_range(file_path, header, start, end):
+    """Parse and decode the lines of a text log between two byte offsets"""
+    import can
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('latin-1')
+    reader_class = {
+        ".log": can.CanutilsLogReader,
+        ".asc": can.ASCReader,
+        ".trc": can.TRCReader,
+    }[os.path.splitext(file_path)[1].lower()]
+    # The header (base, start time, file version, ...) tells the reader how
+    # to interpret the lines, so every shard is parsed with it
+    reader = reader_class(io.StringIO(header + text))
+    return _decode_in_worker((frame.timestamp, frame.arbitration_id, frame.is_extended_id,
+                              frame.data) for frame in data_frames(reader))
+
+def _decode_record_chunk(timestamps, frame_ids, extended, payloads):
+    """Decode a chunk of frames read by the parent process"""
+    return _decode_in_worker(zip(timestamps, frame_ids, extended, payloads))
+
+def _decode_store_chunk(store_path, frame_id, extended, start, end):
+    """
+    Decode the records of a frame ID of one kind at index positions
+    [start, end) of a frame store
+    """
+    from model.frame_store import FrameStore
+    store = _worker_stores.get(store_path)
+    if store is None:
+        store = _worker_stores[store_path] = FrameStore(store_path)
+    decoder = _worker_decoder
+    decoder.stats = DecodeStats()
+    key = (frame_id, extended)
+    message = decoder.messages_by_frame_id[key]
+    positions = store.positions_of(frame_id, extended)[start:end]
+    decoder.stats.frames_read += len(positions)
+    batch = decoder.decode_store_rows(store, message, positions)
+    return [(key, batch.timestamps, batch.columns)], decoder.stats
+
+def split_text_log(file_path, chunk_size):
+    """
+    Split a text log into its header and line-aligned (start, end) byte ranges
+    The header is every leading line that is not a frame (frame lines start
+    with a timestamp, or "(" in candump logs).
+    """
+    file_size = os.path.getsize(file_path)
+    header_lines = []
+    with open(file_path, 'rb') as f:
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            stripped = line.lstrip()
+            if stripped[:1].isdigit() or stripped[:1] == b"(":
+                break
+            header_lines.append(line)
+        header = b"".join(header_lines)
+        
+        ranges = []
+        start = len(header)
+        while start < file_size:
+            f.seek(min(start + chunk_size, file_size))
+            f.readline()  # Move to the end of the line
+            end = min(f.tell(), file_size)
+            if end <= start:
+                end = file_size
+            ranges.append((start, end))
+            start = end
+    return header.decode('latin-1'), ranges
+
+class ParallelLogDecoder:
+    """
+    Decodes a log on a pool of worker processes, yielding DecodedBatch objects
+    
+    workers defaults to the number of CPUs. chunk_size is the size in bytes
+    of the text ranges given to the workers; chunk_frames is the number of
+    frames per chunk for logs that have to be read serially.
+    """
+    
+    DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+    DEFAULT_CHUNK_FRAMES = 200000
+    
+    def __init__(self, databases, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 chunk_frames=DEFAULT_CHUNK_FRAMES, batch_size=LogDecoder.DEFAULT_BATCH_SIZE,
+                 check=False):
+        self.databases = list(databases)
+        self.messages_by_frame_id = build_dispatch_table(self.databases)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.chunk_frames = max(1, chunk_frames)
+        self.batch_size = batch_size
+        self.check = check
+        self.stats = DecodeStats()
+    
+    @classmethod
+    def from_model(cls, model, file_paths=None, **kwargs):
+        """
+        Create a decoder for the databases loaded in a DBCModel
+        file_paths limits and orders the databases used (default: all loaded)
+        """
+        if file_paths is None:
+            file_paths = model.get_all_dbc_files()
+        databases = [model.get_dbc(file_path) for file_path in file_paths]
+        return cls([db for db in databases if db is not None], **kwargs)
+    
+    def decode_file(self, file_path):
+        """Decode a log file, yielding DecodedBatch objects in file order"""
+        started = time.perf_counter()
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.databases, self.batch_size, self.check),
+        )
+        try:
+            if file_path.lower().endswith(FRAME_STORE_EXTENSION):
+                tasks = self._store_chunk_tasks(file_path)
+            elif os.path.splitext(file_path)[1].lower() in SHARDABLE_EXTENSIONS:
+                header, ranges = split_text_log(file_path, self.chunk_size)
+                tasks = ((_decode_text_range, file_path, header, start, end)
+                         for start, end in ranges)
+            else:
+                tasks = self._record_chunk_tasks(file_path)
+            yield from self._run(executor, tasks)
+        finally:
+            executor.shutdown(cancel_futures=True)
+            self.stats.elapsed += time.perf_counter() - started
+    
+    def _store_chunk_tasks(self, file_path):
+        """Cut a frame store into per-ID ranges of at most batch_size records"""
+        with FrameStore(file_path) as store:
+            counts = [(frame_id, extended, store.get_frame_count(frame_id, extended))
+                      for frame_id, extended in store.get_frame_keys()]
+        for frame_id, extended, count in counts:
+            if (frame_id, extended) not in self.messages_by_frame_id:
+                self.stats.frames_read += count
+                self.stats.unknown_frames += count
+                self.stats.unknown_frame_ids.add(frame_id)
+                continue
+            for start in range(0, count, self.batch_size):
+                yield (_decode_store_chunk, file_path, frame_id, extended,
+                       start, start + self.batch_size)
+    
+    def _record_chunk_tasks(self, file_path):
+        """Read a log serially and cut it into chunks of raw frames"""
+        timestamps, frame_ids, extended, payloads = [], [], [], []
+        for frame in read_log_frames(file_path):
+            timestamps.append(frame.timestamp)
+            frame_ids.append(frame.arbitration_id)
+            extended.append(frame.is_extended_id)
+            payloads.append(bytes(frame.data))
+            if len(timestamps) >= self.chunk_frames:
+                yield (_decode_record_chunk, timestamps, frame_ids, extended, payloads)
+                timestamps, frame_ids, extended, payloads = [], [], [], []
+        if timestamps:
+            yield (_decode_record_chunk, timestamps, frame_ids, extended, payloads)
+    
+    def _run(self, executor, tasks):
+        """Submit tasks, keeping a few per worker in flight, and yield results in order"""
+        max_pending = 2 * self.workers
+        pending = deque()
+        for function, *args in tasks:
+            pending.append(executor.submit(function, *args))
+            if len(pending) >= max_pending:
+                yield from self._collect(pending.popleft())
+        while pending:
+            yield from self._collect(pending.popleft())
+    
+    def _collect(self, future):
+        """Turn a worker's results back into DecodedBatch objects"""
+        results, stats = future.result()
+        self.stats.add(stats)
+        for key, timestamps, columns in results:
+            yield DecodedBatch(self.messages_by_frame_id[key],
+                               np.asarray(timestamps, dtype=np.float64), columns)
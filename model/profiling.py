@@ -0,0 +1,289 @@
+"""
+Timing spans around the application's hot paths
+
+Functions are wrapped with @timed(name) and blocks with span(name). While
+profiling is disabled, which is the default, a wrapped function costs one
+extra call and one global lookup, and span() returns a shared object that
+does nothing. Once enable() is called, every span records its duration,
+an optional row count and the process's peak memory, keeps running totals
+per operation for the summary panel, and passes the event to the sinks:
+a rotating text log and/or a Chrome trace-event JSON file (open it in
+chrome://tracing or https://ui.perfetto.dev).
+
+Profiling is switched on at startup with --profile PATH or the
+DBC_MASTER_PROFILE environment variable; a PATH ending in .json writes a
+Chrome trace, anything else a rotating log.
+"""
+
+import atexit
+import functools
+import os
+import sys
+import threading
+import time
+
+PROFILE_ENV = "DBC_MASTER_PROFILE"
+
+# Rotating log: size of a file before it is rotated, and rotated files kept
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Most events kept for a Chrome trace; later ones are counted but dropped
+TRACE_MAX_EVENTS = 1000000
+
+_recorder = None  # The active SpanRecorder, None while profiling is disabled
+
+def get_peak_memory():
+    """Get the peak resident memory of the process in bytes, or None if unknown"""
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+class SpanStats:
+    """Running totals of one operation"""
+    
+    __slots__ = ('name', 'count', 'total', 'maximum', 'last', 'rows', 'peak_memory')
+    
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total = 0.0      # Seconds
+        self.maximum = 0.0
+        self.last = 0.0
+        self.rows = None      # Row count of the last call that reported one
+        self.peak_memory = None
+    
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+    
+    def copy(self):
+        stats = SpanStats(self.name)
+        for attribute in self.__slots__:
+            setattr(stats, attribute, getattr(self, attribute))
+        return stats
+
+class RotatingLogSink:
+    """Writes one line per span to a size-rotated text log"""
+    
+    def __init__(self, path, max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT):
+        # Imported here to keep logging out of application startup
+        import logging
+        import logging.handlers
+        self.path = path
+        self.handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        # A logger of its own, so the application's logging configuration never applies
+        self.logger = logging.Logger("dbc_master.profiling")
+        self.logger.addHandler(self.handler)
+    
+    def write(self, name, started, duration, thread_name, args):
+        details = " ".join(f"{key}={value}" for key, value in args.items())
+        self.logger.info(f"{name} {duration * 1000:.3f} ms [{thread_name}] {details}".rstrip())
+    
+    def close(self):
+        self.handler.close()
+        self.logger.removeHandler(self.handler)
+
+class ChromeTraceSink:
+    """Collects spans as Chrome trace events and writes them to a JSON file on close"""
+    
+    def __init__(self, path, max_events=TRACE_MAX_EVENTS):
+        self.path = path
+        self.max_events = max_events
+        self.events = []
+        self.dropped = 0
+        self.pid = os.getpid()
+    
+    def write(self, name, started, duration, thread_name, args):
+        if len(self.events) >= self.max_events:
+            self.dropped += 1
+            return
+        self.events.append({
+            "name": name,
+            "ph": "X",  # Complete event: start and duration
+            "ts": round(started * 1e6, 3),
+            "dur": round(duration * 1e6, 3),
+            "pid": self.pid,
+            "tid": thread_name,
+            "args": args,
+        })
+    
+    def close(self):
+        import json
+        document = {"traceEvents": self.events, "displayTimeUnit": "ms"}
+        if self.dropped:
+            document["otherData"] = {"dropped_events": self.dropped}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(document, f)
+
+class Span:
+    """An operation being timed; args are reported with it"""
+    
+    __slots__ = ('recorder', 'name', 'args', 'started')
+    
+    def __init__(self, recorder, name, args):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+        self.started = 0.0
+    
+    def set(self, **args):
+        """Report more arguments, e.g. set(rows=len(rows))"""
+        self.args.update(args)
+    
+    def __enter__(self):
+        self.recorder.push(self)
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = time.perf_counter() - self.started
+        self.recorder.pop(self, duration)
+        return False
+
+class NullSpan:
+    """The span returned while profiling is disabled"""
+    
+    __slots__ = ()
+    
+    def set(self, **args):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+NULL_SPAN = NullSpan()
+
+class SpanRecorder:
+    """Receives finished spans, keeps per-operation totals and feeds the sinks"""
+    
+    def __init__(self, sinks=None):
+        self.sinks = list(sinks or [])
+        self.stats = {}  # Operation name -> SpanStats
+        self.origin = time.perf_counter()  # Trace timestamps are relative to this
+        self._lock = threading.Lock()
+        self._local = threading.local()  # Stack of the open spans of each thread
+    
+    def push(self, span):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(span)
+    
+    def pop(self, span, duration):
+        stack = self._local.stack
+        if stack and stack[-1] is span:
+            stack.pop()
+        peak_memory = get_peak_memory()
+        if peak_memory is not None:
+            span.args["peak_memory_mb"] = round(peak_memory / (1024 * 1024), 1)
+        with self._lock:
+            stats = self.stats.get(span.name)
+            if stats is None:
+                stats = self.stats[span.name] = SpanStats(span.name)
+            stats.count += 1
+            stats.total += duration
+            stats.last = duration
+            stats.maximum = max(stats.maximum, duration)
+            if "rows" in span.args:
+                stats.rows = span.args["rows"]
+            stats.peak_memory = peak_memory
+            thread_name = threading.current_thread().name
+            for sink in self.sinks:
+                sink.write(span.name, span.started - self.origin, duration, thread_name, span.args)
+    
+    def current(self):
+        """Get the innermost open span of the calling thread, or None"""
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1] if stack else None
+    
+    def get_summary(self):
+        """Get a copy of the SpanStats of every operation, by name"""
+        with self._lock:
+            return sorted((stats.copy() for stats in self.stats.values()),
+                          key=lambda stats: stats.name)
+    
+    def reset(self):
+        """Forget the running totals (the sinks keep what they wrote)"""
+        with self._lock:
+            self.stats.clear()
+    
+    def close(self):
+        with self._lock:
+            for sink in self.sinks:
+                sink.close()
+            self.sinks = []
+
+def create_sink(path):
+    """Create the sink for a path: a Chrome trace for .json files, else a rotating log"""
+    if path.lower().endswith(".json"):
+        return ChromeTraceSink(path)
+    return RotatingLogSink(path)
+
+def enable(path=None):
+    """
+    Start profiling, writing the spans to path if given (see create_sink)
+    Returns the SpanRecorder; profiling already enabled is restarted.
+    """
+    global _recorder
+    disable()
+    _recorder = SpanRecorder([create_sink(path)] if path else [])
+    return _recorder
+
+def disable():
+    """Stop profiling, flushing and closing the sinks"""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is not None:
+        recorder.close()
+
+def is_enabled():
+    return _recorder is not None
+
+def get_recorder():
+    """Get the active SpanRecorder, or None while profiling is disabled"""
+    return _recorder
+
+def span(name, **args):
+    """Time a block: with span("operation", file=path) as s: ...; s.set(rows=n)"""
+    recorder = _recorder
+    if recorder is None:
+        return NULL_SPAN
+    return Span(recorder, name, args)
+
+def set_rows(rows):
+    """Report the row count of the innermost open span of the calling thread"""
+    recorder = _recorder
+    if recorder is None:
+        return
+    current = recorder.current()
+    if current is not None:
+        current.args["rows"] = rows
+
+def timed(name):
+    """
+    Decorator timing every call of a function as a span
+    Qt signals pass their arguments on to the wrapper, so connect wrapped
+    methods to signals with arguments through a lambda.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            recorder = _recorder
+            if recorder is None:
+                return function(*args, **kwargs)
+            with Span(recorder, name, {}):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# Chrome traces are only written when their sink is closed
+atexit.register(disable)
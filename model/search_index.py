@@ -0,0 +1,170 @@
+"""
+Substring search over every loaded DBC file
+
+Message names and comments, signal names and comments, units and choice
+labels of each file are indexed by trigram: every three-character
+substring maps to the sorted array of texts containing it. A query of
+three or more characters only checks the texts holding all of its
+trigrams; shorter queries scan the file's distinct texts. Each file has
+its own index, so loading or removing a file never touches the others,
+and a file is indexed by the first search after it is added.
+"""
+
+import numpy as np
+
+# Fields a hit can be found in
+FIELD_MESSAGE = "Message"
+FIELD_MESSAGE_COMMENT = "Message Comment"
+FIELD_SIGNAL = "Signal"
+FIELD_SIGNAL_COMMENT = "Signal Comment"
+FIELD_UNIT = "Unit"
+FIELD_CHOICE = "Choice"
+
+class SearchHit:
+    """A field of a message or signal matching a query"""
+    
+    __slots__ = ('file_path', 'message', 'signal', 'field', 'text')
+    
+    def __init__(self, file_path, message, signal, field, text):
+        self.file_path = file_path
+        self.message = message    # Message name
+        self.signal = signal      # Signal name, None for message fields
+        self.field = field
+        self.text = text          # The matching text, as written in the DBC
+    
+    def __repr__(self):
+        target = self.message if self.signal is None else f"{self.message}.{self.signal}"
+        return f"<SearchHit {self.file_path}: {target} {self.field}={self.text!r}>"
+
+def iter_searchable_texts(db):
+    """Yield (field, message name, signal name, text) for every searchable text of a database"""
+    for msg in db.messages:
+        yield FIELD_MESSAGE, msg.name, None, msg.name
+        comment = getattr(msg, 'comment', None)
+        if comment:
+            yield FIELD_MESSAGE_COMMENT, msg.name, None, comment
+        for signal in msg.signals:
+            yield FIELD_SIGNAL, msg.name, signal.name, signal.name
+            comment = getattr(signal, 'comment', None)
+            if comment:
+                yield FIELD_SIGNAL_COMMENT, msg.name, signal.name, comment
+            unit = getattr(signal, 'unit', None)
+            if unit:
+                yield FIELD_UNIT, msg.name, signal.name, unit
+            choices = getattr(signal, 'choices', None)
+            if choices:
+                for label in choices.values():
+                    yield FIELD_CHOICE, msg.name, signal.name, str(label)
+
+class FileSearchIndex:
+    """Trigram index of the searchable texts of one database"""
+    
+    def __init__(self, file_path, db):
+        self.file_path = file_path
+        self.texts = []      # Distinct lowercase texts
+        self.targets = []    # Per distinct text: [(field, message, signal, original text), ...]
+        
+        text_ids = {}
+        for field, message, signal, text in iter_searchable_texts(db):
+            lower = text.lower()
+            text_id = text_ids.get(lower)
+            if text_id is None:
+                text_id = text_ids[lower] = len(self.texts)
+                self.texts.append(lower)
+                self.targets.append([])
+            self.targets[text_id].append((field, message, signal, text))
+        
+        # Text ids are added in increasing order, so every posting list is sorted
+        postings = {}
+        for text_id, text in enumerate(self.texts):
+            for trigram in {text[i:i + 3] for i in range(len(text) - 2)}:
+                posting = postings.get(trigram)
+                if posting is None:
+                    postings[trigram] = [text_id]
+                else:
+                    posting.append(text_id)
+        self.trigrams = {trigram: np.array(posting, dtype=np.int32)
+                         for trigram, posting in postings.items()}
+    
+    def candidates(self, query):
+        """Get the ids of the texts that may contain a lowercase query"""
+        if len(query) < 3:
+            return range(len(self.texts))
+        postings = []
+        for trigram in {query[i:i + 3] for i in range(len(query) - 2)}:
+            posting = self.trigrams.get(trigram)
+            if posting is None:
+                return ()
+            postings.append(posting)
+        postings.sort(key=len)
+        ids = postings[0]
+        for posting in postings[1:]:
+            ids = np.intersect1d(ids, posting, assume_unique=True)
+            if not len(ids):
+                break
+        return ids.tolist()
+    
+    def search(self, query, limit=None):
+        """Get the hits of a lowercase query, at most limit of them"""
+        hits = []
+        texts = self.texts
+        for text_id in self.candidates(query):
+            if query not in texts[text_id]:
+                continue
+            targets = self.targets[text_id]
+            if limit is not None and len(hits) + len(targets) >= limit:
+                targets = targets[:limit - len(hits)]
+            for field, message, signal, text in targets:
+                hits.append(SearchHit(self.file_path, message, signal, field, text))
+            if limit is not None and len(hits) >= limit:
+                break
+        return hits
+
+class SearchIndex:
+    """
+    Search index over several databases, one FileSearchIndex per file
+    
+    add_file() and remove_file() are cheap; a file added is indexed by
+    the next search.
+    """
+    
+    def __init__(self):
+        self.files = {}      # file_path -> FileSearchIndex
+        self.pending = {}    # file_path -> database not indexed yet
+    
+    def add_file(self, file_path, db):
+        """Add (or replace) a database"""
+        self.files.pop(file_path, None)
+        self.pending[file_path] = db
+    
+    def remove_file(self, file_path):
+        """Forget a database"""
+        self.files.pop(file_path, None)
+        self.pending.pop(file_path, None)
+    
+    def get_file_paths(self):
+        """Get the paths of every file in the index"""
+        return list(self.files) + list(self.pending)
+    
+    def index_pending(self):
+        """Index the files added since the last search"""
+        for file_path, db in list(self.pending.items()):
+            self.files[file_path] = FileSearchIndex(file_path, db)
+            del self.pending[file_path]
+    
+    def search(self, query, limit=1000):
+        """
+        Find a case-insensitive substring in every file
+        Returns up to limit SearchHit objects, file by file.
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+        self.index_pending()
+        hits = []
+        for file_index in self.files.values():
+            remaining = None if limit is None else limit - len(hits)
+            if remaining is not None and remaining <= 0:
+                break
+            hits.extend(file_index.search(query, remaining))
+        return hits
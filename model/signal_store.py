@@ -0,0 +1,145 @@
+import sys
+import numpy as np
+from model.dbc_index import DBCIndex
+from model.dbc_columns import (SIGNAL_COLUMNS, SIGNAL_NUMERIC_COLUMNS, format_number,
+                               get_message_label, get_multiplexer_text,
+                               get_choices_text)
+from model.table_sort import text_rank_keys
+
+BYTE_ORDERS = ("little_endian", "big_endian")
+
+class SignalStore:
+    """
+    Compact, columnar copy of every signal in a database
+    
+    Built once per database. Numeric attributes live in NumPy arrays and
+    text attributes in lists of interned strings, so a table can show
+    hundreds of thousands of signals without an object per cell. Rows are
+    ordered by signal name, like the all-signals table.
+    """
+    
+    def __init__(self, db, index=None):
+        pairs = [(signal, msg) for msg in db.messages for signal in msg.signals]
+        pairs.sort(key=lambda pair: pair[0].name)
+        count = len(pairs)
+        
+        # Object references, for navigation to details
+        self.messages = list(db.messages)
+        self.signals = [signal for signal, _ in pairs]
+        if index is None:
+            index = DBCIndex(db)
+        self.message_index = np.fromiter(
+            (index.get_message_position(msg) for _, msg in pairs), dtype=np.int32, count=count)
+        
+        # Numeric columns
+        self.start = np.fromiter((signal.start for signal, _ in pairs), dtype=np.int32, count=count)
+        self.length = np.fromiter((signal.length for signal, _ in pairs), dtype=np.int32, count=count)
+        self.scale = np.fromiter(
+            (self._to_float(getattr(signal, 'scale', 1.0)) for signal, _ in pairs),
+            dtype=np.float64, count=count)
+        self.offset = np.fromiter(
+            (self._to_float(getattr(signal, 'offset', 0.0)) for signal, _ in pairs),
+            dtype=np.float64, count=count)
+        self.minimum = np.fromiter(
+            (self._to_float(getattr(signal, 'minimum', None)) for signal, _ in pairs),
+            dtype=np.float64, count=count)
+        self.maximum = np.fromiter(
+            (self._to_float(getattr(signal, 'maximum', None)) for signal, _ in pairs),
+            dtype=np.float64, count=count)
+        self.byte_order = np.fromiter(
+            (1 if getattr(signal, 'byte_order', None) == "big_endian" else 0 for signal, _ in pairs),
+            dtype=np.uint8, count=count)
+        self.is_signed = np.fromiter(
+            (bool(getattr(signal, 'is_signed', False)) for signal, _ in pairs),
+            dtype=np.bool_, count=count)
+        
+        # Text columns; interning shares repeated units, receivers, etc.
+        intern = sys.intern
+        self.names = [intern(signal.name) for signal, _ in pairs]
+        self.message_labels = [intern(get_message_label(msg)) for msg in self.messages]
+        self.initials = [intern(format_number(getattr(signal, 'initial', None))) for signal, _ in pairs]
+        self.units = [intern(getattr(signal, 'unit', None) or "") for signal, _ in pairs]
+        self.multiplexers = [intern(get_multiplexer_text(signal)) for signal, _ in pairs]
+        self.choices = [intern(get_choices_text(signal)) for signal, _ in pairs]
+        self.comments = [getattr(signal, 'comment', None) or "" for signal, _ in pairs]
+        self.receivers = [intern(", ".join(getattr(signal, 'receivers', None) or []))
+                          for signal, _ in pairs]
+        
+        # Per-column text accessors, indexed like SIGNAL_COLUMNS
+        self._column_text = [
+            lambda row: self.names[row],
+            lambda row: self.message_labels[self.message_index[row]],
+            lambda row: str(self.start[row]),
+            lambda row: str(self.length[row]),
+            lambda row: BYTE_ORDERS[self.byte_order[row]],
+            lambda row: "Yes" if self.is_signed[row] else "No",
+            lambda row: self.initials[row],
+            # Formatted from the signal, so 1 and 1.0 read as the DBC gave them
+            lambda row: format_number(getattr(self.signals[row], 'scale', 1.0)),
+            lambda row: format_number(getattr(self.signals[row], 'offset', 0.0)),
+            lambda row: format_number(getattr(self.signals[row], 'minimum', None)),
+            lambda row: format_number(getattr(self.signals[row], 'maximum', None)),
+            lambda row: self.units[row],
+            lambda row: self.multiplexers[row],
+            lambda row: self.choices[row],
+            lambda row: self.comments[row],
+            lambda row: self.receivers[row],
+        ]
+        
+        # Numeric arrays by column, for sorting
+        self._numeric_columns = dict(zip(
+            SIGNAL_NUMERIC_COLUMNS,
+            [self.start, self.length, self.scale, self.offset, self.minimum, self.maximum]
+        ))
+    
+        # Sort keys by column, built on first sort
+        self._sort_keys = {}
+    
+    @staticmethod
+    def _to_float(value):
+        """Convert an optional number to float, using NaN for missing values"""
+        if value is None:
+            return np.nan
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+    
+    def __len__(self):
+        return len(self.signals)
+    
+    def column_count(self):
+        """Number of columns, matching SIGNAL_COLUMNS"""
+        return len(SIGNAL_COLUMNS)
+    
+    def text(self, row, col):
+        """Get the table text of a row and column"""
+        return self._column_text[col](row)
+    
+    def numeric_column(self, col):
+        """Get the NumPy array behind a numeric column, or None for text columns"""
+        return self._numeric_columns.get(col)
+    
+    def sort_keys(self, col):
+        """
+        Get a NumPy array of sort keys for a column, one per row
+        Numeric columns sort by value (missing values as 0); text columns by
+        the rank of their case-insensitive text. Keys are computed once.
+        """
+        keys = self._sort_keys.get(col)
+        if keys is None:
+            values = self.numeric_column(col)
+            if values is not None:
+                keys = np.nan_to_num(values.astype(np.float64), nan=0.0)
+            else:
+                keys = text_rank_keys([self.text(row, col).lower() for row in range(len(self))])
+            self._sort_keys[col] = keys
+        return keys
+    
+    def signal(self, row):
+        """Get the cantools Signal of a row"""
+        return self.signals[row]
+    
+    def message(self, row):
+        """Get the cantools Message a row's signal belongs to"""
+        return self.messages[self.message_index[row]]
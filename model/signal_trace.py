@@ -0,0 +1,182 @@
+"""
+Level-of-detail access to decoded signals of a frame store, for plotting
+
+A plot only ever needs about two points per horizontal pixel: the minimum
+and maximum of the samples that fall in it. SignalTrace decodes a
+message's frames once, in chunks, and keeps a pyramid of min/max overview
+levels of each signal instead of the samples themselves. A zoomed-out
+view is served from the coarsest level that still has enough points; once
+the visible window holds few enough frames, exactly those frames are
+decoded again from the store. Either way a redraw touches a few points per
+pixel, however long the trace.
+"""
+
+import numpy as np
+from model.log_decoder import LogDecoder
+
+# Samples reduced to one min/max pair in the finest overview level, and
+# points of a level reduced to one pair in the next
+LEVEL_BLOCK_SIZE = 16
+
+# Levels stop growing coarser below this many points
+MIN_LEVEL_POINTS = 4096
+
+# A window is drawn from the finest source with at most this many points per pixel
+POINTS_PER_BUCKET = 8
+
+def reduce_blocks(timestamps, values, block_size):
+    """
+    Reduce every block_size consecutive samples to their minimum and
+    maximum, kept in time order; returns the (timestamps, values) of the
+    remaining points
+    """
+    count = len(values)
+    if count <= 2:
+        return timestamps, values
+    full = count - count % block_size
+    indexes = []
+    if full:
+        blocks = values[:full].reshape(-1, block_size)
+        base = np.arange(0, full, block_size)
+        indexes.append(base + blocks.argmin(axis=1))
+        indexes.append(base + blocks.argmax(axis=1))
+    if full < count:
+        tail = values[full:]
+        indexes.append(np.array([full + tail.argmin(), full + tail.argmax()]))
+    keep = np.unique(np.concatenate(indexes))
+    return timestamps[keep], values[keep]
+
+def decimate_min_max(timestamps, values, start, end, buckets):
+    """
+    Reduce time-sorted samples to the minimum and maximum of each of
+    buckets equal slices of [start, end], kept in time order
+    Samples outside the window go to the first or last bucket, so lines
+    still run to the window edges.
+    """
+    if len(values) <= 2 * buckets or end <= start:
+        return timestamps, values
+    bucket = ((timestamps - start) * (buckets / (end - start))).astype(np.int64)
+    np.clip(bucket, 0, buckets - 1, out=bucket)
+    # Sorting by (bucket, value) puts each bucket's minimum first and maximum last
+    order = np.lexsort((values, bucket))
+    ordered_buckets = bucket[order]
+    edges = np.flatnonzero(np.diff(ordered_buckets)) + 1
+    firsts = np.concatenate(([0], edges))
+    lasts = np.concatenate((edges - 1, [len(order) - 1]))
+    keep = np.unique(np.concatenate((order[firsts], order[lasts])))
+    return timestamps[keep], values[keep]
+
+class SignalTrace:
+    """
+    Plot data of some signals of one message recorded in a FrameStore
+    
+    build() finds and decodes every frame of the message once to compute
+    the overview levels (slow for long traces, so run it in the background);
+    window() then serves any time window at a given resolution.
+    """
+    
+    DEFAULT_CHUNK_SIZE = 1 << 20
+    
+    def __init__(self, store, message, signal_names=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.store = store
+        self.message = message
+        if signal_names is None:
+            signal_names = [signal.name for signal in message.signals]
+        self.signal_names = list(signal_names)
+        self.chunk_size = chunk_size
+        # Only decode_store_rows is used, which is given the message directly
+        self.decoder = LogDecoder([])
+        self.positions = np.zeros(0, dtype=np.int64)  # Store records of the message, in time order
+        self.times = np.zeros(0)
+        self.levels = {name: [] for name in self.signal_names}  # Finest level first
+        self.built = False
+    
+    def __len__(self):
+        return len(self.positions)
+    
+    def time_range(self):
+        """Get the (first, last) timestamp of the message, or None if it never occurs"""
+        if not len(self.times):
+            return None
+        return float(self.times[0]), float(self.times[-1])
+    
+    def build(self, cancel_check=None):
+        """
+        Decode the message's frames chunk by chunk into the overview levels
+        Returns False if cancel_check() asked to stop.
+        """
+        positions = self.store.positions_of(self.message.frame_id,
+                                            extended=self.message.is_extended_frame)
+        times = self.store.timestamps[positions]
+        if not self.store.time_sorted:
+            order = np.argsort(times, kind='stable')
+            positions = positions[order]
+            times = times[order]
+        self.positions = positions
+        self.times = times.astype(np.float64)
+        
+        finest = {name: ([], []) for name in self.signal_names}
+        for first in range(0, len(self.positions), self.chunk_size):
+            if cancel_check is not None and cancel_check():
+                return False
+            batch = self.decoder.decode_store_rows(
+                self.store, self.message, self.positions[first:first + self.chunk_size])
+            for name in self.signal_names:
+                timestamps, values = self._present(batch.timestamps, batch.columns[name])
+                timestamps, values = reduce_blocks(timestamps, values, LEVEL_BLOCK_SIZE)
+                finest[name][0].append(timestamps)
+                finest[name][1].append(values)
+        
+        for name, (timestamps, values) in finest.items():
+            level = (np.concatenate(timestamps) if timestamps else np.zeros(0),
+                     np.concatenate(values) if values else np.zeros(0))
+            levels = [level]
+            while len(level[1]) > MIN_LEVEL_POINTS:
+                coarser = reduce_blocks(level[0], level[1], LEVEL_BLOCK_SIZE)
+                if len(coarser[1]) >= len(level[1]):
+                    break
+                levels.append(coarser)
+                level = coarser
+            self.levels[name] = levels
+        self.built = True
+        return True
+    
+    def window(self, signal_name, start, end, buckets):
+        """
+        Get up to about 2 * buckets (timestamps, values) points showing a
+        signal between start and end, plus one point on either side
+        build() must have been called first.
+        """
+        buckets = max(1, int(buckets))
+        limit = POINTS_PER_BUCKET * buckets
+        first, last = self._window_rows(self.times, start, end)
+        if last - first <= limit:
+            # Few enough frames: decode exactly those
+            batch = self.decoder.decode_store_rows(self.store, self.message,
+                                                   self.positions[first:last])
+            timestamps, values = self._present(batch.timestamps, batch.columns[signal_name])
+        else:
+            # Finest overview level with few enough points in the window
+            # (or the coarsest level if none is)
+            for level_times, level_values in self.levels[signal_name]:
+                level_first, level_last = self._window_rows(level_times, start, end)
+                timestamps = level_times[level_first:level_last]
+                values = level_values[level_first:level_last]
+                if level_last - level_first <= limit:
+                    break
+        return decimate_min_max(timestamps, values, start, end, buckets)
+    
+    @staticmethod
+    def _window_rows(times, start, end):
+        """Row range of sorted times covering [start, end], one row wider on each side"""
+        first = max(0, int(np.searchsorted(times, start, side='left')) - 1)
+        last = min(len(times), int(np.searchsorted(times, end, side='right')) + 1)
+        return first, max(first, last)
+    
+    @staticmethod
+    def _present(timestamps, values):
+        """Drop frames where a multiplexed signal is absent (NaN)"""
+        present = ~np.isnan(values)
+        if present.all():
+            return timestamps, values
+        return timestamps[present], values[present]
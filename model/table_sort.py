@@ -0,0 +1,62 @@
+"""
+Typed sort keys and stable multi-column sorting for the message and signal tables
+
+A sort key is a NumPy array with one key per row: numbers sort by value
+and text by the rank of its case-insensitive form, so sorting compares
+machine numbers rather than formatted strings. Sorting returns a
+permutation of row numbers and never moves the rows themselves. Kept free
+of any Qt imports; sort orders are passed as descending flags.
+"""
+
+import numpy as np
+from model.dbc_columns import (MESSAGE_NUMERIC_COLUMNS, get_message_column_value,
+                               get_message_numeric_value)
+
+def text_rank_keys(texts):
+    """Get the rank of each lowercase text among the distinct texts, as sort keys"""
+    ranks = {text: rank for rank, text in enumerate(sorted(set(texts)))}
+    return np.fromiter((ranks[text] for text in texts), dtype=np.int64, count=len(texts))
+
+def sorted_rows(row_count, keys, descending):
+    """
+    Get the rows sorted by several sort keys, most significant first
+    descending holds one flag per key. The sort is stable in both
+    directions: rows with equal keys keep their order.
+    """
+    if not keys:
+        return np.arange(row_count)
+    # Negated keys sort descending without reversing the order of equal
+    # rows; missing numbers (NaN) stay last either way
+    columns = [-key if flag else key for key, flag in zip(keys, descending)]
+    # lexsort takes the most significant key last
+    return np.lexsort(columns[::-1])
+
+class MessageSortKeys:
+    """
+    Sort keys of every message of a database, per messages table column
+    
+    Built once per database; each column's keys are computed on first use.
+    ID, length, signal count and cycle time sort by value, with missing
+    cycle times last, the other columns by case-insensitive text.
+    """
+    
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self._sort_keys = {}
+    
+    def __len__(self):
+        return len(self.messages)
+    
+    def sort_keys(self, col):
+        """Get a NumPy array of sort keys for a column, one per message"""
+        keys = self._sort_keys.get(col)
+        if keys is None:
+            if col in MESSAGE_NUMERIC_COLUMNS:
+                values = (get_message_numeric_value(msg, col) for msg in self.messages)
+                keys = np.fromiter((np.nan if value is None else value for value in values),
+                                   dtype=np.float64, count=len(self.messages))
+            else:
+                keys = text_rank_keys([get_message_column_value(msg, col).lower()
+                                       for msg in self.messages])
+            self._sort_keys[col] = keys
+        return keys
@@ -0,0 +1,355 @@
+"""
+Export of decoded signal time series to pandas, Parquet and Feather
+
+Decoded batches (see log_decoder) are turned into tables in one of two
+layouts:
+    long: one row per signal value - timestamp, message, signal, value
+    wide: one row per frame - timestamp, message, then one column per
+          signal named "Message.Signal", NaN where the frame lacks it;
+          only the signals of messages found in the trace get a column
+Signal units and choices from the cantools database are kept as metadata.
+Rows are in timestamp order across the whole file. Parquet and Feather
+files are written by external merge sort: decoded rows are sorted in
+bounded runs spilled to disk, then merged row group by row group, so a
+trace never has to fit in memory. pyarrow is needed for the file formats only.
+"""
+
+import json
+import os
+import tempfile
+import numpy as np
+
+LAYOUTS = ("long", "wide")
+EXPORT_FORMATS = ("parquet", "feather")
+
+# Schema metadata key holding the per-signal metadata as JSON
+SIGNAL_METADATA_KEY = b"dbc_master.signals"
+
+# Cells (rows x columns) buffered per row group before it is written
+DEFAULT_ROW_GROUP_CELLS = 16 * 1024 * 1024
+
+def signal_column_name(message, signal):
+    """Get the wide-layout column name of a signal"""
+    return f"{message.name}.{signal.name}"
+
+def signal_metadata(messages):
+    """
+    Describe every signal of some messages, keyed by wide-layout column name:
+    message, frame ID, signal name, unit and choices (value -> label)
+    """
+    metadata = {}
+    for message in messages:
+        for signal in message.signals:
+            choices = getattr(signal, 'choices', None) or {}
+            metadata[signal_column_name(message, signal)] = {
+                'message': message.name,
+                'frame_id': message.frame_id,
+                'signal': signal.name,
+                'unit': getattr(signal, 'unit', None) or "",
+                'choices': {str(value): str(label) for value, label in choices.items()},
+            }
+    return metadata
+
+def get_export_format(path):
+    """Guess the export format from a file name (.parquet, .feather or .arrow)"""
+    lower = path.lower()
+    if lower.endswith((".feather", ".arrow")):
+        return "feather"
+    return "parquet"
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Writing Parquet or Feather files requires pyarrow "
+                          "(pip install pyarrow)") from None
+    return pyarrow
+
+class TableBuilder:
+    """
+    Turns decoded batches into columns of the long or wide layout
+    
+    messages fixes the category labels and the order of the wide layout's
+    signal columns; batches of other messages are skipped. A wide table
+    only has the signal columns of the messages its batches hold.
+    """
+    
+    def __init__(self, messages, layout="long"):
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout: {layout}")
+        self.layout = layout
+        self.messages = list(dict.fromkeys(messages))
+        self.message_set = set(self.messages)
+        self.metadata = signal_metadata(self.messages)
+        self.signal_columns = list(self.metadata)
+        self.message_names = [message.name for message in self.messages]
+    
+    def column_count(self):
+        """Most columns a table has in this layout"""
+        if self.layout == "long":
+            return 4
+        return 2 + len(self.signal_columns)
+    
+    def signal_columns_of(self, messages):
+        """Get the wide-layout signal columns of some messages, in column order"""
+        messages = set(messages)
+        return [signal_column_name(message, signal) for message in self.messages
+                if message in messages for signal in message.signals]
+    
+    def columns(self, batches):
+        """
+        Build the columns (name -> array) for some batches, rows sorted by
+        timestamp. Message and signal names are pandas-style categorical
+        codes, resolved through categories().
+        """
+        batches = [batch for batch in batches if batch.message in self.message_set and len(batch)]
+        if self.layout == "long":
+            return self._long_columns(batches)
+        return self._wide_columns(batches)
+    
+    def categories(self):
+        """Get the category labels of the 'message' and 'signal' columns"""
+        if self.layout == "long":
+            return {'message': self.message_names, 'signal': self.signal_columns}
+        return {'message': self.message_names}
+    
+    def _long_columns(self, batches):
+        message_codes = {message: code for code, message in enumerate(self.messages)}
+        signal_codes = {name: code for code, name in enumerate(self.signal_columns)}
+        timestamps, messages, signals, values = [], [], [], []
+        for batch in batches:
+            for name, column in batch.columns.items():
+                # Multiplexed signals only exist in some frames
+                present = ~np.isnan(column)
+                timestamps.append(batch.timestamps[present])
+                values.append(column[present])
+                messages.append(np.full(present.sum(), message_codes[batch.message], dtype=np.int32))
+                code = signal_codes[f"{batch.message.name}.{name}"]
+                signals.append(np.full(present.sum(), code, dtype=np.int32))
+        if not timestamps:
+            return {'timestamp': np.zeros(0), 'message': np.zeros(0, dtype=np.int32),
+                    'signal': np.zeros(0, dtype=np.int32), 'value': np.zeros(0)}
+        timestamp = np.concatenate(timestamps)
+        order = np.argsort(timestamp, kind='stable')
+        return {
+            'timestamp': timestamp[order],
+            'message': np.concatenate(messages)[order],
+            'signal': np.concatenate(signals)[order],
+            'value': np.concatenate(values)[order],
+        }
+    
+    def _wide_columns(self, batches):
+        message_codes = {message: code for code, message in enumerate(self.messages)}
+        total = sum(len(batch) for batch in batches)
+        timestamp = np.empty(total)
+        message = np.empty(total, dtype=np.int32)
+        # Only the columns of the messages at hand, not of the whole database
+        signal_columns = self.signal_columns_of(batch.message for batch in batches)
+        columns = {name: np.full(total, np.nan) for name in signal_columns}
+        row = 0
+        for batch in batches:
+            end = row + len(batch)
+            timestamp[row:end] = batch.timestamps
+            message[row:end] = message_codes[batch.message]
+            prefix = batch.message.name + "."
+            for name, values in batch.columns.items():
+                columns[prefix + name][row:end] = values
+            row = end
+        order = np.argsort(timestamp, kind='stable')
+        result = {'timestamp': timestamp[order], 'message': message[order]}
+        for name, values in columns.items():
+            result[name] = values[order]
+        return result
+
+def to_dataframe(batches, messages, layout="long"):
+    """
+    Build a pandas DataFrame from decoded batches, rows sorted by timestamp
+    Signal metadata (units, choices) is kept in DataFrame.attrs['signals'].
+    """
+    import pandas as pd
+    builder = TableBuilder(messages, layout)
+    columns = builder.columns(list(batches))
+    for name, labels in builder.categories().items():
+        columns[name] = pd.Categorical.from_codes(columns[name], categories=labels)
+    frame = pd.DataFrame(columns)
+    frame.attrs['signals'] = builder.metadata
+    return frame
+
+def _arrow_schema(builder, signal_columns):
+    """
+    Arrow schema of a layout, with signal units and choices as metadata
+    signal_columns are the wide layout's signal columns.
+    """
+    pa = _import_pyarrow()
+    fields = [pa.field('timestamp', pa.float64()),
+              pa.field('message', pa.dictionary(pa.int32(), pa.string()))]
+    if builder.layout == "long":
+        fields.append(pa.field('signal', pa.dictionary(pa.int32(), pa.string())))
+        fields.append(pa.field('value', pa.float64()))
+    else:
+        for name in signal_columns:
+            info = builder.metadata[name]
+            fields.append(pa.field(name, pa.float64(), metadata={
+                b'unit': info['unit'].encode('utf-8'),
+                b'choices': json.dumps(info['choices']).encode('utf-8'),
+            }))
+    return pa.schema(fields, metadata={
+        SIGNAL_METADATA_KEY: json.dumps(builder.metadata).encode('utf-8'),
+    })
+
+def _arrow_table(builder, schema, columns):
+    pa = _import_pyarrow()
+    categories = builder.categories()
+    arrays = []
+    for field in schema:
+        values = columns.get(field.name)
+        if values is None:
+            # A wide signal column of messages absent from these rows
+            values = np.full(len(columns['timestamp']), np.nan)
+        if field.name in categories:
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array(values, type=pa.int32()), pa.array(categories[field.name], type=pa.string())))
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+class SortedRuns:
+    """
+    Runs of table columns, each sorted by timestamp, merged into one
+    timestamp order
+    
+    The first run is kept in memory; once there is a second, every run is
+    spilled to .npy files in directory and memory-mapped back for the merge.
+    """
+    
+    def __init__(self, directory):
+        self.directory = directory
+        self.runs = []
+        self.spilled = False
+    
+    def __len__(self):
+        return len(self.runs)
+    
+    def close(self):
+        """Drop the runs, unmapping their spill files"""
+        self.runs = []
+    
+    def add(self, columns):
+        """Add a run of columns (name -> array) sorted by timestamp"""
+        self.runs.append(columns)
+        if len(self.runs) > 1:
+            if not self.spilled:
+                self.runs[0] = self._spill(0, self.runs[0])
+                self.spilled = True
+            self.runs[-1] = self._spill(len(self.runs) - 1, columns)
+    
+    def _spill(self, run, columns):
+        spilled = {}
+        for number, (name, values) in enumerate(columns.items()):
+            path = os.path.join(self.directory, f"run{run}-{number}.npy")
+            np.save(path, values)
+            spilled[name] = np.load(path, mmap_mode='r')
+        return spilled
+    
+    def merged(self, names, chunk_rows):
+        """
+        Yield columns (name -> array) of about chunk_rows rows at a time, in
+        timestamp order over all runs. Rows with equal timestamps keep the
+        order of their runs, as a stable sort would. Columns of names
+        missing from a run are NaN in its rows.
+        """
+        runs = [run for run in self.runs if len(run['timestamp'])]
+        starts = [0] * len(runs)
+        window = max(1, chunk_rows // max(1, len(runs)))
+        while True:
+            live = [i for i in range(len(runs)) if starts[i] < len(runs[i]['timestamp'])]
+            if not live:
+                return
+            ends = {i: min(starts[i] + window, len(runs[i]['timestamp'])) for i in live}
+            # Rows up to the earliest window end of the runs that go on
+            # cannot be preceded by anything not read yet
+            bounds = [(runs[i]['timestamp'][ends[i] - 1], i) for i in live
+                      if ends[i] < len(runs[i]['timestamp'])]
+            bound, bounding_run = min(bounds) if bounds else (np.inf, len(runs))
+            pieces = []
+            for i in live:
+                timestamps = runs[i]['timestamp'][starts[i]:ends[i]]
+                # Later runs hold back rows at the bound, which may tie
+                # with rows of the bounding run not read yet
+                side = 'right' if i <= bounding_run else 'left'
+                end = starts[i] + int(np.searchsorted(timestamps, bound, side=side))
+                if end > starts[i]:
+                    pieces.append((runs[i], starts[i], end))
+                starts[i] = end
+            timestamp = np.concatenate([run['timestamp'][start:end] for run, start, end in pieces])
+            order = np.argsort(timestamp, kind='stable')
+            chunk = {}
+            for name in names:
+                chunk[name] = np.concatenate([
+                    run[name][start:end] if name in run else np.full(end - start, np.nan)
+                    for run, start, end in pieces])[order]
+            yield chunk
+
+def write_decoded(batches, path, messages, layout="long", export_format=None,
+                  row_group_cells=DEFAULT_ROW_GROUP_CELLS):
+    """
+    Stream decoded batches to a Parquet or Feather file, rows in timestamp
+    order across the whole file
+    Batches are buffered until about row_group_cells cells are pending,
+    then sorted into a run; runs are merged into row groups of about as
+    many cells once every batch is read (see SortedRuns). The wide
+    layout's signal columns are those of the messages found in batches.
+    Returns the number of rows written.
+    """
+    pa = _import_pyarrow()
+    export_format = export_format or get_export_format(path)
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {export_format}")
+    builder = TableBuilder(messages, layout)
+    
+    # Rows are cheaper in the long layout, so more of them fit in a group
+    values_per_row = 1 if layout == "long" else builder.column_count()
+    max_pending_rows = max(1024, row_group_cells // values_per_row)
+    # Runs are spilled next to the output, which has room for them anyway
+    spill_directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.TemporaryDirectory(prefix=".export-", dir=spill_directory) as directory:
+        runs = SortedRuns(directory)
+        found = set()
+        pending = []
+        pending_rows = 0
+        for batch in batches:
+            if batch.message not in builder.message_set:
+                continue
+            pending.append(batch)
+            found.add(batch.message)
+            pending_rows += len(batch) * (len(batch.columns) if layout == "long" else 1)
+            if pending_rows >= max_pending_rows:
+                runs.add(builder.columns(pending))
+                pending = []
+                pending_rows = 0
+        if pending:
+            runs.add(builder.columns(pending))
+        
+        signal_columns = builder.signal_columns_of(found) if layout == "wide" else []
+        schema = _arrow_schema(builder, signal_columns)
+        if export_format == "parquet":
+            import pyarrow.parquet as pq
+            writer = pq.ParquetWriter(path, schema)
+            write_table = lambda table: writer.write_table(table, row_group_size=table.num_rows)
+        else:
+            import pyarrow.ipc
+            writer = pa.ipc.new_file(path, schema)
+            write_table = writer.write_table
+        
+        if layout == "wide":
+            max_pending_rows = max(1024, row_group_cells // (2 + len(signal_columns)))
+        rows_written = 0
+        try:
+            for columns in runs.merged(schema.names, max_pending_rows):
+                table = _arrow_table(builder, schema, columns)
+                write_table(table)
+                rows_written += table.num_rows
+        finally:
+            writer.close()
+            runs.close()
+    return rows_written
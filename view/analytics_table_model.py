@@ -0,0 +1,66 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+class AnalyticsTableModel(QAbstractTableModel):
+    """
+    Sortable read-only table of the rows of a bus analytics result
+    
+    columns is a list of (header, format) pairs; format turns a row's raw
+    value into its text, and sorting uses the raw values.
+    """
+    
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.rows = []
+        self.sort_column = None
+        self.sort_order = Qt.AscendingOrder
+    
+    def set_rows(self, rows):
+        """Show new rows (lists of raw values), keeping the current sort"""
+        self.beginResetModel()
+        self.rows = list(rows)
+        if self.sort_column is not None:
+            self._sort_rows()
+        self.endResetModel()
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_column = column
+        self.sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        self._sort_rows()
+        self.layoutChanged.emit()
+    
+    def _sort_rows(self):
+        column = self.sort_column
+        # Empty values sort last in ascending order
+        self.rows.sort(key=lambda row: (row[column] is None, row[column]),
+                       reverse=self.sort_order == Qt.DescendingOrder)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.columns)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.columns[section][0]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self.rows[index.row()][index.column()]
+            if value is None:
+                return ""
+            return self.columns[index.column()][1](value)
+        if role == Qt.TextAlignmentRole:
+            value = self.rows[index.row()][index.column()]
+            if isinstance(value, (int, float)):
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
@@ -0,0 +1,189 @@
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+                             QLabel, QComboBox, QLineEdit, QCheckBox, QTabWidget,
+                             QTableView, QHeaderView)
+from PyQt5.QtCore import Qt, pyqtSignal
+from model.bus_analytics import COMMON_BITRATES, DEFAULT_BITRATE
+from view.analytics_table_model import AnalyticsTableModel
+
+def format_percent(value):
+    return f"{value * 100:.2f} %"
+
+def format_hex(value):
+    return f"0x{value:X}"
+
+def format_ranges(ranges):
+    return ", ".join(f"{first}" if first == last else f"{first}-{last}" for first, last in ranges)
+
+BUS_COLUMNS = [
+    ("Bus", str),
+    ("Load", format_percent),
+    ("Bits/s", lambda value: f"{value:,.0f}"),
+    ("Periodic Messages", str),
+    ("Without Cycle Time", str),
+]
+
+CONTRIBUTOR_COLUMNS = [
+    ("Message", str),
+    ("ID (Hex)", format_hex),
+    ("Bus", str),
+    ("Length", str),
+    ("Cycle Time (ms)", str),
+    ("Frame Bits", str),
+    ("Load", format_percent),
+]
+
+LAYOUT_COLUMNS = [
+    ("Message", str),
+    ("ID (Hex)", format_hex),
+    ("Length", str),
+    ("Used Bits", str),
+    ("Unused Bits", str),
+    ("Unused Bit Ranges", str),
+    ("Overlapping Signals", str),
+    ("Past Message End", str),
+]
+
+class BusAnalyticsView(QMainWindow):
+    """
+    Window with the worst-case bus load and the bit layout checks of a DBC
+    
+    Changing the bitrate only recomputes the loads: the bit layouts are
+    kept by the model.
+    """
+    
+    # Signal emitted when window is closed
+    window_closed = pyqtSignal(str)  # Emits file_path of the associated DBC
+    
+    def __init__(self, controller, file_path, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.dbc_file_path = file_path
+        self.analytics = None
+        self.setWindowTitle(f"Bus Analytics - {file_path.split('/')[-1]}")
+        self.setGeometry(240, 240, 1000, 650)
+        
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        
+        # Bus settings
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Bitrate (bit/s):"))
+        self.bitrate_combo = QComboBox()
+        self.bitrate_combo.setEditable(True)  # Any bitrate can be typed in
+        self.bitrate_combo.addItems([str(bitrate) for bitrate in COMMON_BITRATES])
+        self.bitrate_combo.setCurrentText(str(DEFAULT_BITRATE))
+        self.bitrate_combo.currentTextChanged.connect(self.update_analytics)
+        controls.addWidget(self.bitrate_combo)
+        
+        controls.addWidget(QLabel("FD Data Bitrate:"))
+        self.data_bitrate_edit = QLineEdit()
+        self.data_bitrate_edit.setPlaceholderText("nominal")
+        self.data_bitrate_edit.setFixedWidth(100)
+        self.data_bitrate_edit.editingFinished.connect(self.update_analytics)
+        controls.addWidget(self.data_bitrate_edit)
+        
+        self.stuffing_check = QCheckBox("Worst-case bit stuffing")
+        self.stuffing_check.setChecked(True)
+        self.stuffing_check.toggled.connect(self.update_analytics)
+        controls.addWidget(self.stuffing_check)
+        controls.addStretch()
+        main_layout.addLayout(controls)
+        
+        self.tabs = QTabWidget()
+        self.bus_model = AnalyticsTableModel(BUS_COLUMNS, self)
+        self.tabs.addTab(self.create_table(self.bus_model), "Bus Load")
+        self.contributor_model = AnalyticsTableModel(CONTRIBUTOR_COLUMNS, self)
+        # Largest contributors first
+        self.contributor_model.sort(len(CONTRIBUTOR_COLUMNS) - 1, Qt.DescendingOrder)
+        self.tabs.addTab(self.create_table(self.contributor_model), "Top Contributors")
+        
+        layout_tab = QWidget()
+        layout_tab_layout = QVBoxLayout(layout_tab)
+        self.issues_only_check = QCheckBox("Only messages with overlapping or out of range signals")
+        self.issues_only_check.toggled.connect(self.update_layout_table)
+        layout_tab_layout.addWidget(self.issues_only_check)
+        self.layout_model = AnalyticsTableModel(LAYOUT_COLUMNS, self)
+        layout_tab_layout.addWidget(self.create_table(self.layout_model))
+        self.tabs.addTab(layout_tab, "Bit Layout")
+        main_layout.addWidget(self.tabs)
+        
+        self.status_label = QLabel()
+        main_layout.addWidget(self.status_label)
+        
+        self.update_analytics()
+    
+    def create_table(self, model):
+        """Create a sortable table view over an analytics model"""
+        table = QTableView()
+        table.setModel(model)
+        table.verticalHeader().setVisible(False)
+        table.verticalHeader().setDefaultSectionSize(22)
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(130)
+        header.setStretchLastSection(True)
+        if model.sort_column is not None:
+            header.setSortIndicator(model.sort_column, model.sort_order)
+        else:
+            header.setSortIndicator(-1, Qt.AscendingOrder)
+        table.setSortingEnabled(True)
+        return table
+    
+    def get_bitrate(self, text, default=None):
+        """Parse a bitrate, returning default for empty or invalid text"""
+        try:
+            bitrate = int(float(text.strip()))
+        except ValueError:
+            return default
+        return bitrate if bitrate > 0 else default
+    
+    def update_analytics(self):
+        """Recompute the analytics for the current settings"""
+        bitrate = self.get_bitrate(self.bitrate_combo.currentText())
+        if bitrate is None:
+            self.status_label.setText("Enter a bitrate in bit/s")
+            return
+        data_bitrate = self.get_bitrate(self.data_bitrate_edit.text())
+        self.analytics = self.controller.get_bus_analytics(
+            self.dbc_file_path, bitrate, data_bitrate, self.stuffing_check.isChecked())
+        if self.analytics is None:
+            return
+        
+        self.bus_model.set_rows(
+            [bus.display_name(), bus.load, bus.bits_per_second, bus.messages, bus.unscheduled]
+            for bus in self.analytics.buses.values())
+        buses = self.analytics.buses
+        self.contributor_model.set_rows(
+            [load.message.name, load.message.frame_id, buses[load.bus].display_name(),
+             load.message.length,
+             load.message.cycle_time, load.frame_bits, load.load]
+            for load in self.analytics.message_loads)
+        self.update_layout_table()
+        
+        busiest = max(self.analytics.buses.values(), key=lambda bus: bus.load, default=None)
+        text = f"Computed in {self.analytics.elapsed * 1000:.0f} ms"
+        if busiest is not None:
+            text = (f"Busiest bus: {busiest.display_name()} at {busiest.load * 100:.1f} %"
+                    f"{' (overloaded)' if busiest.load > 1 else ''}. {text}")
+        self.status_label.setText(text)
+    
+    def update_layout_table(self):
+        """List the bit layouts, optionally only those with issues"""
+        if self.analytics is None:
+            return
+        layouts = self.analytics.layouts
+        if self.issues_only_check.isChecked():
+            layouts = self.analytics.layout_issues()
+        self.layout_model.set_rows(
+            [layout.message.name, layout.message.frame_id, layout.message.length,
+             layout.used_bits, layout.unused_bits, format_ranges(layout.unused_ranges),
+             "; ".join(f"{first} / {second} ({bits} bits)"
+                       for first, second, bits in layout.overlaps) or None,
+             ", ".join(layout.out_of_range) or None]
+            for layout in layouts)
+    
+    def closeEvent(self, event):
+        """Announce the window is closing"""
+        self.window_closed.emit(self.dbc_file_path)
+        super().closeEvent(event)
@@ -0,0 +1,179 @@
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+                             QLabel, QComboBox, QPushButton, QTableView,
+                             QHeaderView, QLineEdit, QApplication)
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from model.dbc_diff import CHANGE_ADDED, CHANGE_REMOVED, CHANGE_CHANGED, CATEGORY_LAYOUT
+from view.diff_table_model import DiffTableModel
+
+# Entry filters offered by the comparison view: label -> accept(entry)
+DIFF_FILTERS = {
+    "All Changes": None,
+    "Added": lambda entry: entry.kind == CHANGE_ADDED,
+    "Removed": lambda entry: entry.kind == CHANGE_REMOVED,
+    "Changed": lambda entry: entry.kind == CHANGE_CHANGED,
+    "Layout Changes": lambda entry: entry.category == CATEGORY_LAYOUT,
+}
+
+class DBCCompareView(QMainWindow):
+    """Window comparing two loaded DBC files, listing every difference"""
+    
+    # Signal emitted when window is closed
+    window_closed = pyqtSignal()
+    
+    # Delay between the last keystroke in the name filter and filtering
+    FILTER_DEBOUNCE_MS = 150
+    
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.controller = controller
+        self.diff = None
+        self.diff_files = ()  # (old, new) file paths of the shown diff
+        self.setWindowTitle("Compare DBC Files")
+        self.setGeometry(220, 220, 1100, 650)
+        
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        
+        # File selection
+        files_layout = QHBoxLayout()
+        files_layout.addWidget(QLabel("Old:"))
+        self.old_combo = QComboBox()
+        files_layout.addWidget(self.old_combo, 1)
+        files_layout.addWidget(QLabel("New:"))
+        self.new_combo = QComboBox()
+        files_layout.addWidget(self.new_combo, 1)
+        swap_button = QPushButton("Swap")
+        swap_button.clicked.connect(self.swap_files)
+        files_layout.addWidget(swap_button)
+        compare_button = QPushButton("Compare")
+        compare_button.clicked.connect(self.compare)
+        files_layout.addWidget(compare_button)
+        main_layout.addLayout(files_layout)
+        
+        # Entry filters
+        filter_layout = QHBoxLayout()
+        self.kind_combo = QComboBox()
+        self.kind_combo.addItems(DIFF_FILTERS)
+        self.kind_combo.currentIndexChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.kind_combo)
+        self.name_filter = QLineEdit()
+        self.name_filter.setPlaceholderText("Filter by message or signal name...")
+        self.name_filter.textChanged.connect(lambda: self.filter_timer.start())
+        filter_layout.addWidget(self.name_filter, 1)
+        main_layout.addLayout(filter_layout)
+        
+        self.diff_model = DiffTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.diff_model)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.resizeSection(0, 80)   # Change
+        header.resizeSection(1, 200)  # Message
+        header.resizeSection(2, 180)  # Signal
+        header.resizeSection(3, 110)  # Field
+        header.resizeSection(4, 80)   # Category
+        header.resizeSection(5, 180)  # Old Value
+        header.setStretchLastSection(True)
+        main_layout.addWidget(self.table)
+        
+        self.summary_label = QLabel("Select two DBC files and click Compare")
+        main_layout.addWidget(self.summary_label)
+        
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        
+        self.update_file_lists()
+    
+    def update_file_lists(self, old_file_path=None):
+        """Offer the currently loaded DBC files, keeping the selection where possible"""
+        file_paths = self.controller.get_all_dbc_files()
+        old_selected = old_file_path or self.old_combo.currentData()
+        new_selected = self.new_combo.currentData()
+        for combo in (self.old_combo, self.new_combo):
+            combo.blockSignals(True)
+            combo.clear()
+            for file_path in file_paths:
+                combo.addItem(file_path.split('/')[-1], file_path)
+                combo.setItemData(combo.count() - 1, file_path, Qt.ToolTipRole)
+            combo.blockSignals(False)
+        
+        if old_selected in file_paths:
+            self.old_combo.setCurrentIndex(file_paths.index(old_selected))
+        if new_selected in file_paths and new_selected != self.old_combo.currentData():
+            self.new_combo.setCurrentIndex(file_paths.index(new_selected))
+        elif len(file_paths) > 1:
+            # Default to the first other file
+            others = [i for i, path in enumerate(file_paths) if path != self.old_combo.currentData()]
+            self.new_combo.setCurrentIndex(others[0])
+    
+    def swap_files(self):
+        """Exchange the old and new files"""
+        old_index = self.old_combo.currentIndex()
+        self.old_combo.setCurrentIndex(self.new_combo.currentIndex())
+        self.new_combo.setCurrentIndex(old_index)
+    
+    def compare(self):
+        """Diff the selected files and show the result"""
+        old_file_path = self.old_combo.currentData()
+        new_file_path = self.new_combo.currentData()
+        if old_file_path is None or new_file_path is None:
+            return
+        # The first comparison of a file also builds its index and signatures
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.diff = self.controller.diff_dbcs(old_file_path, new_file_path)
+            self.diff_files = (old_file_path, new_file_path)
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.diff_model.set_diff(self.diff)
+        self.apply_filter()
+    
+    def on_dbc_removed(self, file_path):
+        """Stop offering a removed file, dropping its comparison if one is shown"""
+        if file_path in self.diff_files:
+            self.diff = None
+            self.diff_files = ()
+            self.diff_model.set_diff(None)
+            self.summary_label.setText("Select two DBC files and click Compare")
+        self.update_file_lists()
+    
+    def on_dbc_reloaded(self, file_path):
+        """Compare again if a shown file was reloaded"""
+        if self.diff is not None and file_path in (self.old_combo.currentData(),
+                                                   self.new_combo.currentData()):
+            self.compare()
+    
+    def apply_filter(self):
+        """Show the entries matching the kind and name filters"""
+        self.filter_timer.stop()
+        if self.diff is None:
+            return
+        kind_filter = DIFF_FILTERS[self.kind_combo.currentText()]
+        text = self.name_filter.text().strip().lower()
+        if text:
+            def accept(entry):
+                if kind_filter is not None and not kind_filter(entry):
+                    return False
+                return text in entry.message.lower() or text in (entry.signal or "").lower()
+        else:
+            accept = kind_filter
+        self.diff_model.set_filter(accept)
+        
+        shown = self.diff_model.rowCount()
+        if self.diff.is_empty():
+            text = "The files are identical"
+        else:
+            text = self.diff.summary()
+        self.summary_label.setText(f"{text} ({shown} of {len(self.diff)} entries shown, "
+                                   f"compared in {self.diff.elapsed * 1000:.0f} ms)")
+    
+    def closeEvent(self, event):
+        """Announce the window is closing"""
+        self.window_closed.emit()
+        super().closeEvent(event)
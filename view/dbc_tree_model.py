@@ -0,0 +1,362 @@
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex
+from view.message_table_model import MESSAGE_ROLE, SIGNAL_ROLE
+from model.profiling import timed, set_rows
+
+# Item data role holding the kind of a tree node
+NODE_KIND_ROLE = Qt.UserRole + 10
+
+# Node kinds
+KIND_INSTANCE = "instance"          # "DBC Instance: ..." root item
+KIND_NODES = "nodes"                # "Nodes" section
+KIND_NODE = "node"                  # A single ECU/node
+KIND_MESSAGES = "messages"          # "Messages" section
+KIND_MESSAGE = "message"            # "name (0xID)"
+KIND_SIGNAL_GROUP = "signal_group"  # "Signals (n)" under a message
+KIND_SIGNAL = "signal"              # A signal under its message
+KIND_DETAIL = "detail"              # Bits, byte order, signed and comment lines
+KIND_ALL_SIGNALS = "all_signals"    # "All Signals (n)" section
+KIND_SIGNAL_ENTRY = "signal_entry"  # "signal - message (0xID)" under All Signals
+
+class TreeNode:
+    """
+    A node of the DBC tree
+    
+    Children are not created up front: a node knows how many it has and
+    child_factory(node, i) builds the i-th one when the view fetches it.
+    """
+    
+    __slots__ = ('kind', 'label', 'parent', 'row', 'message', 'signal',
+                 'children', 'child_count', 'child_factory')
+    
+    def __init__(self, kind, label, parent=None, row=0, message=None, signal=None,
+                 child_count=0, child_factory=None):
+        self.kind = kind
+        self.label = label
+        self.parent = parent
+        self.row = row
+        self.message = message
+        self.signal = signal
+        self.children = []
+        self.child_count = child_count
+        self.child_factory = child_factory
+    
+    def fetch_children(self, count):
+        """Create up to count more children; returns the new children"""
+        start = len(self.children)
+        end = min(start + count, self.child_count)
+        new_children = [self.child_factory(self, i) for i in range(start, end)]
+        self.children.extend(new_children)
+        return new_children
+
+class DBCTreeModel(QAbstractItemModel):
+    """
+    Lazy tree model of a DBC database
+    
+    Branches are built only when expanded, and large branches are handed to
+    the view in batches through canFetchMore/fetchMore, so showing a DBC
+    costs the same however many messages and signals it has.
+    """
+    
+    FETCH_BATCH_SIZE = 256
+    
+    # Most message branches a reload is patched with; past that the model is reset
+    RELOAD_PATCH_LIMIT = 200
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.root = TreeNode(None, "")
+        self.instance_id = None
+        self.db = None
+        self.signal_store_getter = None
+    
+    @timed("DBCTreeModel.set_database")
+    def set_database(self, instance_id, db, signal_store_getter=None):
+        """
+        Show a database; signal_store_getter() returns its SignalStore and is
+        only called once the All Signals branch is expanded
+        """
+        self.beginResetModel()
+        self.instance_id = instance_id
+        self.db = db
+        self.signal_store_getter = signal_store_getter
+        self.root = TreeNode(None, "")
+        if db is not None:
+            instance = TreeNode(KIND_INSTANCE, f"DBC Instance: {instance_id}", self.root)
+            self.root.children.append(instance)
+            self.root.child_count = 1
+            
+            sections = []
+            # Add nodes section if available
+            if hasattr(db, 'nodes') and db.nodes:
+                sections.append(TreeNode(KIND_NODES, "Nodes", instance,
+                                         child_count=len(db.nodes),
+                                         child_factory=self._make_node))
+            sections.append(TreeNode(KIND_MESSAGES, "Messages", instance,
+                                     child_count=len(db.messages),
+                                     child_factory=self._make_message))
+            signal_count = sum(len(msg.signals) for msg in db.messages)
+            sections.append(TreeNode(KIND_ALL_SIGNALS, f"All Signals ({signal_count})", instance,
+                                     child_count=signal_count,
+                                     child_factory=self._make_signal_entry))
+            for row, section in enumerate(sections):
+                section.row = row
+            instance.children = sections
+            instance.child_count = len(sections)
+        self.endResetModel()
+    
+    @timed("DBCTreeModel.apply_reload")
+    def apply_reload(self, reload):
+        """
+        Switch to the new version of a reloaded database (a DBCReload)
+        
+        Branches of unchanged messages are kept with whatever is expanded
+        under them, branches of removed messages are removed, those of
+        changed messages rebuilt and those of added messages inserted. The
+        All Signals branch is rebuilt with as many rows as it had fetched.
+        Falls back to set_database when the nodes changed, the messages were
+        reordered or too many changed; returns False if it did.
+        """
+        new_db = reload.new_db
+        message_map = reload.message_map
+        added = set(reload.added)
+        sections = {}
+        if self.root.children and self.db is reload.old_db:
+            sections = {section.kind: section for section in self.root.children[0].children}
+        messages = sections.get(KIND_MESSAGES)
+        if (messages is None
+                or reload.nodes_changed
+                or [message_map[msg] for msg in self.db.messages if msg in message_map]
+                != [msg for msg in new_db.messages if msg not in added]
+                or len(reload.removed) + len(added) + len(reload.changed) > self.RELOAD_PATCH_LIMIT):
+            self.set_database(self.instance_id, new_db, self.signal_store_getter)
+            return False
+        
+        fully_fetched = len(messages.children) == messages.child_count
+        self.db = new_db
+        section_index = self.createIndex(messages.row, 0, messages)
+        
+        # Remove the branches of removed messages, merging neighbours
+        end = None
+        for node in list(reversed(messages.children)):
+            if node.message not in message_map:
+                end = node.row + 1 if end is None else end
+                start = node.row
+                continue
+            if end is not None:
+                self._remove_children(messages, section_index, start, end)
+                end = None
+        if end is not None:
+            self._remove_children(messages, section_index, start, end)
+        
+        # Point the others at the new messages, rebuilding changed ones
+        for node in messages.children:
+            msg = message_map[node.message]
+            if msg in reload.changed:
+                self._rebuild_message(node, msg)
+            else:
+                self._swap_message(node, msg)
+        
+        # Insert the added messages among the fetched ones (and after them
+        # if all were fetched); the rest are fetched when the view asks
+        row = 0
+        inserted = []
+        for position, msg in enumerate(new_db.messages):
+            if msg in added:
+                inserted.append(position)
+                continue
+            if row >= len(messages.children):
+                inserted = []
+                break
+            if inserted:
+                self._insert_messages(messages, section_index, row, inserted)
+                row += len(inserted)
+                inserted = []
+            row += 1
+        if inserted and fully_fetched:
+            self._insert_messages(messages, section_index, row, inserted)
+        messages.child_count = len(new_db.messages)
+        
+        all_signals = sections.get(KIND_ALL_SIGNALS)
+        if all_signals is not None:
+            self._rebuild_all_signals(all_signals)
+        return True
+    
+    def _remove_children(self, node, index, start, end):
+        """Remove the fetched children start to end - 1 of the node at index"""
+        self.beginRemoveRows(index, start, end - 1)
+        del node.children[start:end]
+        for row in range(start, len(node.children)):
+            node.children[row].row = row
+        self.endRemoveRows()
+    
+    def _insert_messages(self, section, index, row, positions):
+        """Insert the branches of the messages at positions of db.messages at row"""
+        self.beginInsertRows(index, row, row + len(positions) - 1)
+        section.children[row:row] = [self._make_message(section, position) for position in positions]
+        for following in range(row + len(positions), len(section.children)):
+            section.children[following].row = following
+        self.endInsertRows()
+    
+    def _swap_message(self, node, msg, signal=None):
+        """Point a fetched branch at the new version of its unchanged message"""
+        node.message = msg
+        if node.kind == KIND_SIGNAL:
+            signal = msg.signals[node.row]
+        node.signal = signal
+        for child in node.children:
+            self._swap_message(child, msg, signal)
+    
+    def _rebuild_message(self, node, msg):
+        """Replace a message branch with one of the message's new version"""
+        index = self.createIndex(node.row, 0, node)
+        fetched = bool(node.children)
+        if fetched:
+            self._remove_children(node, index, 0, len(node.children))
+        node.message = msg
+        node.label = f"{msg.name} (0x{msg.frame_id:X})"
+        node.child_count = 1 if msg.signals else 0
+        self.dataChanged.emit(index, index)
+        # An expanded branch stays expanded, with its signals collapsed
+        if fetched and node.child_count:
+            self.fetchMore(index)
+    
+    def _rebuild_all_signals(self, section):
+        """Rebuild the All Signals branch, keeping as many rows fetched"""
+        index = self.createIndex(section.row, 0, section)
+        fetched = len(section.children)
+        if fetched:
+            self._remove_children(section, index, 0, fetched)
+        signal_count = sum(len(msg.signals) for msg in self.db.messages)
+        section.label = f"All Signals ({signal_count})"
+        section.child_count = signal_count
+        self.dataChanged.emit(index, index)
+        fetched = min(fetched, signal_count)
+        if fetched:
+            self.beginInsertRows(index, 0, fetched - 1)
+            section.fetch_children(fetched)
+            self.endInsertRows()
+    
+    def section_index(self, kind):
+        """Get the index of a top-level section (KIND_NODES, KIND_MESSAGES, ...)"""
+        if not self.root.children:
+            return QModelIndex()
+        instance = self.root.children[0]
+        if kind == KIND_INSTANCE:
+            return self.createIndex(0, 0, instance)
+        for section in instance.children:
+            if section.kind == kind:
+                return self.createIndex(section.row, 0, section)
+        return QModelIndex()
+    
+    # Child factories, called with the parent node and the child's row
+    
+    def _make_node(self, parent, row):
+        node = self.db.nodes[row]
+        comment = getattr(node, 'comment', None)
+        return TreeNode(KIND_NODE, node.name, parent, row,
+                        child_count=1 if comment else 0,
+                        child_factory=lambda p, r: TreeNode(KIND_DETAIL, f"Comment: {comment}", p, r))
+    
+    def _make_message(self, parent, row):
+        msg = self.db.messages[row]
+        return TreeNode(KIND_MESSAGE, f"{msg.name} (0x{msg.frame_id:X})", parent, row,
+                        message=msg,
+                        child_count=1 if msg.signals else 0,
+                        child_factory=self._make_signal_group)
+    
+    def _make_signal_group(self, parent, row):
+        msg = parent.message
+        return TreeNode(KIND_SIGNAL_GROUP, f"Signals ({len(msg.signals)})", parent, row,
+                        message=msg,
+                        child_count=len(msg.signals),
+                        child_factory=self._make_signal)
+    
+    def _make_signal(self, parent, row):
+        msg = parent.message
+        signal = msg.signals[row]
+        details = [f"Bits: {signal.start}|{signal.length}"]
+        details.append(f"Byte Order: {getattr(signal, 'byte_order', 'Unknown')}")
+        details.append(f"Signed: {'Yes' if getattr(signal, 'is_signed', False) else 'No'}")
+        if hasattr(signal, 'comment') and signal.comment:
+            details.append(f"Comment: {signal.comment}")
+        return TreeNode(KIND_SIGNAL, signal.name, parent, row,
+                        message=msg, signal=signal,
+                        child_count=len(details),
+                        child_factory=lambda p, r: TreeNode(KIND_DETAIL, details[r], p, r,
+                                                            message=p.message, signal=p.signal))
+    
+    def _make_signal_entry(self, parent, row):
+        # The signal store is already sorted by signal name
+        store = self.signal_store_getter()
+        signal = store.signal(row)
+        msg = store.message(row)
+        return TreeNode(KIND_SIGNAL_ENTRY, f"{signal.name} - {msg.name} (0x{msg.frame_id:X})",
+                        parent, row, message=msg, signal=signal)
+    
+    # QAbstractItemModel interface
+    
+    def node_from_index(self, index):
+        """Get the TreeNode behind an index (the hidden root for invalid indexes)"""
+        if index.isValid():
+            return index.internalPointer()
+        return self.root
+    
+    def index(self, row, column, parent=QModelIndex()):
+        node = self.node_from_index(parent)
+        if column != 0 or row < 0 or row >= len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+    
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.node_from_index(parent).children)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+    
+    def hasChildren(self, parent=QModelIndex()):
+        return self.node_from_index(parent).child_count > 0
+    
+    def canFetchMore(self, parent):
+        node = self.node_from_index(parent)
+        return len(node.children) < node.child_count
+    
+    @timed("DBCTreeModel.fetchMore")
+    def fetchMore(self, parent):
+        node = self.node_from_index(parent)
+        start = len(node.children)
+        count = min(self.FETCH_BATCH_SIZE, node.child_count - start)
+        if count <= 0:
+            return
+        set_rows(count)
+        self.beginInsertRows(parent, start, start + count - 1)
+        node.fetch_children(count)
+        self.endInsertRows()
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return "DBC Content"
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.label
+        if role == NODE_KIND_ROLE:
+            return node.kind
+        if role == MESSAGE_ROLE:
+            return node.message
+        if role == SIGNAL_ROLE:
+            return node.signal
+        return None
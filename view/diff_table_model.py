@@ -0,0 +1,89 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor
+from model.dbc_columns import format_number
+from model.dbc_diff import CHANGE_ADDED, CHANGE_REMOVED, CHANGE_CHANGED
+
+DIFF_COLUMNS = ["Change", "Message", "Signal", "Field", "Category", "Old Value", "New Value"]
+
+# Row backgrounds by kind of change
+CHANGE_COLORS = {
+    CHANGE_ADDED: QColor("#E6F4EA"),
+    CHANGE_REMOVED: QColor("#FCE8E6"),
+    CHANGE_CHANGED: QColor("#FFF8E1"),
+}
+
+def format_diff_value(value):
+    """Get the text of an old or new value of a diff entry"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    if isinstance(value, (int, float)):
+        return format_number(value)
+    if isinstance(value, tuple):
+        # Choices are (value, label) pairs; other tuples are sorted lists
+        if value and isinstance(value[0], tuple):
+            return ", ".join(f"{number}={label}" for number, label in value)
+        return ", ".join(str(item) for item in value)
+    return str(value)
+
+class DiffTableModel(QAbstractTableModel):
+    """Table of the entries of a DBCDiff, optionally limited to some of them"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.entries = []
+        self.rows = []   # Entries shown
+    
+    def set_diff(self, diff):
+        """Show the entries of a DBCDiff (None clears the table)"""
+        self.entries = list(diff.entries) if diff is not None else []
+        self.set_filter(None)
+    
+    def set_filter(self, accept):
+        """Show only the entries for which accept(entry) is true (None shows all)"""
+        self.beginResetModel()
+        if accept is None:
+            self.rows = self.entries
+        else:
+            self.rows = [entry for entry in self.entries if accept(entry)]
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(DIFF_COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return DIFF_COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return entry.kind
+            elif column == 1:
+                return entry.message
+            elif column == 2:
+                return entry.signal or ""
+            elif column == 3:
+                return entry.field or ""
+            elif column == 4:
+                return entry.category or ""
+            elif column == 5:
+                return format_diff_value(entry.old_value)
+            elif column == 6:
+                return format_diff_value(entry.new_value)
+        if role == Qt.BackgroundRole:
+            return CHANGE_COLORS.get(entry.kind)
+        return None
@@ -0,0 +1,155 @@
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+                             QLabel, QComboBox, QLineEdit, QPushButton,
+                             QTableView, QHeaderView, QMessageBox)
+from PyQt5.QtCore import pyqtSignal, QTimer
+import time
+from model.live_monitor import BusMonitor, MONITOR_INTERFACES
+from view.live_signal_table_model import LiveSignalTableModel
+
+class LiveMonitorView(QMainWindow):
+    """
+    Window showing the latest values of a DBC's signals received from a CAN bus
+    
+    Frames are received and decoded on the BusMonitor's thread; the table
+    is refreshed from it on a timer, so a busy bus costs the GUI one update
+    per refresh interval rather than one per frame.
+    """
+    
+    # Signal emitted when window is closed
+    window_closed = pyqtSignal(str)  # Emits file_path of the associated DBC
+    
+    # Time between table refreshes while the monitor runs
+    REFRESH_INTERVAL_MS = 100
+    
+    def __init__(self, db, file_path, index=None, parent=None):
+        super().__init__(parent)
+        self.dbc_file_path = file_path
+        self.setWindowTitle(f"Live Monitor - {file_path.split('/')[-1]}")
+        self.setGeometry(250, 250, 900, 600)
+        
+        self.monitor = BusMonitor(db, index)
+        self.last_frame_count = 0
+        self.last_refresh = time.monotonic()
+        
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        
+        # Bus settings and controls
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Interface:"))
+        self.interface_combo = QComboBox()
+        self.interface_combo.setEditable(True)  # Any python-can interface name works
+        self.interface_combo.addItems(MONITOR_INTERFACES)
+        controls.addWidget(self.interface_combo)
+        
+        controls.addWidget(QLabel("Channel:"))
+        self.channel_edit = QLineEdit("vcan0")
+        self.channel_edit.setFixedWidth(120)
+        controls.addWidget(self.channel_edit)
+        
+        controls.addWidget(QLabel("Bitrate:"))
+        self.bitrate_edit = QLineEdit()
+        self.bitrate_edit.setPlaceholderText("default")
+        self.bitrate_edit.setFixedWidth(90)
+        controls.addWidget(self.bitrate_edit)
+        
+        self.start_button = QPushButton("Start")
+        self.start_button.clicked.connect(self.toggle_monitor)
+        controls.addWidget(self.start_button)
+        
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear_values)
+        controls.addWidget(clear_button)
+        controls.addStretch()
+        main_layout.addLayout(controls)
+        
+        # One row per signal of the DBC
+        self.signal_model = LiveSignalTableModel(self)
+        self.signal_model.set_database(db)
+        self.table = QTableView()
+        self.table.setModel(self.signal_model)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.resizeColumnsToContents()
+        main_layout.addWidget(self.table)
+        
+        self.status_label = QLabel("Stopped")
+        main_layout.addWidget(self.status_label)
+        
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+    
+    def toggle_monitor(self):
+        """Start or stop receiving"""
+        if self.monitor.is_running():
+            self.stop_monitor()
+        else:
+            self.start_monitor()
+    
+    def start_monitor(self):
+        """Open the bus with the chosen settings and start receiving"""
+        bitrate = None
+        if self.bitrate_edit.text().strip():
+            try:
+                bitrate = int(self.bitrate_edit.text().strip())
+            except ValueError:
+                QMessageBox.warning(self, "Live Monitor", "The bitrate must be a number")
+                return
+        try:
+            self.monitor.start(self.interface_combo.currentText().strip(),
+                               self.channel_edit.text().strip(), bitrate)
+        except Exception as e:
+            QMessageBox.critical(self, "Live Monitor", f"Could not open the CAN bus: {e}")
+            return
+        self.last_frame_count = self.monitor.get_stats()['frames']
+        self.last_refresh = time.monotonic()
+        self.start_button.setText("Stop")
+        self.refresh_timer.start()
+    
+    def stop_monitor(self):
+        """Stop receiving, keeping the values shown"""
+        self.refresh_timer.stop()
+        self.monitor.stop()
+        self.refresh()
+        self.start_button.setText("Start")
+    
+    def clear_values(self):
+        """Forget every received value"""
+        self.monitor.reset()
+        self.signal_model.clear_values()
+        self.last_frame_count = 0
+        self.refresh()
+    
+    def refresh(self):
+        """Copy the signals updated since the last refresh into the table"""
+        self.signal_model.apply_updates(self.monitor.take_changes())
+        
+        stats = self.monitor.get_stats()
+        now = time.monotonic()
+        elapsed = now - self.last_refresh
+        rate = (stats['frames'] - self.last_frame_count) / elapsed if elapsed > 0 else 0.0
+        self.last_frame_count = stats['frames']
+        self.last_refresh = now
+        state = "Running" if self.monitor.is_running() else "Stopped"
+        text = (f"{state} - {stats['frames']} frames ({rate:.0f}/s), "
+                f"{stats['messages']} messages, {stats['unknown']} unknown, "
+                f"{stats['errors']} decode errors")
+        if stats['error'] is not None:
+            text += f" - Bus error: {stats['error']}"
+        self.status_label.setText(text)
+        
+        # The receive thread ended on its own (bus error)
+        if self.refresh_timer.isActive() and not self.monitor.is_running():
+            self.stop_monitor()
+    
+    def closeEvent(self, event):
+        """Stop the monitor and announce the window is closing"""
+        self.refresh_timer.stop()
+        self.monitor.stop()
+        if self.dbc_file_path:
+            self.window_closed.emit(self.dbc_file_path)
+        super().closeEvent(event)
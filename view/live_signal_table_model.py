@@ -0,0 +1,116 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+import numpy as np
+from view.message_table_model import MESSAGE_ROLE, SIGNAL_ROLE
+
+LIVE_SIGNAL_COLUMNS = ["Message", "ID (Hex)", "Signal", "Value", "Unit", "Samples", "Timestamp"]
+VALUE_COLUMN = LIVE_SIGNAL_COLUMNS.index("Value")
+TIMESTAMP_COLUMN = LIVE_SIGNAL_COLUMNS.index("Timestamp")
+
+class LiveSignalTableModel(QAbstractTableModel):
+    """
+    Table of the latest received value of every signal of a database
+    
+    Rows are fixed when the database is set, one per signal, so applying
+    a batch of updates only rewrites values and repaints the changed rows.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []         # (Message, Signal) per row
+        self.row_by_key = {}   # (message name, signal name) -> row
+        self.timestamps = np.zeros(0)
+        self.values = np.zeros(0)
+        self.samples = np.zeros(0, dtype=np.int64)
+    
+    def set_database(self, db):
+        """Show one row per signal of a database, with no values yet"""
+        self.beginResetModel()
+        self.rows = [(msg, signal) for msg in db.messages for signal in msg.signals]
+        self.row_by_key = {(msg.name, signal.name): row
+                           for row, (msg, signal) in enumerate(self.rows)}
+        self.clear_values()
+        self.endResetModel()
+    
+    def clear_values(self):
+        """Forget the received values"""
+        self.timestamps = np.full(len(self.rows), np.nan)
+        self.values = np.full(len(self.rows), np.nan)
+        self.samples = np.zeros(len(self.rows), dtype=np.int64)
+        if self.rows:
+            self.dataChanged.emit(self.index(0, VALUE_COLUMN),
+                                  self.index(len(self.rows) - 1, TIMESTAMP_COLUMN))
+    
+    def apply_updates(self, updates):
+        """
+        Store the latest samples from BusMonitor.take_changes() and repaint
+        the block of rows they touch
+        """
+        changed = []
+        for key, (timestamp, value, samples) in updates.items():
+            row = self.row_by_key.get(key)
+            if row is None:
+                continue
+            self.timestamps[row] = timestamp
+            self.values[row] = value
+            self.samples[row] = samples
+            changed.append(row)
+        if changed:
+            self.dataChanged.emit(self.index(min(changed), VALUE_COLUMN),
+                                  self.index(max(changed), TIMESTAMP_COLUMN))
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(LIVE_SIGNAL_COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return LIVE_SIGNAL_COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        msg, signal = self.rows[row]
+        if role == Qt.DisplayRole:
+            return self.display_value(row, LIVE_SIGNAL_COLUMNS[index.column()])
+        if role == Qt.TextAlignmentRole and index.column() >= VALUE_COLUMN:
+            return Qt.AlignRight | Qt.AlignVCenter
+        if role == SIGNAL_ROLE:
+            return signal
+        if role == MESSAGE_ROLE:
+            return msg
+        return None
+    
+    def display_value(self, row, column_name):
+        """Get the text of a cell"""
+        msg, signal = self.rows[row]
+        if column_name == "Message":
+            return msg.name
+        if column_name == "ID (Hex)":
+            return f"0x{msg.frame_id:X}"
+        if column_name == "Signal":
+            return signal.name
+        if column_name == "Unit":
+            return getattr(signal, 'unit', None) or ""
+        if column_name == "Samples":
+            return str(self.samples[row])
+        
+        if np.isnan(self.timestamps[row]):
+            return ""
+        if column_name == "Timestamp":
+            return f"{self.timestamps[row]:.3f}"
+        value = self.values[row]
+        text = f"{value:g}"
+        choices = getattr(signal, 'choices', None)
+        if choices:
+            label = choices.get(int(value)) if np.isfinite(value) and value == int(value) else None
+            if label is not None:
+                text = f"{text} ({label})"
+        return text
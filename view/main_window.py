@@ -1,10 +1,12 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QPushButton, QLabel, QStatusBar,
-                            QMessageBox, QSpacerItem, QSizePolicy)
-from PyQt5.QtCore import Qt
+                            QMessageBox, QSpacerItem, QSizePolicy,
+                            QProgressBar, QDockWidget, QCheckBox)
+from PyQt5.QtCore import Qt, QTimer
+from model import profiling
 from controller.DBC_IO_Controller import DBC_IO_Controller
 from view.dbc_listview import DBCListView
-from view.dbc_display_view import DBCDisplayView
+from view.search_panel import SearchPanel
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -18,6 +20,18 @@ class MainWindow(QMainWindow):
         # Initialize display views dictionary (file_path -> display_view)
         self.display_views = {}
         
+        # Live monitor windows (file_path -> LiveMonitorView)
+        self.monitor_views = {}
+        
+        # Bus analytics windows (file_path -> BusAnalyticsView)
+        self.analytics_views = {}
+        
+        # Dock with the timing summary, created on first use
+        self.timing_dock = None
+        
+        # DBC comparison window, created on first use
+        self.compare_view = None
+        
         # Create central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -34,41 +48,185 @@ class MainWindow(QMainWindow):
         self.import_button.clicked.connect(self.import_dbc)
         h_layout.addWidget(self.import_button)
         
+        # Live monitor of the DBC selected in the list
+        self.monitor_button = QPushButton("Live Monitor")
+        self.monitor_button.setFixedWidth(120)
+        self.monitor_button.setEnabled(False)
+        self.monitor_button.clicked.connect(self.open_live_monitor)
+        h_layout.addWidget(self.monitor_button)
+        
+        # Bus load and bit layout analytics of the DBC selected in the list
+        self.analytics_button = QPushButton("Bus Analytics")
+        self.analytics_button.setFixedWidth(120)
+        self.analytics_button.setEnabled(False)
+        self.analytics_button.clicked.connect(self.open_bus_analytics)
+        h_layout.addWidget(self.analytics_button)
+        
+        # Comparison of two loaded DBC files
+        self.compare_button = QPushButton("Compare DBCs")
+        self.compare_button.setFixedWidth(120)
+        self.compare_button.clicked.connect(self.open_compare_view)
+        h_layout.addWidget(self.compare_button)
+        
         # Add horizontal stretch to push everything to the left
         h_layout.addStretch()
         
+        # Reloading of loaded files when they change on disk
+        self.auto_reload_check = QCheckBox("Auto Reload")
+        self.auto_reload_check.setToolTip("Reload DBC files when they change on disk")
+        self.auto_reload_check.setChecked(self.dbc_controller.is_auto_reload_enabled())
+        self.auto_reload_check.toggled.connect(self.dbc_controller.set_auto_reload)
+        h_layout.addWidget(self.auto_reload_check)
+        
+        # Live summary of the timing spans
+        self.timings_button = QPushButton("Timings")
+        self.timings_button.setFixedWidth(120)
+        self.timings_button.clicked.connect(self.toggle_timing_panel)
+        h_layout.addWidget(self.timings_button)
+        
         # Add the horizontal layout to the main layout
         main_layout.addLayout(h_layout)
         
+        # DBC list on the left, search across all of them on the right
+        content_layout = QHBoxLayout()
+        content_layout.setContentsMargins(0, 0, 0, 0)
+        
         # Create and add the DBC list view
         self.dbc_list = DBCListView()
         self.dbc_list.setFixedWidth(200)  # Set a fixed width for the list
-        main_layout.addWidget(self.dbc_list)
+        content_layout.addWidget(self.dbc_list)
         
-        # Add vertical stretch to push everything to the top
-        main_layout.addStretch()
+        self.search_panel = SearchPanel(self.dbc_controller)
+        self.search_panel.hit_activated.connect(self.on_search_hit_activated)
+        content_layout.addWidget(self.search_panel, 1)
+        
+        main_layout.addLayout(content_layout, 1)
         
         # Create status bar
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
         
+        # Progress of background DBC loads (file_path -> percent)
+        self.load_progress = {}
+        self.load_progress_bar = QProgressBar()
+        self.load_progress_bar.setFixedWidth(200)
+        self.load_progress_bar.setRange(0, 100)
+        self.load_progress_bar.hide()
+        self.statusBar.addPermanentWidget(self.load_progress_bar)
+        
+        self.cancel_load_button = QPushButton("Cancel")
+        self.cancel_load_button.clicked.connect(self.dbc_controller.cancel_all_loads)
+        self.cancel_load_button.hide()
+        self.statusBar.addPermanentWidget(self.cancel_load_button)
+        
+        # Hit/miss statistics of the parsed-DBC cache
+        self.cache_stats_label = QLabel()
+        self.statusBar.addPermanentWidget(self.cache_stats_label)
+        # Opening the cache touches the disk, so wait until the window is up
+        QTimer.singleShot(0, self.update_cache_stats)
+        
+        # Started with --profile: show what is being recorded
+        if profiling.is_enabled():
+            QTimer.singleShot(0, self.toggle_timing_panel)
+        
         # Connect to controller signals
         self.dbc_controller.dbc_loaded.connect(self.on_dbc_loaded)
         self.dbc_controller.dbc_error.connect(self.on_dbc_error)
         self.dbc_controller.dbc_removed.connect(self.on_dbc_removed)
+        self.dbc_controller.dbc_load_started.connect(self.on_dbc_load_started)
+        self.dbc_controller.dbc_load_progress.connect(self.on_dbc_load_progress)
+        self.dbc_controller.dbc_load_cancelled.connect(self.on_dbc_load_cancelled)
+        self.dbc_controller.dbc_load_finished.connect(self.on_dbc_load_finished)
+        self.dbc_controller.dbc_reloaded.connect(self.on_dbc_reloaded)
+        self.dbc_controller.dbc_reload_failed.connect(self.on_dbc_reload_failed)
         
         # Connect to list view signals
         self.dbc_list.dbc_selected.connect(self.on_dbc_selected)
-        self.dbc_list.dbc_removed.connect(self.on_dbc_removed)
+        # Removal goes through the controller, whose dbc_removed signal then
+        # cleans up the views, so the model and search index drop the file too
+        self.dbc_list.dbc_removed.connect(self.dbc_controller.remove_dbc)
         
     def import_dbc(self):
         """Handle DBC file import"""
         self.dbc_controller.import_dbc(self)
+    
+    def on_dbc_load_started(self, file_path):
+        """Handle the start of a background DBC load"""
+        self.load_progress[file_path] = 0
+        self.statusBar.showMessage(f"Loading DBC file: {file_path}")
+        self.update_load_progress()
+    
+    def on_dbc_load_progress(self, file_path, percent, stage):
+        """Handle progress reports from a background DBC load"""
+        if file_path not in self.load_progress:
+            return
+        self.load_progress[file_path] = percent
+        self.statusBar.showMessage(f"{stage} {file_path.split('/')[-1]}...")
+        self.update_load_progress()
+    
+    def on_dbc_load_cancelled(self, file_path):
+        """Handle a cancelled background DBC load"""
+        self.statusBar.showMessage(f"Cancelled loading DBC file: {file_path}")
+    
+    def on_dbc_load_finished(self, file_path):
+        """Stop tracking the progress of a load that has ended"""
+        self.load_progress.pop(file_path, None)
+        self.update_load_progress()
+        self.update_cache_stats()
+    
+    def update_cache_stats(self):
+        """Show the parsed-DBC cache hit/miss counts in the status bar"""
+        stats = self.dbc_controller.get_cache_stats()
+        if stats is None:
+            self.cache_stats_label.hide()
+            return
+        size_mb = stats['size'] / (1024 * 1024)
+        self.cache_stats_label.setText(
+            f"Cache: {stats['hits']} hits, {stats['misses']} misses ({size_mb:.1f} MB)"
+        )
+        self.cache_stats_label.show()
+    
+    def update_load_progress(self):
+        """Show the combined progress of all running loads in the status bar"""
+        if not self.load_progress:
+            self.load_progress_bar.hide()
+            self.cancel_load_button.hide()
+            return
+        
+        percent = sum(self.load_progress.values()) // len(self.load_progress)
+        self.load_progress_bar.setValue(percent)
+        if len(self.load_progress) > 1:
+            self.load_progress_bar.setFormat(f"Loading {len(self.load_progress)} files: %p%")
+        else:
+            self.load_progress_bar.setFormat("Loading: %p%")
+        self.load_progress_bar.show()
+        self.cancel_load_button.show()
         
     def on_dbc_loaded(self, file_path, db):
         """Handle successful DBC file load"""
         self.statusBar.showMessage(f"Loaded DBC file: {file_path}")
         self.dbc_list.add_dbc_file(file_path)
+        if self.compare_view is not None:
+            self.compare_view.update_file_lists()
+        self.search_panel.refresh()
+    
+    def on_dbc_reloaded(self, file_path, reload):
+        """Bring the open windows of a file changed on disk up to date"""
+        summary = reload.diff.summary() + ("; nodes changed" if reload.nodes_changed else "")
+        self.statusBar.showMessage(f"Reloaded {file_path.split('/')[-1]}: {summary}")
+        display_view = self.display_views.get(file_path)
+        if display_view is not None:
+            display_view.apply_reload(reload)
+        if file_path in self.analytics_views:
+            self.analytics_views[file_path].update_analytics()
+        if self.compare_view is not None:
+            self.compare_view.on_dbc_reloaded(file_path)
+        self.search_panel.refresh()
+    
+    def on_dbc_reload_failed(self, file_path, error_message):
+        """Report a changed file that could not be parsed; its loaded version stays"""
+        # No popup: a file being regenerated may fail to parse for a moment
+        self.statusBar.showMessage(f"Could not reload {file_path}: {error_message}")
         
     def on_dbc_error(self, error_message):
         """Handle DBC file load error"""
@@ -85,6 +243,8 @@ class MainWindow(QMainWindow):
     def on_dbc_selected(self, instance_id):
         """Handle DBC file selection from the list"""
         self.statusBar.showMessage(f"Selected DBC file: {instance_id}")
+        self.monitor_button.setEnabled(True)
+        self.analytics_button.setEnabled(True)
         
         # Check if a display view already exists for this DBC file
         if instance_id in self.display_views and self.display_views[instance_id].isVisible():
@@ -92,6 +252,9 @@ class MainWindow(QMainWindow):
             self.display_views[instance_id].activateWindow()
             self.display_views[instance_id].raise_()
         else:
+            # Imported on first use to keep it out of application startup
+            from view.dbc_display_view import DBCDisplayView
+            
             # Create a new display view for this DBC file
             display_view = DBCDisplayView(self)
             display_view.setWindowTitle(f"DBC Viewer - {instance_id.split('/')[-1]}")
@@ -109,6 +272,95 @@ class MainWindow(QMainWindow):
             display_view.show()
             display_view.display_dbc_content(instance_id)
     
+    def on_search_hit_activated(self, hit):
+        """Open the file of a search hit and show its message or signal"""
+        if self.dbc_controller.get_dbc(hit.file_path) is None:
+            return
+        self.on_dbc_selected(hit.file_path)
+        display_view = self.display_views.get(hit.file_path)
+        if display_view is None:
+            return
+        if hit.signal is None:
+            display_view.show_message_by_name(hit.message)
+        else:
+            display_view.show_signal_by_name(hit.message, hit.signal)
+    
+    def open_live_monitor(self):
+        """Open (or raise) the live CAN monitor of the selected DBC file"""
+        file_path = self.dbc_list.get_selected_dbc()
+        if file_path is None:
+            return
+        if file_path in self.monitor_views:
+            self.monitor_views[file_path].activateWindow()
+            self.monitor_views[file_path].raise_()
+            return
+        db = self.dbc_controller.get_dbc(file_path)
+        if db is None:
+            return
+        
+        # Imported on first use to keep it out of application startup
+        from view.live_monitor_view import LiveMonitorView
+        monitor_view = LiveMonitorView(db, file_path,
+                                       self.dbc_controller.get_dbc_index(file_path), self)
+        monitor_view.window_closed.connect(self.on_monitor_view_closed)
+        self.monitor_views[file_path] = monitor_view
+        monitor_view.show()
+    
+    def open_bus_analytics(self):
+        """Open (or raise) the bus analytics of the selected DBC file"""
+        file_path = self.dbc_list.get_selected_dbc()
+        if file_path is None:
+            return
+        if file_path in self.analytics_views:
+            self.analytics_views[file_path].activateWindow()
+            self.analytics_views[file_path].raise_()
+            return
+        if self.dbc_controller.get_dbc(file_path) is None:
+            return
+        
+        # Imported on first use to keep it out of application startup
+        from view.bus_analytics_view import BusAnalyticsView
+        analytics_view = BusAnalyticsView(self.dbc_controller, file_path, self)
+        analytics_view.window_closed.connect(self.on_analytics_view_closed)
+        self.analytics_views[file_path] = analytics_view
+        analytics_view.show()
+    
+    def toggle_timing_panel(self):
+        """Show or hide the dock with the live timing summary"""
+        if self.timing_dock is None:
+            # Imported on first use to keep it out of application startup
+            from view.timing_panel import TimingPanel
+            self.timing_dock = QDockWidget("Timings", self)
+            self.timing_dock.setWidget(TimingPanel(self.timing_dock))
+            self.addDockWidget(Qt.BottomDockWidgetArea, self.timing_dock)
+            self.timing_dock.show()
+            return
+        self.timing_dock.setVisible(not self.timing_dock.isVisible())
+    
+    def open_compare_view(self):
+        """Open (or raise) the DBC comparison window, comparing from the selected DBC"""
+        if self.compare_view is None:
+            # Imported on first use to keep it out of application startup
+            from view.dbc_compare_view import DBCCompareView
+            self.compare_view = DBCCompareView(self.dbc_controller, self)
+            self.compare_view.window_closed.connect(self.on_compare_view_closed)
+        self.compare_view.update_file_lists(self.dbc_list.get_selected_dbc())
+        self.compare_view.show()
+        self.compare_view.activateWindow()
+        self.compare_view.raise_()
+    
+    def on_compare_view_closed(self):
+        """Forget the closed comparison window"""
+        self.compare_view = None
+    
+    def on_analytics_view_closed(self, file_path):
+        """Forget a closed bus analytics window"""
+        self.analytics_views.pop(file_path, None)
+    
+    def on_monitor_view_closed(self, file_path):
+        """Forget a closed live monitor window"""
+        self.monitor_views.pop(file_path, None)
+    
     def on_display_view_closed(self, file_path):
         """Handle when a display view is closed"""
         if file_path in self.display_views:
@@ -119,13 +371,25 @@ class MainWindow(QMainWindow):
         self.statusBar.showMessage(f"Removed DBC file: {file_path}")
         
         # Close any open display view for this file
-        if file_path in self.display_views and self.display_views[file_path].isVisible():
-            self.display_views[file_path].close()
-            del self.display_views[file_path]
+        # (closing it emits window_closed, which may already forget it)
+        display_view = self.display_views.pop(file_path, None)
+        if display_view is not None and display_view.isVisible():
+            display_view.close()
             
+        # Stop and close its live monitor and analytics
+        if file_path in self.monitor_views:
+            self.monitor_views[file_path].close()
+        if file_path in self.analytics_views:
+            self.analytics_views[file_path].close()
+        
         # Remove from list view
         for i in range(self.dbc_list.list_widget.count()):
             item = self.dbc_list.list_widget.item(i)
             if item.data(Qt.UserRole) == file_path:
                 self.dbc_list.list_widget.takeItem(i)
-                break 
\ No newline at end of file
+                break
+        self.monitor_button.setEnabled(self.dbc_list.get_selected_dbc() is not None)
+        self.analytics_button.setEnabled(self.dbc_list.get_selected_dbc() is not None)
+        if self.compare_view is not None:
+            self.compare_view.on_dbc_removed(file_path)
+        self.search_panel.refresh()
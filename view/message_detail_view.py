@@ -3,16 +3,19 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QLabel, QTabWidget,
                             QTableWidgetItem, QHeaderView, QPushButton)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QColor
+from model.profiling import timed, set_rows
 
 class MessageDetailView(QDialog):
     """Popup dialog to display detailed message information"""
     
+    @timed("MessageDetailView.__init__")
     def __init__(self, parent=None, message=None, dbc_file_path=None, selected_signal=None):
         super().__init__(parent)
         self.message = message
         self.dbc_file_path = dbc_file_path
         self.selected_signal = selected_signal
         self.setup_ui()
+        set_rows(len(message.signals))
         
     def setup_ui(self):
         """Set up the user interface for the message detail popup"""
@@ -162,6 +165,13 @@ class MessageDetailView(QDialog):
         
         # Make signals table support sorting
         signals_table.setSortingEnabled(True)
+        signals_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.signals_table = signals_table
+        
+        # Plot the selected signals from a CAN trace
+        plot_btn = QPushButton("Plot Selected Signals")
+        plot_btn.clicked.connect(self.plot_selected_signals)
+        signals_layout.addWidget(plot_btn)
         
         # If a signal is selected, switch to the signals tab and scroll to it
         if highlight_row >= 0:
@@ -172,4 +182,20 @@ class MessageDetailView(QDialog):
         # Add close button
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(self.accept)
-        main_layout.addWidget(close_btn) 
\ No newline at end of file
+        main_layout.addWidget(close_btn)
+    
+    def plot_selected_signals(self):
+        """Open a plot of the selected signals (all of them if none is selected)"""
+        rows = sorted({index.row() for index in self.signals_table.selectedIndexes()})
+        # The table may be sorted, so find the signals by the name column
+        names = [self.signals_table.item(row, 0).text() for row in rows]
+        signals = [signal for signal in self.message.signals if signal.name in names]
+        if not signals:
+            signals = list(self.message.signals)
+        if not signals:
+            return
+        
+        # Imported on first use; matplotlib is slow to import
+        from view.signal_plot_view import SignalPlotView
+        plot_view = SignalPlotView([(self.message, signal) for signal in signals], self)
+        plot_view.show() 
\ No newline at end of file
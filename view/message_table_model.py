@@ -0,0 +1,261 @@
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex
+from PyQt5.QtGui import QColor, QFont
+import numpy as np
+from model.dbc_columns import MESSAGE_COLUMNS, get_message_display_value
+from model.table_sort import MessageSortKeys, sorted_rows
+
+# Custom item data roles
+MESSAGE_ROLE = Qt.UserRole + 1   # The cantools Message of the row
+SIGNAL_ROLE = Qt.UserRole + 2    # The cantools Signal of a signal row, None on message rows
+
+# Internal ID of message rows; signal rows carry their message's position + 1
+MESSAGE_ROW_ID = 0
+
+def get_sort_header_text(title, section, sort_columns):
+    """
+    Get a column's header text, numbered with its place in the sort when
+    the table is sorted by several columns
+    """
+    if len(sort_columns) > 1:
+        for place, (column, order) in enumerate(sort_columns, 1):
+            if column == section:
+                return f"{title} ({place}{'▲' if order == Qt.AscendingOrder else '▼'})"
+    return title
+
+def get_descending_flags(sort_columns):
+    """Get the descending flag of each (column, order) pair"""
+    return [order == Qt.DescendingOrder for _, order in sort_columns]
+
+class MessageTreeModel(QAbstractItemModel):
+    """
+    Tree model of messages with their signals as children, read straight
+    from cantools Message objects
+    
+    Expanding a message is left to the view: its signal rows always exist
+    as children, so expanding or collapsing costs the model nothing and
+    moves no other row. Filtering and sorting never touch the message
+    list either: the model keeps a sort order and a filter mask over
+    message positions (indexes into the list) and shows the messages that
+    pass the mask, in sort order. Signal rows are identified by their
+    message's position, which never changes, rather than by its current row.
+    Sorting is stable over any number of columns, by typed keys computed
+    once per database (see MessageSortKeys).
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.messages = []
+        self.signal_counts = np.zeros(0, dtype=np.int32)  # Signals of each message position
+        self.order = np.zeros(0, dtype=np.int64)  # All message positions, in sort order
+        self.accepted = None  # Boolean mask over message positions, None accepts all
+        self.rows = self.order  # Message positions shown, in display order
+        self.display_rows = np.zeros(0, dtype=np.int64)  # Row of each message position, -1 if hidden
+        self.sort_keys = MessageSortKeys([])
+        self.sort_columns = []  # (column, order) pairs, most significant first
+    
+    def set_messages(self, messages, sort_keys=None):
+        """
+        Replace the messages shown by the model, unsorted and unfiltered
+        sort_keys is the MessageSortKeys of the messages, if it is shared
+        """
+        self.beginResetModel()
+        self.messages = list(messages)
+        self.signal_counts = np.fromiter((len(msg.signals) for msg in self.messages),
+                                         dtype=np.int32, count=len(self.messages))
+        self.order = np.arange(len(self.messages))
+        self.accepted = None
+        self.sort_keys = sort_keys if sort_keys is not None else MessageSortKeys(self.messages)
+        self.sort_columns = []
+        self.update_rows()
+        self.endResetModel()
+    
+    def message_count(self):
+        """Number of messages, whatever the filter"""
+        return len(self.messages)
+        
+    def sorted_positions(self, sort_columns):
+        """Get all message positions sorted by (column, order) pairs (none: list order)"""
+        keys = [self.sort_keys.sort_keys(column) for column, _ in sort_columns]
+        return sorted_rows(len(self.messages), keys, get_descending_flags(sort_columns))
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort the messages by a column (-1 restores list order)"""
+        self.sort_by([(column, order)] if column >= 0 else [])
+    
+    def sort_by(self, sort_columns):
+        """
+        Sort the messages by (column, order) pairs, most significant first;
+        messages equal in every column stay in list order and signals keep
+        their order under their message
+        """
+        def update():
+            self.sort_columns = list(sort_columns)
+            self.order = self.sorted_positions(self.sort_columns)
+            self.update_rows()
+        self.change_layout(update)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(MESSAGE_COLUMNS) - 1)
+    
+    def set_accepted_messages(self, positions):
+        """Show only the messages at the given positions of the list (None shows all)"""
+        def update():
+            self.accepted = self.position_mask(positions)
+            self.update_rows()
+        self.change_layout(update)
+    
+    def position_mask(self, positions):
+        """Get a boolean mask over message positions (None for None)"""
+        if positions is None:
+            return None
+        mask = np.zeros(len(self.messages), dtype=bool)
+        mask[positions] = True
+        return mask
+    
+    def update_rows(self):
+        """Recompute the shown rows from the sort order and the filter mask"""
+        if self.accepted is None:
+            self.rows = self.order
+        else:
+            self.rows = self.order[self.accepted[self.order]]
+        self.display_rows = np.full(len(self.messages), -1, dtype=np.int64)
+        self.display_rows[self.rows] = np.arange(len(self.rows))
+    
+    def change_layout(self, update, position_map=None):
+        """
+        Run update(), which changes the shown rows, as one layout change
+        
+        Persistent indexes, which hold the view's expanded messages,
+        selection and current row, are moved to their message's new row,
+        or dropped if it is no longer shown. position_map maps old message
+        positions to new ones (-1 for gone) when update() replaces the
+        messages.
+        """
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self.rows
+        old_indexes = self.persistentIndexList()
+        update()
+        new_indexes = []
+        for index in old_indexes:
+            message_id = index.internalId()
+            if message_id == MESSAGE_ROW_ID:
+                position = int(old_rows[index.row()])
+            else:
+                position = message_id - 1
+            if position_map is not None:
+                position = int(position_map[position])
+            if position < 0 or self.display_rows[position] < 0:
+                new_indexes.append(QModelIndex())
+            elif message_id == MESSAGE_ROW_ID:
+                new_indexes.append(self.createIndex(int(self.display_rows[position]),
+                                                    index.column(), MESSAGE_ROW_ID))
+            elif index.row() < self.signal_counts[position]:
+                new_indexes.append(self.createIndex(index.row(), index.column(), position + 1))
+            else:
+                new_indexes.append(QModelIndex())
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+    
+    def apply_reload(self, reload, accepted=None, sort_keys=None):
+        """
+        Switch to the new version of a reloaded database (a DBCReload),
+        showing only the messages at the accepted positions of the new
+        version (None shows all); sort_keys is the new version's
+        MessageSortKeys, if it is shared
+        
+        The sort is kept and the change is one layout change, so the views
+        keep their expanded messages, selection and scroll position.
+        """
+        new_messages = list(reload.new_db.messages)
+        new_positions = {msg: i for i, msg in enumerate(new_messages)}
+        position_map = np.full(len(self.messages), -1, dtype=np.int64)
+        for position, msg in enumerate(self.messages):
+            new_msg = reload.message_map.get(msg)
+            if new_msg is not None:
+                position_map[position] = new_positions[new_msg]
+        
+        def update():
+            self.messages = new_messages
+            self.signal_counts = np.fromiter((len(msg.signals) for msg in new_messages),
+                                             dtype=np.int32, count=len(new_messages))
+            self.sort_keys = sort_keys if sort_keys is not None else MessageSortKeys(new_messages)
+            self.accepted = self.position_mask(accepted)
+            self.order = self.sorted_positions(self.sort_columns)
+            self.update_rows()
+        self.change_layout(update, position_map)
+    
+    # QAbstractItemModel interface
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if not parent.isValid():
+            if 0 <= row < len(self.rows) and 0 <= column < len(MESSAGE_COLUMNS):
+                return self.createIndex(row, column, MESSAGE_ROW_ID)
+            return QModelIndex()
+        if parent.internalId() != MESSAGE_ROW_ID or parent.column() != 0:
+            return QModelIndex()
+        position = int(self.rows[parent.row()])
+        if 0 <= row < self.signal_counts[position] and 0 <= column < len(MESSAGE_COLUMNS):
+            return self.createIndex(row, column, position + 1)
+        return QModelIndex()
+    
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        message_id = index.internalId()
+        if message_id == MESSAGE_ROW_ID:
+            return QModelIndex()
+        return self.createIndex(int(self.display_rows[message_id - 1]), 0, MESSAGE_ROW_ID)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.rows)
+        if parent.internalId() != MESSAGE_ROW_ID or parent.column() != 0:
+            return 0
+        return int(self.signal_counts[self.rows[parent.row()]])
+    
+    def hasChildren(self, parent=QModelIndex()):
+        # Called for every message row when the view lays them out
+        if not parent.isValid():
+            return len(self.rows) > 0
+        return (parent.internalId() == MESSAGE_ROW_ID and parent.column() == 0
+                and bool(self.signal_counts[self.rows[parent.row()]]))
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(MESSAGE_COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return get_sort_header_text(MESSAGE_COLUMNS[section], section, self.sort_columns)
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        message_id = index.internalId()
+        col = index.column()
+        if message_id == MESSAGE_ROW_ID:
+            msg = self.messages[self.rows[index.row()]]
+            if role == Qt.DisplayRole:
+                return get_message_display_value(msg, col)
+            if role == MESSAGE_ROLE:
+                return msg
+            return None
+        
+        msg = self.messages[message_id - 1]
+        signal = msg.signals[index.row()]
+        if role == MESSAGE_ROLE:
+            return msg
+        if role == SIGNAL_ROLE:
+            return signal
+        
+        # Signal rows: name with bit position, blank elsewhere
+        if role == Qt.DisplayRole:
+            if col == 1:
+                return f"↳ {signal.name} ({signal.start}|{signal.length})"
+            return ""
+        if role == Qt.FontRole and col == 1:
+            font = QFont()
+            font.setBold(True)
+            return font
+        if role == Qt.BackgroundRole:
+            return QColor("#f8f8f8")
+        return None
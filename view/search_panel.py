@@ -0,0 +1,93 @@
+import time
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QLineEdit, QTableView,
+                             QHeaderView, QAbstractItemView, QApplication)
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from view.search_results_model import SearchResultsModel
+
+class SearchPanel(QWidget):
+    """Search box and results listing matches in every loaded DBC file"""
+    
+    # Signal emitted when a result is double-clicked
+    hit_activated = pyqtSignal(object)  # Emits the SearchHit
+    
+    # Delay between the last keystroke and searching
+    SEARCH_DEBOUNCE_MS = 150
+    
+    # Most results listed for one query
+    MAX_RESULTS = 1000
+    
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        title = QLabel("Search All Files")
+        title.setStyleSheet("font-weight: bold; padding: 5px;")
+        layout.addWidget(title)
+        
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search names, comments, units and choices...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(lambda: self.search_timer.start())
+        self.search_edit.returnPressed.connect(self.run_search)
+        layout.addWidget(self.search_edit)
+        
+        self.results_model = SearchResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.results_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.results_table.verticalHeader().setVisible(False)
+        self.results_table.verticalHeader().setDefaultSectionSize(22)
+        header = self.results_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.resizeSection(0, 120)  # File
+        header.resizeSection(1, 160)  # Message
+        header.resizeSection(2, 160)  # Signal
+        header.resizeSection(3, 110)  # Field
+        header.setStretchLastSection(True)
+        self.results_table.doubleClicked.connect(self.on_result_double_clicked)
+        layout.addWidget(self.results_table)
+        
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+        
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.run_search)
+    
+    def run_search(self):
+        """Search for the current text and list the hits"""
+        self.search_timer.stop()
+        query = self.search_edit.text()
+        if not query.strip():
+            self.results_model.set_hits([])
+            self.status_label.clear()
+            return
+        
+        # The first search after a file is loaded also indexes it
+        started = time.perf_counter()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            hits = self.controller.search(query, self.MAX_RESULTS)
+        finally:
+            QApplication.restoreOverrideCursor()
+        elapsed = time.perf_counter() - started
+        
+        self.results_model.set_hits(hits)
+        more = "+" if len(hits) >= self.MAX_RESULTS else ""
+        self.status_label.setText(f"{len(hits)}{more} matches in {elapsed * 1000:.1f} ms")
+    
+    def refresh(self):
+        """Search again after files were loaded or removed"""
+        if self.search_edit.text().strip():
+            self.search_timer.start()
+    
+    def on_result_double_clicked(self, index):
+        """Announce the hit of a double-clicked row"""
+        hit = self.results_model.get_hit(index.row())
+        if hit is not None:
+            self.hit_activated.emit(hit)
@@ -0,0 +1,61 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+SEARCH_COLUMNS = ["File", "Message", "Signal", "Field", "Text"]
+
+class SearchResultsModel(QAbstractTableModel):
+    """Table of the SearchHit objects of a global search"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hits = []
+    
+    def set_hits(self, hits):
+        """Show a new list of hits"""
+        self.beginResetModel()
+        self.hits = hits
+        self.endResetModel()
+    
+    def get_hit(self, row):
+        """Get the SearchHit of a row, or None"""
+        if 0 <= row < len(self.hits):
+            return self.hits[row]
+        return None
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.hits)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(SEARCH_COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return SEARCH_COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        hit = self.hits[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return hit.file_path.split('/')[-1]
+            elif column == 1:
+                return hit.message
+            elif column == 2:
+                return hit.signal or ""
+            elif column == 3:
+                return hit.field
+            elif column == 4:
+                # Comments can span several lines
+                return " ".join(hit.text.split())
+        if role == Qt.ToolTipRole:
+            if column == 0:
+                return hit.file_path
+            elif column == 4:
+                return hit.text
+        return None
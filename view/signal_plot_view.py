@@ -0,0 +1,196 @@
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+                             QLabel, QPushButton, QFileDialog, QMessageBox)
+from PyQt5.QtCore import Qt, QThreadPool, QTimer
+from matplotlib.backends.backend_qt5agg import (FigureCanvasQTAgg,
+                                                NavigationToolbar2QT)
+from matplotlib.figure import Figure
+from controller.trace_load_worker import TraceLoadWorker
+from model.log_decoder import LOG_EXTENSIONS
+
+class SignalPlotView(QMainWindow):
+    """
+    Window plotting signals from a decoded CAN trace, one axes per signal
+    
+    Only the visible time window is drawn, at about two points per pixel
+    (see SignalTrace). Zooming or panning schedules a redraw of just that
+    window, so long traces stay responsive.
+    """
+    
+    # Trace opened by the last plot window, offered to the next one
+    last_trace_path = None
+    
+    # Delay between the last zoom/pan step and the redraw
+    REDRAW_DELAY_MS = 30
+    
+    def __init__(self, signals, parent=None, trace_path=None):
+        """signals is a list of (Message, Signal) pairs to plot"""
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.signals = list(dict.fromkeys(signals))
+        names = ", ".join(signal.name for _, signal in self.signals[:3])
+        if len(self.signals) > 3:
+            names += ", ..."
+        self.setWindowTitle(f"Signal Plot - {names}")
+        self.setGeometry(250, 150, 1000, 700)
+        
+        self.store = None
+        self.traces = {}       # Message -> SignalTrace
+        self.lines = []        # (Message, Signal, Axes, Line2D)
+        self.load_worker = None     # Worker loading a trace
+        self.loaded_worker = None   # Worker that loaded the shown trace, owner of its temp files
+        self.thread_pool = QThreadPool.globalInstance()
+        
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        
+        # Trace selection
+        trace_layout = QHBoxLayout()
+        open_button = QPushButton("Open Trace...")
+        open_button.clicked.connect(self.choose_trace)
+        trace_layout.addWidget(open_button)
+        self.trace_label = QLabel("No trace loaded")
+        trace_layout.addWidget(self.trace_label)
+        trace_layout.addStretch()
+        main_layout.addLayout(trace_layout)
+        
+        # One axes per signal, sharing the time axis
+        self.figure = Figure()
+        self.canvas = FigureCanvasQTAgg(self.figure)
+        # Laid out on resize only; a tight layout on every draw doubles the redraw time
+        self.canvas.mpl_connect('resize_event', self.on_canvas_resized)
+        main_layout.addWidget(NavigationToolbar2QT(self.canvas, self))
+        main_layout.addWidget(self.canvas)
+        first_axes = None
+        for row, (message, signal) in enumerate(self.signals):
+            axes = self.figure.add_subplot(len(self.signals), 1, row + 1, sharex=first_axes)
+            first_axes = first_axes or axes
+            unit = getattr(signal, 'unit', None)
+            axes.set_ylabel(f"{signal.name} [{unit}]" if unit else signal.name)
+            axes.set_title(message.name, fontsize='small', loc='left')
+            axes.grid(True, alpha=0.3)
+            line, = axes.plot([], [], linewidth=0.8)
+            self.lines.append((message, signal, axes, line))
+        if first_axes is not None:
+            self.lines[-1][2].set_xlabel("Time [s]")
+            first_axes.callbacks.connect('xlim_changed', lambda axes: self.schedule_redraw())
+        
+        self.redraw_timer = QTimer(self)
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.setInterval(self.REDRAW_DELAY_MS)
+        self.redraw_timer.timeout.connect(self.redraw_visible)
+        
+        trace_path = trace_path or SignalPlotView.last_trace_path
+        if trace_path:
+            QTimer.singleShot(0, lambda: self.load_trace(trace_path))
+    
+    def on_canvas_resized(self, event):
+        """Lay the axes out again and redraw at the new width"""
+        self.figure.tight_layout()
+        self.schedule_redraw()
+    
+    def choose_trace(self):
+        """Ask for a CAN trace and plot the signals from it"""
+        patterns = " ".join(f"*{extension}" for extension in LOG_EXTENSIONS)
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select CAN Trace",
+            "",
+            f"CAN Traces ({patterns} *.frames);;All Files (*.*)"
+        )
+        if file_path:
+            self.load_trace(file_path)
+    
+    def load_trace(self, file_path):
+        """Open a trace in the background; the plot is drawn once it is indexed"""
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+        signals_by_message = {}
+        for message, signal in self.signals:
+            signals_by_message.setdefault(message, []).append(signal.name)
+        
+        worker = TraceLoadWorker(file_path, signals_by_message)
+        worker.signals.progress.connect(self.trace_label.setText)
+        worker.signals.finished.connect(lambda store, traces: self.on_trace_loaded(worker, store, traces))
+        worker.signals.error.connect(lambda message: self.on_trace_error(worker, message))
+        self.load_worker = worker
+        self.trace_label.setText(f"Loading {file_path}...")
+        self.thread_pool.start(worker)
+    
+    def on_trace_loaded(self, worker, store, traces):
+        """Show a trace indexed by the worker"""
+        if worker is not self.load_worker:
+            # Superseded by another trace
+            store.close()
+            worker.remove_temp_directory()
+            return
+        self.close_trace()
+        self.loaded_worker = worker
+        self.store = store
+        self.traces = traces
+        SignalPlotView.last_trace_path = worker.trace_path
+        self.load_worker = None
+        
+        frames = sum(len(trace) for trace in traces.values())
+        self.trace_label.setText(f"{worker.trace_path} ({frames} frames)")
+        ranges = [trace.time_range() for trace in traces.values() if trace.time_range()]
+        if not ranges:
+            QMessageBox.information(self, "Signal Plot", "The trace has no frames of these messages.")
+            return
+        start = min(first for first, _ in ranges)
+        end = max(last for _, last in ranges)
+        if end <= start:
+            end = start + 1.0
+        # Show the whole trace
+        self.lines[0][2].set_xlim(start, end)
+        self.redraw_visible()
+    
+    def on_trace_error(self, worker, message):
+        """Report a trace that could not be opened"""
+        if worker is self.load_worker:
+            self.load_worker = None
+        self.trace_label.setText("No trace loaded")
+        QMessageBox.critical(self, "Signal Plot", f"Failed to open the trace: {message}")
+    
+    def schedule_redraw(self):
+        """Redraw once zooming or panning pauses"""
+        if self.traces:
+            self.redraw_timer.start()
+    
+    def redraw_visible(self):
+        """Fetch and draw the visible window of every signal"""
+        self.redraw_timer.stop()
+        for message, signal, axes, line in self.lines:
+            trace = self.traces.get(message)
+            if trace is None:
+                continue
+            start, end = axes.get_xlim()
+            # Two points per horizontal pixel at most
+            buckets = max(1, int(axes.bbox.width))
+            timestamps, values = trace.window(signal.name, start, end, buckets)
+            line.set_data(timestamps, values)
+            visible = values[(timestamps >= start) & (timestamps <= end)]
+            if len(visible):
+                low, high = float(visible.min()), float(visible.max())
+                margin = (high - low) * 0.05 or max(abs(low) * 0.05, 1.0)
+                axes.set_ylim(low - margin, high + margin)
+        self.canvas.draw_idle()
+    
+    def close_trace(self):
+        """Release the current trace and its converted frame store"""
+        self.traces = {}
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+        if self.loaded_worker is not None:
+            self.loaded_worker.remove_temp_directory()
+            self.loaded_worker = None
+    
+    def closeEvent(self, event):
+        """Stop loading and release the trace"""
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+            self.load_worker = None
+        self.redraw_timer.stop()
+        self.close_trace()
+        super().closeEvent(event)
@@ -0,0 +1,181 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+import numpy as np
+from model.dbc_columns import SIGNAL_COLUMNS
+from model.table_sort import sorted_rows
+from view.message_table_model import (MESSAGE_ROLE, SIGNAL_ROLE, get_sort_header_text,
+                                      get_descending_flags)
+
+class SignalTableModel(QAbstractTableModel):
+    """
+    Table model over a columnar SignalStore
+    
+    Cell text is produced on demand, so only rows that are painted cost
+    anything. Filtering and sorting never touch the store: the model keeps
+    a sort order and a filter mask over store rows and shows the rows
+    that pass the mask, in sort order. Sorting is stable over any number
+    of columns, by the typed keys the store computes once per column.
+    Filtering, sorting and switching to a reloaded store are layout
+    changes, so the view keeps its selection and current row.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = None
+        self.order = np.zeros(0, dtype=np.int64)  # All store rows, in sort order
+        self.accepted = None  # Boolean mask over store rows, None accepts all
+        self.rows = self.order  # Store rows shown, in display order
+        self.sort_columns = []  # (column, order) pairs, most significant first
+    
+    def set_store(self, store):
+        """Replace the signal store shown by the model"""
+        self.beginResetModel()
+        self.store = store
+        self.order = np.arange(len(store) if store is not None else 0)
+        self.accepted = None
+        self.sort_columns = []
+        self.update_rows()
+        self.endResetModel()
+    
+    def replace_store(self, store, rows=None, message_map=None):
+        """
+        Switch to another version of the store, e.g. of a reloaded DBC,
+        keeping the sort and showing only the given store rows (None shows all)
+        
+        The switch is one layout change, so the view keeps its selection,
+        current row and scroll position: signals are matched by message
+        and name, through message_map (old Message -> new Message, as in a
+        DBCReload) if given, else by message name.
+        """
+        old_store = self.store
+        
+        def update():
+            self.store = store
+            self.order = self.sorted_rows(self.sort_columns)
+            self.accepted = self.row_mask(rows)
+            self.update_rows()
+        
+        def row_map(old_rows):
+            return self.matching_rows(old_store, old_rows, message_map)
+        self.change_layout(update, row_map)
+    
+    def matching_rows(self, old_store, old_rows, message_map=None):
+        """Get the rows of the store holding the signals at some rows of old_store (-1 if gone)"""
+        if old_store is None or not old_rows:
+            return [-1] * len(old_rows)
+        positions = {msg: position for position, msg in enumerate(self.store.messages)}
+        if message_map is None:
+            by_name = {msg.name: msg for msg in self.store.messages}
+            message_map = {msg: by_name.get(msg.name) for msg in old_store.messages}
+        rows_by_key = {(int(position), name): row for row, (position, name)
+                       in enumerate(zip(self.store.message_index, self.store.names))}
+        matches = []
+        for old_row in old_rows:
+            position = positions.get(message_map.get(old_store.message(old_row)), -1)
+            matches.append(rows_by_key.get((position, old_store.names[old_row]), -1))
+        return matches
+    
+    def store_row_count(self):
+        """Number of signals in the store, whatever the filter"""
+        return len(self.store) if self.store is not None else 0
+    
+    def set_accepted_rows(self, rows):
+        """Show only the given store rows (None shows all)"""
+        def update():
+            self.accepted = self.row_mask(rows)
+            self.update_rows()
+        self.change_layout(update)
+    
+    def row_mask(self, rows):
+        """Get a boolean mask over store rows (None for None)"""
+        if rows is None:
+            return None
+        mask = np.zeros(self.store_row_count(), dtype=bool)
+        mask[rows] = True
+        return mask
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort all store rows by a column (-1 restores store order)"""
+        self.sort_by([(column, order)] if column >= 0 else [])
+    
+    def sort_by(self, sort_columns):
+        """
+        Sort all store rows by (column, order) pairs, most significant first;
+        rows equal in every column stay in name order
+        """
+        if self.store is None:
+            return
+        def update():
+            self.sort_columns = list(sort_columns)
+            self.order = self.sorted_rows(self.sort_columns)
+            self.update_rows()
+        self.change_layout(update)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(SIGNAL_COLUMNS) - 1)
+    
+    def sorted_rows(self, sort_columns):
+        """Get all store rows sorted by (column, order) pairs (none: store order)"""
+        # Typed keys precomputed by the store; only the row order is sorted
+        keys = [self.store.sort_keys(column) for column, _ in sort_columns]
+        return sorted_rows(len(self.store), keys, get_descending_flags(sort_columns))
+    
+    def update_rows(self):
+        """Recompute the shown rows from the sort order and the filter mask"""
+        if self.accepted is None:
+            self.rows = self.order
+        else:
+            self.rows = self.order[self.accepted[self.order]]
+    
+    def change_layout(self, update, row_map=None):
+        """
+        Run update(), which changes the shown rows, as one layout change
+        
+        Persistent indexes, which hold the view's selection and current
+        row, are moved to their store row's new row, or dropped if it is
+        no longer shown. row_map maps a list of old store rows to new ones
+        (-1 for gone) when update() replaces the store.
+        """
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        store_rows = [int(self.rows[index.row()]) for index in old_indexes]
+        update()
+        if old_indexes:
+            if row_map is not None:
+                store_rows = row_map(store_rows)
+            # New row of each store row still shown
+            shown = np.flatnonzero(np.isin(self.rows, [row for row in store_rows if row >= 0]))
+            display_rows = dict(zip(self.rows[shown].tolist(), shown.tolist()))
+            new_indexes = []
+            for index, store_row in zip(old_indexes, store_rows):
+                row = display_rows.get(store_row)
+                if row is None:
+                    new_indexes.append(QModelIndex())
+                else:
+                    new_indexes.append(self.createIndex(row, index.column()))
+            self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(SIGNAL_COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return get_sort_header_text(SIGNAL_COLUMNS[section], section, self.sort_columns)
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return self.store.text(row, index.column())
+        if role == SIGNAL_ROLE:
+            return self.store.signal(row)
+        if role == MESSAGE_ROLE:
+            return self.store.message(row)
+        return None
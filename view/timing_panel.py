@@ -0,0 +1,84 @@
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QCheckBox, QPushButton,
+                             QLabel, QTableView, QHeaderView)
+from PyQt5.QtCore import QTimer
+from model import profiling
+from view.timing_summary_model import TimingSummaryModel
+
+class TimingPanel(QWidget):
+    """
+    Live summary of the timing spans: calls, durations, rows and peak
+    memory per operation, refreshed while the panel is shown
+    """
+    
+    # Time between refreshes of the summary
+    REFRESH_INTERVAL_MS = 500
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        controls = QHBoxLayout()
+        self.enable_check = QCheckBox("Record timings")
+        self.enable_check.setChecked(profiling.is_enabled())
+        self.enable_check.toggled.connect(self.set_recording)
+        controls.addWidget(self.enable_check)
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self.reset)
+        controls.addWidget(reset_button)
+        self.output_label = QLabel()
+        controls.addWidget(self.output_label, 1)
+        layout.addLayout(controls)
+        
+        self.summary_model = TimingSummaryModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.summary_model)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.resizeSection(0, 280)  # Operation
+        header.setStretchLastSection(True)
+        layout.addWidget(self.table)
+        
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.update_output_label()
+    
+    def set_recording(self, enabled):
+        """Start or stop profiling; spans recorded from the panel are kept in memory only"""
+        if enabled and not profiling.is_enabled():
+            profiling.enable()
+        elif not enabled:
+            profiling.disable()
+        self.update_output_label()
+        self.refresh()
+    
+    def update_output_label(self):
+        """Show where the spans are written"""
+        recorder = profiling.get_recorder()
+        paths = [sink.path for sink in recorder.sinks] if recorder is not None else []
+        self.output_label.setText(f"Writing to {', '.join(paths)}" if paths else "")
+    
+    def reset(self):
+        """Clear the running totals"""
+        recorder = profiling.get_recorder()
+        if recorder is not None:
+            recorder.reset()
+        self.refresh()
+    
+    def refresh(self):
+        """Show the current totals"""
+        recorder = profiling.get_recorder()
+        self.summary_model.set_stats(recorder.get_summary() if recorder is not None else [])
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+    
+    def hideEvent(self, event):
+        # Nothing to refresh while hidden
+        self.refresh_timer.stop()
+        super().hideEvent(event)
@@ -0,0 +1,67 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+TIMING_COLUMNS = ["Operation", "Calls", "Last (ms)", "Mean (ms)", "Max (ms)",
+                  "Total (ms)", "Rows", "Peak Memory (MB)"]
+
+class TimingSummaryModel(QAbstractTableModel):
+    """Table of the running totals (SpanStats) of every timed operation"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stats = []
+    
+    def set_stats(self, stats):
+        """Show new totals; rows are only reset when operations appear or disappear"""
+        names = [item.name for item in stats]
+        if names == [item.name for item in self.stats]:
+            self.stats = stats
+            if stats:
+                self.dataChanged.emit(self.index(0, 1),
+                                      self.index(len(stats) - 1, len(TIMING_COLUMNS) - 1))
+            return
+        self.beginResetModel()
+        self.stats = stats
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.stats)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(TIMING_COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return TIMING_COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        stats = self.stats[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return stats.name
+            elif column == 1:
+                return str(stats.count)
+            elif column == 2:
+                return f"{stats.last * 1000:.1f}"
+            elif column == 3:
+                return f"{stats.mean() * 1000:.1f}"
+            elif column == 4:
+                return f"{stats.maximum * 1000:.1f}"
+            elif column == 5:
+                return f"{stats.total * 1000:.0f}"
+            elif column == 6:
+                return "" if stats.rows is None else str(stats.rows)
+            elif column == 7:
+                if stats.peak_memory is None:
+                    return ""
+                return f"{stats.peak_memory / (1024 * 1024):.0f}"
+        if role == Qt.TextAlignmentRole and column > 0:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None